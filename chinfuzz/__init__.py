@@ -1,21 +1,24 @@
 #!/usr/bin/env python3
 import os
 import sys
-import rich
 import pathlib
 import argparse
 import warnings
-from rich import pretty
 
-import io
-import halo
-import atheris
-import contextlib
+from chinfuzz import thirdparty  # puts the vendored pytezos first on sys.path
+
+description = "Chinfuzz - a code coverage fuzzer framework for Tezos smart contracts"
+
+def printDescription():
+    import rich
+
+    rich.print(":penguin:", f"[bold green]{description}[/bold green]!")
 
 def chinfuzzInitialize(args, env):
     from chinstrap import helpers
     from chinstrap import chinstrapInitialize
 
+    printDescription()
     chinstrapInitialize(args, env)
     targetPath = pathlib.Path(f"{os.getcwd()}")
     os.makedirs(f"{targetPath}/fuzz", exist_ok=True)
@@ -28,19 +31,19 @@ def chinfuzzInitialize(args, env):
         )
 
 def chinfuzzStartFuzzer(args, env):
-    
+    import halo
     from chinfuzz.core import fuzz
     
     _fuzz  = fuzz.ChinFuzz(args)
 
+    printDescription()
     spinner = halo.Halo(text=f"Initializing fuzzer...", spinner="dots")
     spinner.start()
 
-    with io.StringIO() as buff:
-        with contextlib.redirect_stderr(buff):
-            with atheris.instrument_imports():
-                import chinstrap
-                from chinfuzz.thirdparty.pytezos import pytezos
+    # pytezos is not instrumented, the contract's coverage comes from the Michelson interpreter.
+    # Only the interpreter is loaded, not the RPC client (a local run never reaches a node).
+    # The import preloads it under the spinner, before the fork server and the workers fork
+    import pytezos.contract.interface  # noqa: F401
 
     spinner.succeed(text="Fuzzer initialized")
 
@@ -54,6 +57,37 @@ def chinfuzzReplayFuzzer(args, env):
 
     _fuzz.replayFuzzerWithPoC()
 
+def chinfuzzMinimizeCorpus(args, env):
+
+    from chinfuzz.core import fuzz
+    _fuzz  = fuzz.ChinFuzz(args)
+
+    _fuzz.minimizeCorpus()
+
+def chinfuzzProfileCorpus(args, env):
+
+    from chinfuzz.core import fuzz
+    _fuzz  = fuzz.ChinFuzz(args)
+
+    _fuzz.profileCorpus()
+
+def chinfuzzBenchmark(args, env):
+    import json
+    from chinfuzz.core import benchmark
+
+    results = benchmark.runSuite(args.benchmarks, args.runs, args.timeout)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"results: {args.output}")
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print("\n".join(benchmark.compareResults(baseline, results)))
+
 def welcome_banner():
     banner="""
       _     _        __               
@@ -66,16 +100,11 @@ def welcome_banner():
     print(banner)
 
 def main(args, env=os.environ):
-    pretty.install()
+    # the subcommands import what they need: `replay` and the forked
+    # workers never pay for the RPC client, rich or halo
     welcome_banner()
     
-    parser = argparse.ArgumentParser(
-        description=rich.print(
-            ":penguin:",
-            "[bold green]Chinfuzz - a code coverage \
-fuzzer framework for Tezos smart contracts[/bold green]!",
-        )
-    )
+    parser = argparse.ArgumentParser(description=f"{description}.")
     subparsers = parser.add_subparsers()
 
     parser_a = subparsers.add_parser("init", help="Initialize a new Chinfuzz project")
@@ -103,6 +132,66 @@ Be careful, this will potentioally overwrite files that exist in the directory."
         help="corpus folder",
     )
 
+    parser_b.add_argument(
+        "--no-auto-dict",
+        default=False,
+        action="store_true",
+        help="Do not build a libFuzzer dictionary from the literals and entrypoint names of the contracts",
+    )
+
+    parser_b.add_argument(
+        "--no-structured-mutator",
+        default=False,
+        action="store_true",
+        help="Only use libFuzzer's byte level mutations, even when the fuzzer decodes its input with fuzz.ConsumeCall",
+    )
+
+    parser_b.add_argument(
+        "--gas-limit",
+        type=int,
+        help="Gas budget of every contract execution, instructions are charged their Tezos gas cost. \
+Defaults to 100 gas, 10 to 60 ms of interpretation at the 0.1 to 0.6 ms per gas measured on the \
+loops benchmark, with every instruction charged at most 10 gas. A given limit charges the full costs.",
+    )
+
+    parser_b.add_argument(
+        "--out-of-gas-is-crash",
+        default=False,
+        action="store_true",
+        help="Report the inputs running out of gas as crashes instead of dropping them",
+    )
+
+    parser_b.add_argument(
+        "--stop-on-crash",
+        default=False,
+        action="store_true",
+        help="Stop at the first crash like libFuzzer instead of bucketing the crashes and going on",
+    )
+
+    parser_b.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of fuzzing workers to run in parallel. Workers share the corpus folder, \
+their output goes to fuzz-<worker>.log and the aggregated status is printed instead.",
+    )
+
+    parser_b.add_argument(
+        "--fork-server",
+        default=False,
+        action="store_true",
+        help="Fork the warmed up fuzzer for every batch of inputs. \
+Crashes and leaks only take down the current batch, coverage is kept in the corpus folder.",
+    )
+
+    parser_b.add_argument(
+        "--fork-runs",
+        type=int,
+        default=10000,
+        help="Number of inputs run by every forked child in fork server mode",
+    )
+
     parser_b.set_defaults(func=chinfuzzStartFuzzer)
 
     parser_c = subparsers.add_parser("replay", help="Replay a given PoC")
@@ -119,9 +208,124 @@ Be careful, this will potentioally overwrite files that exist in the directory."
         required=True,
         help="Fuzzer to run.",
     )
+
+    parser_c.add_argument(
+        "--gas-limit",
+        type=int,
+        help="Gas budget of every contract execution, use the one given to the fuzzer",
+    )
     parser_c.set_defaults(func=chinfuzzReplayFuzzer)
 
 
+    parser_d = subparsers.add_parser("cmin", help="Minimize a corpus keeping its Michelson coverage")
+    parser_d.add_argument(
+        "-f",
+        "--fuzz",
+        required=True,
+        help="Fuzzer the corpus belongs to",
+    )
+
+    parser_d.add_argument(
+        "-c",
+        "--corpus",
+        required=True,
+        nargs="+",
+        help="Corpus folders to minimize",
+    )
+
+    parser_d.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="Folder receiving the minimized corpus. An interrupted run is resumed when given the same folder.",
+    )
+
+    parser_d.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of processes replaying the corpus, defaults to the number of cores",
+    )
+
+    parser_d.add_argument(
+        "--gas-limit",
+        type=int,
+        help="Gas budget of every contract execution, use the one given to the fuzzer",
+    )
+    parser_d.set_defaults(func=chinfuzzMinimizeCorpus)
+
+
+    parser_e = subparsers.add_parser("profile", help="Profile the contracts per phase and instruction on a corpus")
+    parser_e.add_argument(
+        "-f",
+        "--fuzz",
+        required=True,
+        help="Fuzzer the corpus belongs to",
+    )
+
+    parser_e.add_argument(
+        "-c",
+        "--corpus",
+        required=True,
+        nargs="+",
+        help="Corpus folders to replay",
+    )
+
+    parser_e.add_argument(
+        "-o",
+        "--output",
+        help="Folder receiving the report and the collapsed stacks, defaults to fuzz/profile",
+    )
+
+    parser_e.add_argument(
+        "--no-allocations",
+        default=False,
+        action="store_true",
+        help="Do not trace the allocations, the timings are closer to the fuzzing ones",
+    )
+
+    parser_e.add_argument(
+        "--gas-limit",
+        type=int,
+        help="Gas budget of every contract execution, use the one given to the fuzzer",
+    )
+    parser_e.set_defaults(func=chinfuzzProfileCorpus)
+
+
+    parser_f = subparsers.add_parser("benchmark", help="Measure the execs/s of the fuzzer on the benchmark contracts")
+    parser_f.add_argument(
+        "benchmarks",
+        nargs="*",
+        help="Benchmarks to run (counter, fa12, fa2, dao, loops, dup), all of them by default",
+    )
+
+    parser_f.add_argument(
+        "-n",
+        "--runs",
+        type=int,
+        default=5000,
+        help="Calls timed per benchmark",
+    )
+
+    parser_f.add_argument(
+        "-o",
+        "--output",
+        help="JSON file receiving the results, printed otherwise",
+    )
+
+    parser_f.add_argument(
+        "--baseline",
+        help="Results of a previous run (e.g. the previous commit) to compare with",
+    )
+
+    parser_f.add_argument(
+        "--timeout",
+        type=int,
+        default=600,
+        help="Seconds allowed per benchmark",
+    )
+    parser_f.set_defaults(func=chinfuzzBenchmark)
+
     if not args[1:]:
         parser.print_help()
         exit(1)
@@ -0,0 +1,345 @@
+import os
+import re
+import sys
+import json
+import time
+import fcntl
+import platform
+import resource
+import subprocess
+
+# contracts of the suite, shipped in chinfuzz/resources/benchmark
+contractsFolder = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "benchmark")
+
+owner = "tz1YtuZ4vhzzn7ssCt93Put8U9UJDdvCXci4"
+alice = "tz1LFuHW4Z9zsCwg1cgGTKU12WZAs27ZD14v"
+bob = "tz1aSkwEot3L2kmUvcoxzjMomb9mvBNuzFK6"
+
+# every benchmark runs a fixed set of calls (entrypoint, argument, sender)
+# from the same storage, failing calls included: they take the FAILWITH path
+benchmarks = {
+    "counter": {
+        "storage": 0,
+        "calls": [
+            ("increment", 5, owner),
+            ("decrement", 3, alice),
+            ("increment", 2 ** 70, bob),
+            ("reset", None, owner),
+        ],
+    },
+    "fa12": {
+        "storage": {
+            "ledger": {
+                owner: {"balance": 1000, "approvals": {alice: 100}},
+                alice: {"balance": 50, "approvals": {}},
+            },
+            "admin": owner,
+            "totalSupply": 1050,
+        },
+        "calls": [
+            ("transfer", {"from": owner, "to": alice, "value": 30}, owner),
+            ("transfer", {"from": owner, "to": bob, "value": 60}, alice),
+            ("transfer", {"from": alice, "to": owner, "value": 500}, alice),
+            ("approve", {"spender": bob, "value": 10}, alice),
+            ("mint", {"to": bob, "value": 10}, owner),
+            ("mint", {"to": bob, "value": 10}, bob),
+        ],
+    },
+    "fa2": {
+        "storage": {
+            "ledger": {(owner, 0): 1000, (owner, 1): 20, (alice, 1): 5},
+            "operators": {(owner, alice, 0): None},
+            "admin": owner,
+        },
+        "calls": [
+            ("transfer", [{"from_": owner, "txs": [
+                {"to_": alice, "token_id": 0, "amount": 10},
+                {"to_": bob, "token_id": 1, "amount": 1},
+            ]}], owner),
+            ("transfer", [
+                {"from_": owner, "txs": [{"to_": bob, "token_id": 0, "amount": 7}]},
+                {"from_": alice, "txs": [{"to_": bob, "token_id": 1, "amount": 2}]},
+            ], alice),
+            ("transfer", [{"from_": owner, "txs": [{"to_": bob, "token_id": 0, "amount": 7}]}], bob),
+            ("update_operators", [
+                {"add_operator": {"owner": owner, "operator": bob, "token_id": 0}},
+                {"remove_operator": {"owner": owner, "operator": alice, "token_id": 0}},
+            ], owner),
+            ("mint", {"to_": bob, "token_id": 2, "amount": 100}, owner),
+        ],
+    },
+    "dao": {
+        "storage": {
+            "proposals": {
+                0: {"kind": 0, "yay": 3, "nay": 1},
+                1: {"kind": 1, "yay": 1, "nay": 1},
+                2: {"kind": 2, "yay": 9, "nay": 1},
+            },
+            "nextId": 3,
+            "treasury": 1000,
+        },
+        "calls": [
+            ("propose", 1, alice),
+            ("vote", (0, True), alice),
+            ("vote", (1, False), bob),
+            ("resolve", 0, owner),
+            ("resolve", 1, owner),
+            ("resolve", 2, owner),
+            ("resolve", 7, owner),
+        ],
+    },
+    "loops": {
+        "storage": {"total": 0, "buckets": {}},
+        "calls": [
+            ("sum", 100, owner),
+            ("sum", 0, owner),
+            ("histogram", list(range(-20, 30)), owner),
+            ("histogram", [7, 0, 40, -13], owner),
+        ],
+    },
+    # DUP of a large map and list on every iteration, the values must be
+    # shared and not copied. Rendering the storage after every call
+    # dominates, fewer calls are timed
+    "dup": {
+        "storage": {"entries": {i: i * i for i in range(500)}, "items": list(range(500))},
+        "calls": [
+            ("default", 50, owner),
+            ("default", 10, owner),
+            ("default", 0, owner),
+        ],
+        "runs": 500,
+    },
+}
+
+# rounds of the fixed calls replayed with the phases profiled
+phaseRounds = 20
+resultLineRe = re.compile(r"^benchmark_result=(.+)$", re.M)
+
+def loadCalls(name):
+    """
+        Arguments:
+            name: name of the benchmark
+
+        Loads the contract of the benchmark with its storage and returns\
+ its calls as (ContractCall, sender), their parameters already typed\
+ like the ones decoded by `fuzz.ConsumeCall`.
+    """
+    from pytezos import ContractInterface
+    from pytezos.contract.call import ContractCall
+
+    benchmark = benchmarks[name]
+    contract = ContractInterface.from_file(os.path.join(contractsFolder, f"{name}.tz"))
+    contract.set_baseline_storage(benchmark["storage"])
+    calls = []
+    for entrypoint, argument, sender in benchmark["calls"]:
+        parameters = getattr(contract, entrypoint)(argument).parameters
+        parameter = contract.program.parameter.from_parameters(parameters)
+        calls.append((ContractCall(context=contract.context, parameter_value=parameter, program=contract.program), sender))
+    return calls
+
+def runCall(call, sender):
+    from pytezos.michelson.micheline import MichelsonRuntimeError
+    try:
+        call.interpret(source=sender, sender=sender)
+    except MichelsonRuntimeError:
+        pass
+
+def phaseLatencies(calls):
+    """
+        Returns the mean latency in microseconds of every phase of a call:\
+ the conversions around the interpreter, the run itself and `other`,\
+ the rest of `ContractCall.interpret`.
+    """
+    from pytezos.michelson import profiling
+
+    # phases only, the compiled code runs as during the fuzzing
+    profiler = profiling.enable_profiling(allocations=False, instructions=False)
+    for _ in range(phaseRounds):
+        for call, sender in calls:
+            with profiler.frame("call"):
+                runCall(call, sender)
+    profiling.disable_profiling()
+
+    count = phaseRounds * len(calls)
+    root = profiler.stats.pop("call")
+    latencies = {name: round(stats[1] / count / 1000, 1) for name, stats in profiler.stats.items()}
+    latencies["other"] = round(root[2] / count / 1000, 1)
+    latencies["total"] = round(root[1] / count / 1000, 1)
+    return latencies
+
+def benchmarkChild(name, runs, pipe):
+    """
+        Runs one benchmark in a forked child and prints its results as a\
+ `benchmark_result=` JSON line, like atheris' benchmark harness\
+ (src/benchmark/executions.py) prints its duration.
+    """
+    os.close(pipe[0])
+    os.dup2(pipe[1], 1)
+    os.dup2(pipe[1], 2)
+
+    runs = min(runs, benchmarks[name].get("runs", runs))
+    result = {"runs": runs, "startup_s": {}}
+    started = time.perf_counter()
+    import atheris
+    from chinfuzz.core import fuzz
+    import pytezos.contract.interface  # noqa: F401
+    result["startup_s"]["import"] = time.perf_counter() - started
+
+    loaded = time.perf_counter()
+    calls = loadCalls(name)
+    result["startup_s"]["load"] = time.perf_counter() - loaded
+    result["inputs"] = len(calls)
+
+    fuzz.setInterpreterTrace(False)
+    fuzz.setMichelsonCoverage(True)
+    fuzz.setGasLimit(None)
+    # the first calls compile the code
+    first = time.perf_counter()
+    for call, sender in calls:
+        runCall(call, sender)
+    result["startup_s"]["first_calls"] = time.perf_counter() - first
+    result["startup_s"]["total"] = time.perf_counter() - started
+
+    # the interpreter alone
+    interpreted = time.perf_counter()
+    for index in range(runs):
+        runCall(*calls[index % len(calls)])
+    result["interpret_per_sec"] = runs / (time.perf_counter() - interpreted)
+
+    # the same calls in libFuzzer's loop, with the coverage reported to atheris
+    counter = [0, 0.0]
+
+    def testOneInput(data):
+        index = counter[0]
+        counter[0] += 1
+        if index == 0:
+            counter[1] = time.perf_counter()
+        elif index == runs:
+            result["execs_per_sec"] = runs / (time.perf_counter() - counter[1])
+            result["phase_us"] = phaseLatencies(calls)
+            result["peak_rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            print(f"\nbenchmark_result={json.dumps(result)}", flush=True)
+            os._exit(0)
+        runCall(*calls[index % len(calls)])
+
+    atheris.Setup([sys.argv[0], f"-runs={runs + 1}", "-max_len=64"], testOneInput)
+    atheris.Fuzz()
+    os._exit(1)
+
+def runBenchmark(name, runs, timeout):
+    """
+        Arguments:
+            name: name of the benchmark
+            runs: calls timed in the interpreter and in libFuzzer's loop
+            timeout: seconds before the child is killed
+
+        Forks a child running the benchmark, so that every benchmark pays\
+ its own imports and has its own peak RSS, and returns its results.
+    """
+    pipe = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            benchmarkChild(name, runs, pipe)
+        finally:
+            os._exit(1)
+
+    os.close(pipe[1])
+    flags = fcntl.fcntl(pipe[0], fcntl.F_GETFL)
+    fcntl.fcntl(pipe[0], fcntl.F_SETFL, flags | os.O_NONBLOCK)
+
+    output = b""
+    started = time.time()
+    while True:
+        try:
+            data = os.read(pipe[0], 65536)
+        except BlockingIOError:
+            data = None
+        if data:
+            output += data
+            continue
+        if data == b"" or os.waitpid(pid, os.WNOHANG) != (0, 0):
+            break
+        if time.time() > started + timeout:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+            raise TimeoutError(f"benchmark {name} did not finish within {timeout}s")
+        time.sleep(0.05)
+    os.close(pipe[0])
+    try:
+        os.waitpid(pid, 0)
+    except ChildProcessError:
+        pass
+
+    match = resultLineRe.search(output.decode("utf-8", "replace"))
+    if match is None:
+        raise BaseException(f"benchmark {name} failed:\n{output.decode('utf-8', 'replace')[-2000:]}")
+    return json.loads(match.group(1))
+
+def gitCommit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(contractsFolder),
+            capture_output=True,
+            text=True,
+            timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def runSuite(names=None, runs=5000, timeout=600):
+    """
+        Arguments:
+            names: benchmarks to run, all of them by default
+            runs: calls timed per benchmark, at most the `runs` of the\
+ benchmark when it has some
+            timeout: seconds allowed per benchmark
+
+        Returns the results of the suite: for every contract the execs/s\
+ in libFuzzer's loop and in the interpreter alone, the startup time\
+ (imports, contract loading, first calls), the peak RSS and the mean\
+ latency of every phase of a call, with the commit and the platform\
+ they were measured on.
+    """
+    from chinfuzz.version import version
+
+    results = {
+        "chinfuzz": version,
+        "commit": gitCommit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+        "benchmarks": {},
+    }
+    for name in names or benchmarks:
+        if name not in benchmarks:
+            raise ValueError(f"unknown benchmark {name}, expected one of {', '.join(benchmarks)}")
+        result = runBenchmark(name, runs, timeout)
+        results["benchmarks"][name] = result
+        print(
+            f"{name}\texecs/s: {result['execs_per_sec']:.0f} interpret/s: {result['interpret_per_sec']:.0f}"
+            f" startup: {result['startup_s']['total']:.2f}s rss: {result['peak_rss_kib'] // 1024}Mb"
+        )
+    return results
+
+def compareResults(baseline, results):
+    """
+        Returns the lines comparing the throughput of two runs of the\
+ suite, e.g. the results of the previous commit.
+    """
+    lines = [f"compared with {baseline.get('commit') or 'baseline'}:"]
+    for name, result in results["benchmarks"].items():
+        old = baseline.get("benchmarks", {}).get(name)
+        if old is None:
+            continue
+        cells = []
+        for key in ("execs_per_sec", "interpret_per_sec"):
+            change = 100 * (result[key] / old[key] - 1)
+            cells.append(f"{key}: {old[key]:.0f} -> {result[key]:.0f} ({change:+.1f}%)")
+        startup = result["startup_s"]["total"] - old["startup_s"]["total"]
+        cells.append(f"startup: {startup:+.2f}s")
+        lines.append(f"  {name}\t" + " ".join(cells))
+    return lines
@@ -0,0 +1,218 @@
+import os
+import sys
+import json
+import glob
+import heapq
+import shutil
+import time
+import multiprocessing
+
+# state of an interrupted minimization, removed once the output is complete
+# (libFuzzer would load it as an input otherwise)
+stateFileName = ".cmin-state.jsonl"
+# hit counts are bucketed like libFuzzer's features: 1, 2, 3, 4-7, 8-15,
+# 16-31, 32-127, 128+
+hitBuckets = [(1, 0), (2, 1), (3, 2), (7, 3), (15, 4), (31, 5), (127, 6)]
+
+# set in the parent before the pool forks: the entry point of the fuzzer and
+# the hit counts of the Michelson coverage counters for the current input
+testOneInput = None
+hits = {}
+counters = 0
+
+def reserveCounter():
+    global counters
+    counters += 1
+    return counters - 1
+
+def traceCounter(idx):
+    hits[idx] = hits.get(idx, 0) + 1
+
+def hitBucket(count):
+    for bound, bucket in hitBuckets:
+        if count <= bound:
+            return bucket
+    return 7
+
+def replayInput(path):
+    """
+        Arguments:
+            path: corpus file
+
+        Runs the input in a pool worker and returns its name, size,\
+ execution time and Michelson features (counter and hit count bucket).\
+ Inputs rejected by the contract (FAILWITH or any other Michelson error)\
+ keep the features of the path they took, the features are None only\
+ when the fuzzer itself crashes.
+    """
+    from pytezos.michelson.micheline import MichelsonRuntimeError
+
+    with open(path, "rb") as f:
+        data = f.read()
+    hits.clear()
+    started = time.perf_counter()
+    try:
+        testOneInput(data)
+    except MichelsonRuntimeError:
+        pass
+    except Exception:
+        return path, len(data), time.perf_counter() - started, None
+    elapsed = time.perf_counter() - started
+    features = sorted(idx * 8 + hitBucket(count) for idx, count in hits.items())
+    return path, len(data), elapsed, features
+
+def greedySetCover(entries):
+    """
+        Arguments:
+            entries: list of (name, size, time, features)
+
+        Returns the names of a subset of the entries covering all their\
+ features, picked greedily: the entry with the most new features per\
+ cost comes first. The cost of an entry is its size times its execution\
+ time, the smaller and faster inputs are preferred.
+    """
+    uncovered = set()
+    for _, _, _, features in entries:
+        uncovered.update(features)
+
+    heap = []
+    for index, (name, size, elapsed, features) in enumerate(entries):
+        if features:
+            cost = (size + 16) * (elapsed + 1e-4)
+            heap.append((-len(features) / cost, size, name, index, cost))
+    heapq.heapify(heap)
+
+    selected = []
+    while uncovered and heap:
+        _, size, name, index, cost = heapq.heappop(heap)
+        gain = len(uncovered.intersection(entries[index][3]))
+        if not gain:
+            continue
+        priority = -gain / cost
+        if heap and priority > heap[0][0]:
+            # other entries covered some of its features meanwhile
+            heapq.heappush(heap, (priority, size, name, index, cost))
+            continue
+        selected.append(name)
+        uncovered.difference_update(entries[index][3])
+    return selected
+
+
+class CorpusMinimizer:
+    """
+        Replays the corpus folders in a pool of processes forked from the\
+ warmed up fuzzer, records the Michelson coverage of every input and\
+ copies a minimal subset covering the same features to the output\
+ folder. The inputs crashing the fuzzer are copied to the crash folder\
+ instead. Results are saved as they come in, an interrupted run resumes\
+ where it stopped.
+    """
+    statusInterval = 5
+
+    def __init__(self, corpora, output, crashes, jobs=None) -> None:
+        self.corpora = corpora
+        self.output = output
+        self.crashes = crashes
+        self.jobs = jobs or os.cpu_count() or 1
+        self.statePath = os.path.join(output, stateFileName)
+
+    def corpusFiles(self):
+        paths = {}
+        for corpus in self.corpora:
+            for path in sorted(glob.glob(os.path.join(corpus, "*"))):
+                name = os.path.basename(path)
+                # libFuzzer names inputs by their sha1, a name seen twice is the same input
+                if os.path.isfile(path) and name not in paths:
+                    paths[name] = path
+        return paths
+
+    def loadState(self, fingerprint):
+        """
+            Returns the results saved by an interrupted run, keyed by name.\
+ They are dropped if the contracts changed since.
+        """
+        if not os.path.exists(self.statePath):
+            if os.path.isdir(self.output) and os.listdir(self.output):
+                raise SystemExit(
+                    f"cmin: {self.output} is not empty and holds no interrupted run,"
+                    " remove it or give a new output folder"
+                )
+            return {}
+
+        results = {}
+        with open(self.statePath) as f:
+            header = f.readline()
+            if not header or json.loads(header) != fingerprint:
+                print("cmin: the contracts changed since the interrupted run, starting over")
+                return {}
+            for line in f:
+                try:
+                    name, size, elapsed, features = json.loads(line)
+                except ValueError:
+                    # cut by the interruption
+                    continue
+                results[name] = (name, size, elapsed, features)
+        return results
+
+    def run(self, testOneInputFunction, fingerprint):
+        """
+            Arguments:
+                testOneInputFunction: entry point of the warmed up fuzzer
+                fingerprint: contracts and coverage counters the features\
+ refer to, checked when resuming
+        """
+        global testOneInput
+        testOneInput = testOneInputFunction
+
+        paths = self.corpusFiles()
+        results = self.loadState(fingerprint)
+        results = {name: result for name, result in results.items() if name in paths}
+        pending = [path for name, path in paths.items() if name not in results]
+        if results:
+            print(f"cmin: resuming, {len(results)} of {len(paths)} inputs already replayed")
+
+        os.makedirs(self.output, exist_ok=True)
+        rewrite = not os.path.exists(self.statePath)
+        with open(self.statePath, "w" if rewrite else "a") as state:
+            if rewrite:
+                state.write(json.dumps(fingerprint) + "\n")
+            self.replay(pending, results, state, len(paths))
+
+        entries = [results[name] for name in paths if results[name][3] is not None]
+        crashes = [name for name in paths if results[name][3] is None]
+        selected = greedySetCover(entries)
+        for name in selected:
+            shutil.copyfile(paths[name], os.path.join(self.output, name))
+        # the reproducers stay out of the corpus, libFuzzer would stop on them
+        if crashes:
+            os.makedirs(self.crashes, exist_ok=True)
+        for name in crashes:
+            shutil.copyfile(paths[name], os.path.join(self.crashes, name))
+        os.remove(self.statePath)
+
+        features = len({feature for entry in entries for feature in entry[3]})
+        sizeBefore = sum(entry[1] for entry in entries)
+        sizeAfter = sum(results[name][1] for name in selected)
+        print(
+            f"cmin: kept {len(selected)} of {len(paths)} inputs ({sizeAfter}b of {sizeBefore}b)"
+            f" covering {features} features, {self.output}"
+        )
+        if crashes:
+            print(f"cmin: {len(crashes)} inputs crashing the fuzzer copied to {self.crashes}:")
+            for name in crashes:
+                print(f"  {os.path.join(self.crashes, name)}")
+
+    def replay(self, pending, results, state, total):
+        lastStatus = time.time()
+        context = multiprocessing.get_context("fork")
+        sys.stdout.flush()
+        with context.Pool(self.jobs) as pool:
+            chunksize = max(1, min(64, len(pending) // (self.jobs * 8)))
+            for path, size, elapsed, features in pool.imap_unordered(replayInput, pending, chunksize):
+                name = os.path.basename(path)
+                results[name] = (name, size, elapsed, features)
+                state.write(json.dumps(results[name]) + "\n")
+                if time.time() - lastStatus >= self.statusInterval:
+                    lastStatus = time.time()
+                    state.flush()
+                    print(f"cmin: {len(results)}/{total} inputs replayed")
@@ -0,0 +1,135 @@
+import os
+import re
+import ctypes
+import hashlib
+import traceback
+
+# primitives of the instruction path in the traced Michelson errors
+primRe = re.compile(r"^[A-Z][A-Z0-9_]*$")
+# "crash bucket <id>: new <signature> -> <path>" when a bucket is opened,
+# "crash bucket <id>: <count>x <signature> -> <path>" in the summary at exit
+bucketLineRe = re.compile(r"^crash bucket (\w+): (new|\d+x) (.+) -> (\S+)$")
+# first line of the summary at exit
+summaryLineRe = re.compile(r"^crashes: \d+ buckets / \d+ crashing inputs$")
+
+def crashSignature(error):
+    """
+        Arguments:
+            error: exception raised by the fuzzer
+
+        Returns the signature the crash is bucketed by. A Michelson error\
+ is identified by the entrypoint called, the instruction path it went\
+ through (e.g. IF_LEFT / IF / FAILWITH) and the FAILWITH value or the\
+ error message, a broken invariant by its name and the entrypoint of\
+ the step, any other exception by its type and innermost frame.
+    """
+    from pytezos.michelson.micheline import MichelsonRuntimeError
+    from chinfuzz.core.sequence import InvariantError
+
+    if isinstance(error, InvariantError) and error.invariant is not None:
+        entrypoint = error.step.entrypoint if error.step is not None else "?"
+        return f"{entrypoint}: invariant {error.invariant} broken"
+
+    if isinstance(error, MichelsonRuntimeError):
+        args = [str(arg) for arg in error.args]
+        depth = 0
+        while depth < len(args) - 1 and primRe.match(args[depth]):
+            depth += 1
+        path = " / ".join(args[:depth]) or "?"
+        payload = " -> ".join(args[depth:])
+        return f"{error.entrypoint or '?'}: {path}: {payload}"
+
+    frames = traceback.extract_tb(error.__traceback__)
+    where = f" at {frames[-1].filename}:{frames[-1].lineno}" if frames else ""
+    return f"{type(error).__name__}{where}"
+
+
+class CrashBuckets:
+    """
+        Keeps one reproducer per crash signature (see `crashSignature`)\
+ in the crash folder, `crash-<bucket>`: the first input found, replaced\
+ by any smaller one. The other inputs of the bucket are only counted,\
+ the fuzzer goes on and the buckets are summed up when libFuzzer exits.
+    """
+    def __init__(self, folder) -> None:
+        self.folder = folder
+        self.buckets = {}
+        self.total = 0
+        self.exitHandler = None
+
+    def path(self, bucketId):
+        return os.path.join(self.folder, f"crash-{bucketId}")
+
+    def bucketId(self, signature):
+        return hashlib.sha1(signature.encode()).hexdigest()[:12]
+
+    def addKnown(self, signature):
+        """
+            Arguments:
+                signature: signature of a bucket opened by another process\
+ of the campaign
+
+            Its crashes are counted without announcing a new bucket, the\
+ reproducer is still replaced by a smaller one.
+        """
+        if signature in self.buckets:
+            return
+        bucketId = self.bucketId(signature)
+        path = self.path(bucketId)
+        size = os.path.getsize(path) if os.path.exists(path) else float("inf")
+        self.buckets[signature] = [bucketId, size, 0]
+
+    def add(self, error, data):
+        """
+            Arguments:
+                error: exception raised by the fuzzer
+                data: the crashing input
+
+            Returns True if the crash opened a new bucket.
+        """
+        signature = crashSignature(error)
+        self.total += 1
+        bucket = self.buckets.get(signature)
+        if bucket is not None:
+            bucket[2] += 1
+            if len(data) < bucket[1]:
+                self.save(bucket[0], data)
+                bucket[1] = len(data)
+            if self.exitHandler is None:
+                self.registerExitHandler()
+            return False
+
+        bucketId = self.bucketId(signature)
+        path = self.path(bucketId)
+        # a previous run (or another job) may hold a smaller reproducer already
+        if not os.path.exists(path) or os.path.getsize(path) > len(data):
+            self.save(bucketId, data)
+        self.buckets[signature] = [bucketId, os.path.getsize(path), 1]
+        if self.exitHandler is None:
+            self.registerExitHandler()
+        print(f"crash bucket {bucketId}: new {signature} -> {path}", flush=True)
+        return True
+
+    def save(self, bucketId, data):
+        os.makedirs(self.folder, exist_ok=True)
+        with open(self.path(bucketId), "wb") as f:
+            f.write(data)
+
+    def registerExitHandler(self):
+        """
+            libFuzzer ends the run with the C library's exit, Python's\
+ atexit handlers never run: the summary is printed from a C exit\
+ handler. It is registered from the fuzzing loop, which libFuzzer never\
+ returns from, so the interpreter is still alive when it runs.
+        """
+        self.exitHandler = ctypes.CFUNCTYPE(None, ctypes.c_void_p)(lambda _: self.printSummary())
+        getattr(ctypes.CDLL(None), "__cxa_atexit")(self.exitHandler, None, None)
+
+    def printSummary(self):
+        buckets = [(signature, bucket) for signature, bucket in self.buckets.items() if bucket[2]]
+        if not buckets:
+            return
+        lines = [f"crashes: {len(buckets)} buckets / {self.total} crashing inputs"]
+        for signature, (bucketId, _, count) in buckets:
+            lines.append(f"crash bucket {bucketId}: {count}x {signature} -> {self.path(bucketId)}")
+        print("\n".join(lines), flush=True)
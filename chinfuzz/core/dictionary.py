@@ -0,0 +1,130 @@
+import os
+
+# libFuzzer ignores dictionary entries longer than this
+maxEntrySize = 64
+
+def contractLiterals(contract):
+    """
+        Arguments:
+            contract: pytezos' ContractInterface
+
+        Returns the magic values of the contract: scalars pushed by its\
+ code and views (ints, strings, addresses, bytes, ...) and the names of\
+ its entrypoints.
+    """
+    from pytezos.michelson.instructions.stack import PushInstruction
+
+    literals = []
+    seen = set()
+
+    def walkCode(code):
+        if code in seen:
+            return
+        seen.add(code)
+        if issubclass(code, PushInstruction):
+            try:
+                resType, literal = code.args
+                walkValue(resType.from_literal(literal))
+            except Exception:
+                pass
+            return
+        for arg in getattr(code, "args", []):
+            if isinstance(arg, type):
+                walkCode(arg)
+
+    def walkValue(value):
+        from pytezos.michelson.types import (BytesType, IntType, LambdaType, ListType, MapType, OptionType, OrType,
+                                             PairType, SetType, StringType)
+
+        if isinstance(value, (IntType, StringType, BytesType)):
+            literals.append(value.value)
+        elif isinstance(value, MapType):
+            for key, val in value:
+                walkValue(key)
+                walkValue(val)
+        elif isinstance(value, (PairType, ListType, SetType)):
+            for item in value:
+                walkValue(item)
+        elif isinstance(value, OptionType):
+            if not value.is_none():
+                walkValue(value.get_some())
+        elif isinstance(value, OrType):
+            walkValue(value.resolve())
+        elif isinstance(value, LambdaType):
+            walkCode(value.value)
+
+    walkCode(contract.program.code)
+    for view in contract.program.views:
+        walkCode(view)
+
+    literals.extend(contract.entrypoints)
+    return literals
+
+def encodeLiteral(literal, unicode=False):
+    """
+        Arguments:
+            literal: int, str or bytes value found in a contract
+            unicode: whether the fuzzer reads strings with\
+ ConsumeUnicode/ConsumeString
+
+        Returns the byte strings under which the value reaches the fuzzer\
+ through atheris' FuzzedDataProvider: raw bytes (ConsumeBytes, which\
+ the structured generator reads strings with), little-endian integers\
+ of every width it fits in (ConsumeInt) and, for `unicode`, the string\
+ behind its spec byte.
+    """
+    if isinstance(literal, bytes):
+        return [literal]
+    if isinstance(literal, str):
+        raw = literal.encode("utf-8")
+        if not unicode:
+            return [raw]
+        if literal.isascii():
+            # an odd first byte selects the ASCII branch of ConsumeUnicode
+            return [raw, b"\x01" + raw]
+        return [raw, b"\x02" + literal.encode("utf-16-le")]
+
+    encoded = []
+    for size in (1, 2, 4, 8):
+        if -(1 << (8 * size - 1)) <= literal < (1 << (8 * size - 1)):
+            encoded.append(literal.to_bytes(size, "little", signed=True))
+    return encoded
+
+def formatEntry(name, data):
+    escaped = "".join(
+        chr(byte) if 0x20 <= byte < 0x7f and byte not in (0x22, 0x5c) else f"\\x{byte:02x}"
+        for byte in data
+    )
+    return f'{name}="{escaped}"'
+
+def writeDictionary(path, contracts, userDictionary=None, unicode=False):
+    """
+        Arguments:
+            path: file to write the libFuzzer dictionary to
+            contracts: ContractInterfaces whose literals are extracted
+            userDictionary: dictionary given with `-dict=`, its entries\
+ are copied first
+            unicode: also encode the strings for ConsumeUnicode (see\
+ `encodeLiteral`)
+
+        Returns the number of entries extracted from the contracts.
+    """
+    lines = []
+    if userDictionary:
+        with open(userDictionary) as f:
+            lines.extend(line.rstrip("\n") for line in f)
+
+    entries = []
+    for contract in contracts:
+        for literal in contractLiterals(contract):
+            for data in encodeLiteral(literal, unicode):
+                if data and len(data) <= maxEntrySize and data not in entries:
+                    entries.append(data)
+
+    lines.append("# extracted from the contracts by chinfuzz")
+    lines.extend(formatEntry(f"chinfuzz_{i}", data) for i, data in enumerate(entries))
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    return len(entries)
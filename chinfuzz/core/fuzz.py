@@ -1,10 +1,16 @@
 import os
 import io
+import re
 import sys
+import glob
 import atheris
+import logging
 import pathlib
 import contextlib
-from rich.traceback import install
+from chinfuzz.core import dictionary, generator, sequence
+from chinfuzz.core.crashes import CrashBuckets
+from chinfuzz.core.workers import ForkWorkers
+from chinfuzz.core.mutator import StructuredMutator
 # class DataType(Enum):
 
 #     def __init__(self, fdp) -> None:
@@ -70,9 +76,33 @@ from rich.traceback import install
 #     def __str__(self):
 #         return self.value
 
+# execution budget of the contracts while fuzzing, in gas units. The calls of
+# the benchmark contracts consume 0.1 to 41 gas and interpretation was
+# measured at 0.1 to 0.6 ms per gas on resources/benchmark/loops.tz: a
+# runaway loop is stopped after 10 to 60 ms instead of the libFuzzer timeout
+defaultGasLimit = 100
+# highest cost charged for one instruction under the default budget, in gas
+# units: CHECK_SIGNATURE (65 gas), PAIRING_CHECK (450 gas) or OPEN_CHEST
+# (900 gas) would exhaust it on their own. `--gas-limit` charges the full costs
+defaultInstructionCap = 10
+
 class ChinFuzz:
     def __init__(self, args) -> None:
         self.args = args
+        self.hooks = {}
+        self.outOfGas = 0
+        self.crashes = None
+
+    def setGasBudget(self):
+        """
+            Sets the budget of the contract executions: the one given with\
+ `--gas-limit`, the default one with capped instruction costs otherwise.
+        """
+        limit = getattr(self.args, "gas_limit", None)
+        if limit:
+            setGasLimit(limit)
+        else:
+            setGasLimit(defaultGasLimit, defaultInstructionCap)
 
     def getDataProvider(self, data, **kwargs):
         """
@@ -88,25 +118,262 @@ class ChinFuzz:
     def runOneFuzzer(self, lib_fuzzer_args=[]):
         sys.path.append(f"fuzz")
         name = pathlib.Path(self.args.fuzz).stem
+        # only the fuzzer's own code is instrumented, the contract reports
+        # its coverage from the Michelson interpreter (setMichelsonCoverage)
         with io.StringIO() as buff:
             with contextlib.redirect_stderr(buff):
-                with atheris.instrument_imports():         
+                with atheris.instrument_imports(include=[name]):
                     fuzz = __import__(name)
         
-        self.callChinfuzzFuzzerTestOneInput(fuzz, self.args.fuzz, lib_fuzzer_args)
+        # the contracts are loaded and compiled (and their coverage counters
+        # allocated) before fuzzing starts, fork/parallel children inherit them
+        self.setGasBudget()
+        self.warmUp(fuzz)
+        lib_fuzzer_args = self.addContractDictionary(name, lib_fuzzer_args, fuzz.__file__)
+        self.hooks = self.structuredMutatorHooks()
+        testOneInput = self.crashBucketing(name, self.outOfGasFilter(fuzz.ChinfuzzFuzzerTestOneInput), lib_fuzzer_args)
+
+        if getattr(self.args, "fork_server", False) or getattr(self.args, "jobs", 1) > 1:
+            self.runForkServer(testOneInput, self.args.fuzz, lib_fuzzer_args)
+        else:
+            self.callChinfuzzFuzzerTestOneInput(testOneInput, self.args.fuzz, lib_fuzzer_args)
 
-    def callChinfuzzFuzzerTestOneInput(self, fuzz, fuzzer, lib_fuzzer_args=[]):
+    def callChinfuzzFuzzerTestOneInput(self, testOneInput, fuzzer, lib_fuzzer_args=[]):
         args = [fuzzer] + lib_fuzzer_args
         
         if self.args.corpus:
             args.append(self.args.corpus)
 
-        atheris.Setup(args, fuzz.ChinfuzzFuzzerTestOneInput)
+        atheris.Setup(args, testOneInput, **self.hooks)
         try:
             atheris.Fuzz()
         except Exception as e:
             print(e)
 
+    def warmUp(self, fuzz):
+        """
+            Arguments:
+                fuzz: the imported (instrumented) fuzzer module
+
+            Switches the interpreter to fuzzing mode and runs the fuzzer\
+ once on an empty input so that its contracts are loaded and compiled\
+ (and their coverage counters allocated) before fuzzing starts.
+        """
+        # nobody reads the instruction trace while fuzzing, skip building it
+        setInterpreterTrace(False)
+        setMichelsonCoverage(True)
+        try:
+            fuzz.ChinfuzzFuzzerTestOneInput(b"")
+        except Exception:
+            pass
+
+    def addContractDictionary(self, name, lib_fuzzer_args, source):
+        """
+            Arguments:
+                name: name of the fuzzer
+                lib_fuzzer_args: libFuzzer flags given on the command line
+                source: path of the fuzzer's source
+
+            Writes `fuzz/dict/<fuzzer>.dict` with the magic values of the\
+ contracts loaded by the fuzzer and of every compiled contract of the\
+ project, merged with the dictionary given with `-dict=`, and returns\
+ the flags using it instead.
+        """
+        if getattr(self.args, "no_auto_dict", False):
+            return lib_fuzzer_args
+
+        # the warm up input only reaches some of the contracts, the others may
+        # be loaded later on
+        for path in sorted(glob.glob("./build/contracts/*/step_000_cont_0_contract.tz")):
+            getCompiledContract(path)
+        contracts = [contract for _, contract in compiledContracts.values()]
+        if not contracts:
+            return lib_fuzzer_args
+
+        userDictionary = None
+        args = []
+        for arg in lib_fuzzer_args:
+            if arg.startswith("-dict="):
+                userDictionary = arg.split("=", 1)[1]
+            else:
+                args.append(arg)
+
+        # strings behind their spec byte only help the fuzzers reading them
+        # with ConsumeUnicode, ConsumeCall and ConsumeValue read raw bytes
+        with open(source) as f:
+            unicode = re.search(r"\bConsume(Unicode|String)", f.read()) is not None
+
+        path = os.path.join("fuzz", "dict", f"{name}.dict")
+        count = dictionary.writeDictionary(path, contracts, userDictionary, unicode)
+        print(f"dictionary: {count} entries extracted from the contracts, {path}")
+        return args + [f"-dict={path}"]
+
+    def outOfGasFilter(self, testOneInput):
+        """
+            Arguments:
+                testOneInput: entry point of the fuzzer
+
+            Returns the entry point to fuzz. Executions running out of gas\
+ are dropped like any other input (the gas they consumed is still\
+ reported as coverage) unless `--out-of-gas-is-crash` makes them\
+ findings.
+        """
+        if getattr(self.args, "out_of_gas_is_crash", False):
+            return testOneInput
+
+        from pytezos.michelson.gas import MichelsonOutOfGas
+
+        def run(data):
+            try:
+                testOneInput(data)
+            except MichelsonOutOfGas as e:
+                self.outOfGas += 1
+                if self.outOfGas == 1:
+                    print(f"{e.args[-1]}, such inputs are dropped (--out-of-gas-is-crash reports them)")
+        return run
+
+    def crashBucketing(self, name, testOneInput, lib_fuzzer_args):
+        """
+            Arguments:
+                name: name of the fuzzer
+                testOneInput: entry point of the fuzzer
+                lib_fuzzer_args: libFuzzer flags, `-artifact_prefix=` picks\
+ the crash folder
+
+            Returns the entry point to fuzz. Crashes are bucketed by\
+ signature (FAILWITH value, instruction path and entrypoint) and only\
+ the smallest reproducer of every bucket is kept in\
+ `fuzz/crashes/<fuzzer>/`, the fuzzer goes on and the buckets are\
+ summed up at exit. `--stop-on-crash` leaves the crashes to libFuzzer:\
+ the first one ends the run.
+        """
+        if getattr(self.args, "stop_on_crash", False):
+            return testOneInput
+
+        folder = os.path.join("fuzz", "crashes", name)
+        for arg in lib_fuzzer_args:
+            if arg.startswith("-artifact_prefix="):
+                folder = os.path.dirname(arg.split("=", 1)[1]) or "."
+        self.crashes = CrashBuckets(folder)
+
+        def run(data):
+            try:
+                testOneInput(data)
+            except Exception as e:
+                self.crashes.add(e, data)
+        return run
+
+    def structuredMutatorHooks(self):
+        """
+            Returns the custom mutator and crossover given to libFuzzer\
+ when the fuzzer decodes its whole input with `fuzz.ConsumeCall`: the\
+ inputs are then mutated as the typed arguments of the contract.
+        """
+        decoder = generator.wholeInput
+        if getattr(self.args, "no_structured_mutator", False) or decoder is None:
+            return {}
+
+        print(f"structured mutator: inputs are mutated as {decoder.argType.prim} values")
+        return StructuredMutator(decoder.argType, decoder.pool).hooks()
+
+    def runForkServer(self, testOneInput, fuzzer, lib_fuzzer_args=[]):
+        """
+            Arguments:
+                testOneInput: entry point of the (instrumented) fuzzer
+                fuzzer: path of the fuzzer
+                lib_fuzzer_args: libFuzzer flags handed to every child.\
+ `-runs` and `-max_total_time` apply to the whole campaign, a fixed\
+ `-seed` is shifted for every child.
+
+            The parent is warmed up once (instrumented imports, compiled\
+ contracts) and forks the children that do the fuzzing: one after the\
+ other for every batch of `--fork-runs` inputs in fork server mode,\
+ `--jobs` of them in parallel otherwise. Children start from the\
+ shared corpus folder and save the inputs that found new coverage back\
+ into it, so the coverage carries over between children while a crash\
+ or a leak only takes down its own child.
+        """
+        corpus = self.args.corpus or os.path.join("fuzz", "corpus", pathlib.Path(fuzzer).stem)
+        os.makedirs(corpus, exist_ok=True)
+
+        batchRuns = self.args.fork_runs if getattr(self.args, "fork_server", False) else -1
+        ForkWorkers(
+            testOneInput,
+            fuzzer,
+            corpus,
+            lib_fuzzer_args,
+            jobs=getattr(self.args, "jobs", 1),
+            batchRuns=batchRuns,
+            hooks=self.hooks,
+            crashes=self.crashes,
+        ).run()
+
+    def minimizeCorpus(self):
+        """
+            Replays the corpus folders with the fuzzer in a pool of\
+ processes and copies a minimal subset keeping their Michelson coverage\
+ to the output folder (see `cmin.CorpusMinimizer`).
+        """
+        from chinfuzz.core import cmin
+        from pytezos.michelson import coverage, gas
+        from pytezos.michelson.compiler import compile_block
+
+        sys.path.append(f"fuzz")
+        name = pathlib.Path(self.args.fuzz).stem
+        fuzz = __import__(name)
+
+        setInterpreterTrace(False)
+        self.setGasBudget()
+        coverage.enable_coverage(cmin.reserveCounter, cmin.traceCounter)
+
+        # the counters are allocated in the parent, in the same order on every
+        # run, so that the features of the workers (and of a resumed run) agree
+        paths = sorted(glob.glob("./build/contracts/*/step_000_cont_0_contract.tz"))
+        for path in paths:
+            compile_block(getCompiledContract(path).program.code.args[0], True)
+        gas.report_consumption()
+        try:
+            fuzz.ChinfuzzFuzzerTestOneInput(b"")
+        except Exception:
+            pass
+
+        fingerprint = {
+            "contracts": {path: [os.stat(path).st_mtime_ns, os.stat(path).st_size] for path in paths},
+            "counters": cmin.counters,
+        }
+        crashes = os.path.join("fuzz", "crashes", name)
+        minimizer = cmin.CorpusMinimizer(self.args.corpus, self.args.output, crashes, self.args.jobs)
+        minimizer.run(self.outOfGasFilter(fuzz.ChinfuzzFuzzerTestOneInput), fingerprint)
+
+    def profileCorpus(self):
+        """
+            Replays the corpus folders through the fuzzer with the\
+ Michelson profiler and writes the time and net memory spent per phase,\
+ opcode and instruction, and the collapsed stacks for a flamegraph, to\
+ the output folder (see `profile.CorpusProfiler`).
+        """
+        from chinfuzz.core import profile
+        from pytezos.michelson import profiling
+
+        sys.path.append(f"fuzz")
+        name = pathlib.Path(self.args.fuzz).stem
+        fuzz = __import__(name)
+
+        setInterpreterTrace(False)
+        setMichelsonCoverage(False)
+        self.setGasBudget()
+        profiler = profiling.enable_profiling(allocations=not self.args.no_allocations)
+        try:
+            fuzz.ChinfuzzFuzzerTestOneInput(b"")
+        except Exception:
+            pass
+
+        output = self.args.output or os.path.join("fuzz", "profile")
+        profile.CorpusProfiler(self.args.corpus, output, name).run(
+            self.outOfGasFilter(fuzz.ChinfuzzFuzzerTestOneInput), profiler
+        )
+        profiling.disable_profiling()
+
     def replayFuzzerWithPoC(self):
         sys.path.append(f"fuzz")
         name = pathlib.Path(self.args.fuzz).stem
@@ -114,8 +381,16 @@ class ChinFuzz:
         self.replayChinfuzzFuzzerTestOneInputPoC(fuzz, self.args.poc)
 
     def replayChinfuzzFuzzerTestOneInputPoC(self, fuzz, poc):
+        from rich.traceback import install
         install()
 
+        # print the instruction trace of the failing call before the error
+        setInterpreterTrace(True)
+        self.setGasBudget()
+        logger = logging.getLogger("pytezos")
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(logging.StreamHandler())
+
         try:
             with open(poc, 'rb') as f:
                 fuzz.ChinfuzzFuzzerTestOneInput(f.read())
@@ -123,13 +398,88 @@ class ChinFuzz:
         except Exception as e:
             raise e
         
-def getContractInterface(contractName, ContractInterface):
+# compiled contracts shared by every iteration of the fuzzer process,
+# keyed by absolute path and validated against the file's mtime and size
+compiledContracts = {}
+
+def getCompiledContract(path, ContractInterface=None):
+    """
+        Arguments:
+            path: path to the compiled `.tz` contract
+            ContractInterface: pytezos' ContractInterface class used to\
+ load the contract. Defaults to the vendored pytezos.
+
+        Parsing the contract and building its types happens once per\
+ process; later calls hand back the same ready-to-run interface until\
+ the file changes on disk.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = compiledContracts.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    if ContractInterface is None:
+        from pytezos import ContractInterface
+
+    contract = ContractInterface.from_file(path)
+    compiledContracts[path] = (key, contract)
+    return contract
+
+def setInterpreterTrace(enabled):
+    """
+        Arguments:
+            enabled: whether the Michelson interpreter records the\
+ human-readable trace of every executed instruction.
+    """
+    from pytezos.michelson.repl import Interpreter
+    Interpreter.trace = enabled
+
+def setMichelsonCoverage(enabled):
+    """
+        Arguments:
+            enabled: whether the contracts compiled from now on report\
+ their coverage (branch arms, loop iteration buckets and FAILWITH\
+ sites) to libFuzzer through atheris' counters, and the operands of\
+ every COMPARE to libFuzzer's CMP hooks so that magic values found in\
+ the contract can be guessed.
+    """
+    from pytezos.michelson import coverage
+    if enabled:
+        # atheris swaps these functions when fuzzing starts, look them up on every call.
+        # the counter of the COMPARE site is its fake pc, 2 is Py_EQ
+        coverage.enable_coverage(
+            lambda: atheris._reserve_counter(),
+            lambda idx: atheris._trace_branch(idx),
+            lambda left, right, idx: atheris._trace_cmp(left, right, 2, idx, False),
+        )
+    else:
+        coverage.disable_coverage()
+
+def setGasLimit(limit, instructionCap=None):
+    """
+        Arguments:
+            limit: budget of every contract execution in gas units, None\
+ for the hard gas limit of an operation on mainnet (minutes of Python\
+ interpretation). The cost of the instructions is modeled on Tezos gas\
+ costs, an execution exceeding it raises `MichelsonOutOfGas`.
+            instructionCap: highest cost charged for a single instruction\
+ in gas units, None for the full costs. Set before the contracts run,\
+ their code is charged the costs it was compiled with.
+    """
+    from pytezos.michelson import gas
+    gas.set_gas_limit(limit, instructionCap)
+
+def getContractInterface(contractName, ContractInterface=None):
     # get contract interface.
     if os.path.exists(
         f"./build/contracts/{contractName.lower()}/step_000_cont_0_contract.tz"
     ):
-        return ContractInterface.from_file(
-            f"./build/contracts/{contractName.lower()}/step_000_cont_0_contract.tz"
+        return getCompiledContract(
+            f"./build/contracts/{contractName.lower()}/step_000_cont_0_contract.tz",
+            ContractInterface
         )
 
     # try to build if doesn't exist
@@ -139,6 +489,71 @@ def getContractInterface(contractName, ContractInterface):
 
 def FuzzedDataProvider(data):
     return atheris.FuzzedDataProvider(data)
+
+def ConsumeCall(data, contract, entrypoint=None, addresses=()):
+    """
+        Arguments:
+            data: data generated by fuzzer, or a FuzzedDataProvider to\
+ consume it from
+            contract: pytezos' ContractInterface
+            entrypoint: entrypoint to call. By default the fuzzer's bytes\
+ pick the entrypoint as well.
+            addresses: addresses and keys the arguments pick from (the\
+ actors of the test), in addition to the ones pushed by the contract
+
+        Decodes the fuzzer's bytes into well-typed arguments of the\
+ entrypoint, generated from its parameter type, and returns the\
+ ContractCall, e.g.\
+ `fuzz.ConsumeCall(data, contract, "transfer", [owner, alice]).interpret(source=owner)`
+    """
+    decoder = generator.callDecoder(contract, entrypoint, addresses)
+    if isinstance(data, bytes):
+        # the whole input is the call, the structured mutator can work on it
+        generator.wholeInput = decoder
+        data = FuzzedDataProvider(data)
+    return decoder(data)
+
+def RunSequence(data, contract, addresses=(), invariants=(), storage=None, failOnError=False):
+    """
+        Arguments:
+            data: data generated by fuzzer, or a FuzzedDataProvider to\
+ consume it from
+            contract: pytezos' ContractInterface
+            addresses: addresses the calls are sent from (the actors of\
+ the test), also picked from by the arguments
+            invariants: functions checked after every step, called with\
+ the typed storage and the step, e.g.\
+ `lambda storage, step: storage.item.items[1].value <= 1000`
+            storage: storage to start from, by default the baseline\
+ storage of the contract
+            failOnError: report the Michelson errors of the calls as\
+ crashes instead of reverting the failed calls
+
+        Decodes the fuzzer's bytes into a sequence of calls (entrypoint,\
+ arguments, sender and amount) and runs them one after the other, the\
+ typed storage of each call feeding the next one. Returns the final\
+ typed storage, a broken invariant raises `sequence.InvariantError`.
+    """
+    decoder = sequence.sequenceDecoder(contract, addresses)
+    if isinstance(data, bytes):
+        # the whole input is the sequence, the structured mutator can work on it
+        generator.wholeInput = decoder
+        data = FuzzedDataProvider(data)
+    return sequence.runSequence(contract, decoder(data), storage, invariants, failOnError)
+
+def ConsumeValue(data, ty, addresses=()):
+    """
+        Arguments:
+            data: data generated by fuzzer, or a FuzzedDataProvider to\
+ consume it from
+            ty: Michelson type class, e.g. `contract.entrypoints["transfer"]`
+            addresses: addresses and keys the value picks from
+
+        Decodes the fuzzer's bytes into a well-typed Michelson value of\
+ the type.
+    """
+    fdp = FuzzedDataProvider(data) if isinstance(data, bytes) else data
+    return generator.valueDecoder(ty, addresses)(fdp)
     
 # return fdp.ConsumeUnicode(count)  
 # return fdp.ConsumeUnicodeNoSurrogates(count)
@@ -0,0 +1,353 @@
+from chinfuzz.core import dictionary
+
+# upper bound of the length of generated strings and bytes (the size of
+# the longest dictionary entry) and of the number of collection items
+maxLength = dictionary.maxEntrySize
+maxItems = 8
+# addresses and keys are picked from the pool with a single byte
+maxPoolSize = 255
+# collection types allowed more items than maxItems (call sequences)
+itemBounds = {}
+
+# Michelson strings are ASCII only: printable bytes are kept so that the
+# dictionary entries still match, the others are folded onto printable ones
+printable = bytes(
+    byte & 0x7f if 0x20 <= byte & 0x7f < 0x7f else (byte & 0x1f) | 0x40
+    for byte in range(256)
+)
+
+# (size in bytes, smallest and largest value) of the fixed width integers
+intLayouts = {
+    "int": (8, -(1 << 63), (1 << 63) - 1),
+    "nat": (8, 0, (1 << 64) - 1),
+    "mutez": (8, 0, (1 << 63) - 1),
+    # stay within the years datetime can format
+    "timestamp": (5, 0, 253402300799),
+}
+
+# (base58 prefix, size of the raw value) of the values built from the input
+freshLayouts = {
+    "key_hash": (b"tz1", 20),
+    "key": (b"edpk", 32),
+    "signature": (b"edsig", 64),
+    "chain_id": (b"Net", 4),
+}
+
+# ready decoders and encoders keyed by type (and pool) and by entrypoint
+valueDecoders = {}
+valueEncoders = {}
+callDecoders = {}
+
+# call decoder used by the fuzzer on its whole input, the structure the
+# custom mutator works on
+wholeInput = None
+
+# Every value is read from the front of the input, in the order of the type:
+# one byte for bools, tags, lengths, counts and pool indexes, then fixed
+# width little-endian integers and raw strings and bytes. Any input decodes
+# into a value, and every value has a canonical encoding decoding back to it.
+
+def consumeCount(fdp, bound):
+    return fdp.ConsumeUInt(1) % (bound + 1)
+
+def consumeFixedBytes(fdp, size):
+    return fdp.ConsumeBytes(size).ljust(size, b"\x00")
+
+def clamp(value, low, high):
+    return min(max(value, low), high)
+
+def poolOf(prim, pool):
+    """
+        Arguments:
+            prim: address-like type
+            pool: addresses, keys and contract literals
+
+        Returns the values of the pool the type accepts.
+    """
+    from pytezos.crypto.encoding import is_address, is_pkh, is_public_key
+
+    check = {"address": is_address, "contract": is_address, "key_hash": is_pkh, "key": is_public_key}.get(prim)
+    if check is None:
+        return []
+    return [value for value in pool if isinstance(value, str) and check(value)][:maxPoolSize]
+
+def buildDecoder(ty, pool):
+    from pytezos.crypto.encoding import base58_encode
+    from pytezos.michelson.types.base import Undefined
+
+    prim = ty.prim
+    if prim in intLayouts:
+        size, low, high = intLayouts[prim]
+        if prim == "int":
+            return lambda fdp: ty(fdp.ConsumeInt(size))
+        if high == (1 << 8 * size) - 1:
+            return lambda fdp: ty(fdp.ConsumeUInt(size))
+        if (high + 1) & high == 0:
+            return lambda fdp: ty(fdp.ConsumeUInt(size) & high)
+        return lambda fdp: ty(fdp.ConsumeUInt(size) % (high + 1))
+    if prim == "bool":
+        return lambda fdp: ty(fdp.ConsumeBool())
+    if prim == "unit":
+        return lambda fdp: ty()
+    if prim == "bytes":
+        return lambda fdp: ty(fdp.ConsumeBytes(consumeCount(fdp, maxLength)))
+    if prim == "string":
+        return lambda fdp: ty(fdp.ConsumeBytes(consumeCount(fdp, maxLength)).translate(printable).decode())
+
+    if prim in ("address", "contract") or prim in freshLayouts:
+        if prim in freshLayouts:
+            prefix, size = freshLayouts[prim]
+
+            def fresh(fdp):
+                return base58_encode(consumeFixedBytes(fdp, size), prefix).decode()
+        else:
+            def fresh(fdp):
+                prefix = b"KT1" if fdp.ConsumeBool() else b"tz1"
+                return base58_encode(consumeFixedBytes(fdp, 20), prefix).decode()
+
+        # past the end of the pool the value is built from the input
+        known = poolOf(prim, pool)
+        if not known:
+            return lambda fdp: ty(fresh(fdp))
+        poolSize = len(known)
+
+        def decode(fdp):
+            index = consumeCount(fdp, poolSize)
+            return ty(known[index] if index < poolSize else fresh(fdp))
+        return decode
+
+    if prim == "option":
+        some = valueDecoder(ty.args[0], pool)
+        return lambda fdp: ty(some(fdp) if fdp.ConsumeBool() else None)
+    if prim == "pair":
+        left, right = (valueDecoder(arg, pool) for arg in ty.args)
+        return lambda fdp: ty((left(fdp), right(fdp)))
+    if prim == "or":
+        left, right = orSides(ty, pool, valueDecoder)
+        if right is None:
+            return lambda fdp: ty((left(fdp), Undefined))
+        if left is None:
+            return lambda fdp: ty((Undefined, right(fdp)))
+        return lambda fdp: ty((left(fdp), Undefined)) if fdp.ConsumeBool() else ty((Undefined, right(fdp)))
+    if prim in ("list", "set"):
+        # sets drop the duplicates and sort their items themselves
+        item = valueDecoder(ty.args[0], pool)
+        bound = itemBounds.get(ty, maxItems)
+        return lambda fdp: ty([item(fdp) for _ in range(consumeCount(fdp, bound))])
+    if prim in ("map", "big_map"):
+        key, val = (valueDecoder(arg, pool) for arg in ty.args)
+        bound = itemBounds.get(ty, maxItems)
+        return lambda fdp: ty([(key(fdp), val(fdp)) for _ in range(consumeCount(fdp, bound))])
+
+    raise TypeError(f"cannot generate values of type {prim}")
+
+def orSides(ty, pool, build):
+    """
+        Returns the decoders (or encoders) of both sides of an Or type,\
+ None for a side that cannot be generated (e.g. an entrypoint taking a\
+ lambda), the other side is always taken then.
+    """
+    sides = []
+    for arg in ty.args:
+        try:
+            sides.append(build(arg, pool))
+        except TypeError:
+            sides.append(None)
+    if sides == [None, None]:
+        raise TypeError(f"cannot generate values of type {ty.prim}, none of its sides is supported")
+    return sides
+
+def buildEncoder(ty, pool):
+    from pytezos.crypto.encoding import base58_decode
+
+    prim = ty.prim
+    if prim in intLayouts:
+        size, low, high = intLayouts[prim]
+        signed = low < 0
+
+        def encode(value, out, nodes):
+            out += clamp(value.value, low, high).to_bytes(size, "little", signed=signed)
+        return encode
+    if prim == "bool":
+        def encode(value, out, nodes):
+            out.append(1 if value.value else 0)
+        return encode
+    if prim == "unit":
+        return lambda value, out, nodes: None
+    if prim in ("bytes", "string"):
+        def encode(value, out, nodes):
+            data = value.value if prim == "bytes" else value.value.encode()
+            data = data[:maxLength]
+            out.append(len(data))
+            out += data
+        return encode
+
+    if prim in ("address", "contract") or prim in freshLayouts:
+        prefix, size = freshLayouts.get(prim, (None, 20))
+        known = poolOf(prim, pool)
+        indexes = {value: index for index, value in enumerate(known)}
+
+        def encode(value, out, nodes):
+            index = indexes.get(value.value)
+            if known:
+                out.append(len(known) if index is None else index)
+            if index is None:
+                address = value.value.split("%")[0]
+                if prefix is None:
+                    out.append(1 if address.startswith("KT1") else 0)
+                out += base58_decode(address.encode())[:size].ljust(size, b"\x00")
+        return encode
+
+    if prim == "option":
+        some = valueEncoder(ty.args[0], pool)
+
+        def encode(value, out, nodes):
+            out.append(0 if value.item is None else 1)
+            if value.item is not None:
+                some(value.item, out, nodes)
+        return encode
+    if prim == "pair":
+        left, right = (valueEncoder(arg, pool) for arg in ty.args)
+
+        def encode(value, out, nodes):
+            left(value.items[0], out, nodes)
+            right(value.items[1], out, nodes)
+        return encode
+    if prim == "or":
+        left, right = orSides(ty, pool, valueEncoder)
+
+        def encode(value, out, nodes):
+            if left is not None and right is not None:
+                out.append(1 if value.is_left() else 0)
+            if value.is_left():
+                left(value.items[0], out, nodes)
+            else:
+                right(value.items[1], out, nodes)
+        return encode
+    if prim in ("list", "set"):
+        item = valueEncoder(ty.args[0], pool)
+        bound = itemBounds.get(ty, maxItems)
+
+        def encode(value, out, nodes):
+            items = value.items[:bound]
+            out.append(len(items))
+            for element in items:
+                item(element, out, nodes)
+        return encode
+    if prim in ("map", "big_map"):
+        key, val = (valueEncoder(arg, pool) for arg in ty.args)
+        bound = itemBounds.get(ty, maxItems)
+
+        def encode(value, out, nodes):
+            items = value.items[:bound]
+            out.append(len(items))
+            for k, v in items:
+                key(k, out, nodes)
+                val(v, out, nodes)
+        return encode
+
+    raise TypeError(f"cannot generate values of type {prim}")
+
+def valueDecoder(ty, pool=()):
+    """
+        Arguments:
+            ty: Michelson type class, e.g. `contract.entrypoints["transfer"]`
+            pool: addresses and keys the generated values pick from\
+ (actors of the test, literals of the contract)
+
+        Returns a function turning a FuzzedDataProvider into a value of\
+ the type. The type is walked once: the returned decoder only consumes\
+ the fuzzer's bytes and calls the constructors of the typed values, any\
+ input gives a well-typed value. Raises TypeError for the types that\
+ cannot be generated (lambda, ticket, operation, sapling, ...).
+    """
+    key = (ty, tuple(pool))
+    decoder = valueDecoders.get(key)
+    if decoder is None:
+        decoder = buildDecoder(ty, key[1])
+        valueDecoders[key] = decoder
+    return decoder
+
+def valueEncoder(ty, pool=()):
+    """
+        Arguments:
+            ty: Michelson type class
+            pool: the pool given to the decoder
+
+        Returns the inverse of the decoder: a function appending the\
+ canonical encoding of a value of the type to a bytearray. Every encoded\
+ value (and sub-value) is also appended to `nodes` as\
+ (type, value, start, end), its position in the encoding.
+    """
+    key = (ty, tuple(pool))
+    encoder = valueEncoders.get(key)
+    if encoder is None:
+        encodeValue = buildEncoder(ty, key[1])
+
+        def encoder(value, out, nodes):
+            start = len(out)
+            encodeValue(value, out, nodes)
+            nodes.append((ty, value, start, len(out)))
+        valueEncoders[key] = encoder
+    return encoder
+
+def contractPool(contract, addresses):
+    pool = list(addresses)
+    for literal in dictionary.contractLiterals(contract):
+        if literal not in pool:
+            pool.append(literal)
+    return pool
+
+def callDecoder(contract, entrypoint=None, addresses=()):
+    """
+        Arguments:
+            contract: pytezos' ContractInterface
+            entrypoint: entrypoint to call. By default the whole parameter\
+ is generated, the fuzzer's bytes then pick the entrypoint as well.
+            addresses: addresses and keys to pick from, in addition to\
+ the ones pushed by the contract
+
+        Returns a function turning a FuzzedDataProvider into a\
+ ContractCall of the entrypoint, ready to be interpreted. The type and\
+ the pool of its arguments are kept in its `argType` and `pool`.
+    """
+    from pytezos.contract.call import ContractCall
+    from pytezos.michelson.types.base import Undefined
+
+    key = (contract.program, entrypoint, tuple(addresses))
+    decoder = callDecoders.get(key)
+    if decoder is not None:
+        return decoder
+
+    parameter = contract.program.parameter
+    rootType = parameter.args[0]
+    path = ""
+    if entrypoint is not None and entrypoint != parameter.root_name:
+        path = None
+        if rootType.prim == "or":
+            _, keyToPath, _ = rootType.get_type_layout(infer_names=True, entrypoints=True)
+            path = keyToPath.get(entrypoint) if keyToPath else None
+        if path is None:
+            raise ValueError(f"unknown entrypoint {entrypoint}, expected one of {', '.join(contract.entrypoints)}")
+
+    # the Or nodes leading to the entrypoint, innermost first
+    wrappers = []
+    argType = rootType
+    for side in map(int, path):
+        wrappers.append((argType, side))
+        argType = argType.args[side]
+    wrappers.reverse()
+
+    pool = tuple(contractPool(contract, addresses))
+    decodeArg = valueDecoder(argType, pool)
+
+    def decode(fdp):
+        value = decodeArg(fdp)
+        for orType, side in wrappers:
+            value = orType((value, Undefined) if side == 0 else (Undefined, value))
+        return ContractCall(context=contract.context, parameter_value=parameter(value), program=contract.program)
+
+    decode.argType = argType
+    decode.pool = pool
+    callDecoders[key] = decode
+    return decode
@@ -0,0 +1,138 @@
+import random
+import atheris
+from chinfuzz.core import generator
+
+class StructuredMutator:
+    """
+        libFuzzer custom mutator and crossover for fuzzers decoding their\
+ whole input with `fuzz.ConsumeCall`. The input is decoded into the typed\
+ arguments, one of their values is mutated the Michelson way (items\
+ inserted into or removed from lists, sets and maps, Left/Right flipped,\
+ Some/None toggled, addresses swapped from the pool, integers moved to\
+ their boundaries or to the contract's literals) and the result is\
+ encoded back. Crossover swaps values of the same type between two\
+ inputs. A share of the mutations is still left to libFuzzer's byte\
+ level mutators, which use the CMP hooks and the dictionary.
+    """
+    byteMutationRate = 0.5
+
+    def __init__(self, ty, pool=()) -> None:
+        self.ty = ty
+        self.pool = pool
+        self.decode = generator.valueDecoder(ty, pool)
+        self.encode = generator.valueEncoder(ty, pool)
+        self.ints = [value for value in pool if isinstance(value, int) and not isinstance(value, bool)]
+        self.strings = [value for value in pool if isinstance(value, str) and value.isascii()]
+        self.bytes = [value for value in pool if isinstance(value, bytes)]
+
+    def hooks(self):
+        return {"custom_mutator": self.mutate, "custom_crossover": self.crossover}
+
+    def parse(self, data):
+        """
+            Returns the canonical encoding of the value the input decodes\
+ into and the position of every value in it.
+        """
+        value = self.decode(atheris.FuzzedDataProvider(data))
+        out = bytearray()
+        nodes = []
+        self.encode(value, out, nodes)
+        return out, nodes
+
+    def randomValue(self, ty, rng):
+        # Random.randbytes needs python 3.9
+        size = rng.randrange(1, generator.maxLength)
+        data = rng.getrandbits(8 * size).to_bytes(size, "little")
+        return generator.valueDecoder(ty, self.pool)(atheris.FuzzedDataProvider(data))
+
+    def encodeValue(self, ty, value):
+        out = bytearray()
+        generator.valueEncoder(ty, self.pool)(value, out, [])
+        return out
+
+    def mutateInt(self, ty, value, rng):
+        _, low, high = generator.intLayouts[ty.prim]
+        choices = [low, high, 0, 1, -1, value.value - 1, value.value + 1, value.value * 2, value.value // 2]
+        choices.extend(self.ints)
+        return ty(generator.clamp(rng.choice(choices), low, high))
+
+    def mutateCollection(self, ty, value, rng):
+        items = list(value.items)
+        action = rng.randrange(3)
+        if items and (action == 0 or len(items) >= generator.itemBounds.get(ty, generator.maxItems)):
+            del items[rng.randrange(len(items))]
+        elif items and action == 1 and ty.prim == "list":
+            items.insert(rng.randrange(len(items) + 1), rng.choice(items))
+        elif ty.prim in ("map", "big_map"):
+            items.append((self.randomValue(ty.args[0], rng), self.randomValue(ty.args[1], rng)))
+        else:
+            items.insert(rng.randrange(len(items) + 1), self.randomValue(ty.args[0], rng))
+        return ty(items)
+
+    def mutateValue(self, ty, value, rng):
+        """
+            Returns a new value for the given one, None if it has no\
+ mutation of its own (pairs, units: their items are mutated instead).
+        """
+        from pytezos.michelson.types.base import Undefined
+
+        prim = ty.prim
+        if prim in generator.intLayouts:
+            return self.mutateInt(ty, value, rng)
+        if prim == "bool":
+            return ty(not value.value)
+        if prim == "string":
+            return ty(rng.choice(self.strings + [""]))
+        if prim == "bytes":
+            return ty(rng.choice(self.bytes + [b""]))
+        if prim in ("address", "contract", "key_hash", "key"):
+            known = generator.poolOf(prim, self.pool)
+            return ty(rng.choice(known)) if known else self.randomValue(ty, rng)
+        if prim in ("signature", "chain_id"):
+            return self.randomValue(ty, rng)
+        if prim == "option":
+            return ty(self.randomValue(ty.args[0], rng) if value.item is None else None)
+        if prim == "or":
+            try:
+                if value.is_left():
+                    return ty((Undefined, self.randomValue(ty.args[1], rng)))
+                return ty((self.randomValue(ty.args[0], rng), Undefined))
+            except TypeError:
+                # the other side cannot be generated
+                return None
+        if prim in ("list", "set", "map", "big_map"):
+            return self.mutateCollection(ty, value, rng)
+        return None
+
+    def mutate(self, data, maxSize, seed):
+        rng = random.Random(seed)
+        if rng.random() < self.byteMutationRate:
+            return atheris.Mutate(data, maxSize)
+
+        out, nodes = self.parse(data)
+        for _ in range(4):
+            ty, value, start, end = rng.choice(nodes)
+            mutated = self.mutateValue(ty, value, rng)
+            if mutated is None:
+                continue
+            result = bytes(out[:start] + self.encodeValue(ty, mutated) + out[end:])
+            if len(result) <= maxSize:
+                return result
+        return atheris.Mutate(data, maxSize)
+
+    def crossover(self, data1, data2, maxSize, seed):
+        rng = random.Random(seed)
+        out1, nodes1 = self.parse(data1)
+        out2, nodes2 = self.parse(data2)
+
+        donors = {}
+        for ty, _, start, end in nodes2:
+            donors.setdefault(ty, []).append((start, end))
+        targets = [node for node in nodes1 if node[0] in donors]
+        if targets:
+            ty, _, start, end = rng.choice(targets)
+            donorStart, donorEnd = rng.choice(donors[ty])
+            result = bytes(out1[:start] + out2[donorStart:donorEnd] + out1[end:])
+            if len(result) <= maxSize:
+                return result
+        return atheris.Mutate(data1, maxSize)
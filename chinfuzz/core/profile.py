@@ -0,0 +1,134 @@
+import os
+import glob
+import time
+
+# root frame of every input: its self time is spent in the fuzzer itself
+# (decoding the parameters, building the call, reading the result)
+rootFrame = "fuzzer"
+instructionsHeader = "instructions (opcode@location in the code tree):"
+
+def corpusFiles(corpora):
+    paths = {}
+    for corpus in corpora:
+        for path in sorted(glob.glob(os.path.join(corpus, "*"))):
+            name = os.path.basename(path)
+            if os.path.isfile(path) and not name.startswith(".") and name not in paths:
+                paths[name] = path
+    return list(paths.values())
+
+def table(header, rows):
+    widths = [max(len(str(row[i])) for row in [header] + rows) for i in range(len(header))]
+    lines = []
+    for row in [header] + rows:
+        cells = [str(cell).ljust(width) if i == 0 else str(cell).rjust(width) for i, (cell, width) in enumerate(zip(row, widths))]
+        lines.append("  ".join(cells))
+    return lines
+
+
+class CorpusProfiler:
+    """
+        Replays the corpus folders through the fuzzer with the Michelson\
+ profiler enabled (see `pytezos.michelson.profiling`) and writes a\
+ report of the time and memory spent per phase (parameter and storage\
+ conversion, `begin`, `execute`, `end` rendering, result), per opcode\
+ and per instruction of the code tree, and the collapsed stacks of the\
+ executions for flamegraph.pl or speedscope.
+    """
+    def __init__(self, corpora, output, name) -> None:
+        self.corpora = corpora
+        self.reportPath = os.path.join(output, f"{name}.txt")
+        self.stacksPath = os.path.join(output, f"{name}.collapsed")
+        self.inputs = 0
+        self.crashes = 0
+        self.elapsed = 0
+
+    def run(self, testOneInput, profiler):
+        """
+            Arguments:
+                testOneInput: entry point of the warmed up fuzzer
+                profiler: the enabled `profiling.Profiler`
+        """
+        paths = corpusFiles(self.corpora)
+        if not paths:
+            raise BaseException(f"no inputs in {', '.join(self.corpora)}")
+
+        # forget the warm up: loading and compiling the contracts
+        profiler.clear()
+        started = time.perf_counter()
+        for path in paths:
+            with open(path, "rb") as f:
+                data = f.read()
+            try:
+                with profiler.frame(rootFrame):
+                    testOneInput(data)
+            except Exception:
+                self.crashes += 1
+            self.inputs += 1
+        self.elapsed = time.perf_counter() - started
+
+        os.makedirs(os.path.dirname(self.reportPath) or ".", exist_ok=True)
+        report = self.report(profiler)
+        with open(self.reportPath, "w") as f:
+            f.write("\n".join(report) + "\n")
+        with open(self.stacksPath, "w") as f:
+            for stack, elapsed in sorted(profiler.stacks.items()):
+                if elapsed >= 1000:
+                    f.write(f"{';'.join(stack)} {elapsed // 1000}\n")
+
+        # phases, opcodes and the costliest instructions
+        instructions = report.index(instructionsHeader)
+        print("\n".join(report[:instructions + 12]))
+        print(f"profile: {self.reportPath}, collapsed stacks (microseconds): {self.stacksPath}")
+
+    def report(self, profiler):
+        total = max(sum(stats[2] for stats in profiler.stats.values()), 1)
+        allocations = profiler.allocations
+
+        def ms(ns):
+            return f"{ns / 1e6:.2f}"
+
+        def share(ns):
+            return f"{100 * ns / total:.1f}%"
+
+        def kib(size):
+            return f"{size / 1024:.1f}" if allocations else "-"
+
+        lines = [
+            f"profile: {self.inputs} inputs ({self.crashes} crashing) in {self.elapsed:.2f}s,"
+            f" {int(self.inputs / max(self.elapsed, 1e-9))} execs/s",
+            "",
+            "phases:",
+        ]
+        phases = [(name, stats) for name, stats in profiler.stats.items() if profiler.kinds.get(name) == "phase"]
+        phases.sort(key=lambda item: -item[1][2])
+        lines += table(
+            ["phase", "calls", "total ms", "self ms", "self", "self net KiB"],
+            [[name, calls, ms(inclusive), ms(own), share(own), kib(size)] for name, (calls, inclusive, own, size) in phases],
+        )
+
+        opcodes = {}
+        for name, stats in profiler.stats.items():
+            if profiler.kinds.get(name) != "phase":
+                opcode = opcodes.setdefault(name.split("@")[0], [0, 0, 0, 0])
+                for i, value in enumerate(stats):
+                    opcode[i] += value
+        lines += ["", "opcodes:"]
+        lines += table(
+            ["opcode", "calls", "total ms", "self ms", "self", "self ns/call", "self net KiB"],
+            [
+                [prim, calls, ms(inclusive), ms(own), share(own), own // calls, kib(size)]
+                for prim, (calls, inclusive, own, size) in sorted(opcodes.items(), key=lambda item: -item[1][2])
+            ],
+        )
+
+        instructions = [(name, stats) for name, stats in profiler.stats.items() if profiler.kinds.get(name) != "phase"]
+        instructions.sort(key=lambda item: -item[1][2])
+        lines += ["", instructionsHeader]
+        lines += table(
+            ["instruction", "class", "calls", "total ms", "self ms", "self", "self net KiB"],
+            [
+                [name, profiler.kinds[name], calls, ms(inclusive), ms(own), share(own), kib(size)]
+                for name, (calls, inclusive, own, size) in instructions
+            ],
+        )
+        return lines
@@ -0,0 +1,147 @@
+from copy import deepcopy
+from chinfuzz.core import generator
+
+# upper bound of the number of calls in a sequence
+maxSteps = 50
+
+# ready sequence decoders keyed by contract and addresses
+sequenceDecoders = {}
+
+class InvariantError(AssertionError):
+    """
+        Raised when an invariant does not hold after a step of a sequence.\
+ Keeps the name of the invariant and the step breaking it.
+    """
+    def __init__(self, message, invariant=None, step=None) -> None:
+        super().__init__(message)
+        self.invariant = invariant
+        self.step = step
+
+class Step:
+    """
+        One call of a sequence: the typed parameter of the contract, the\
+ address calling it (SENDER and SOURCE) and the amount sent along.
+    """
+    def __init__(self, parameter, sender, amount) -> None:
+        self.parameter = parameter
+        self.sender = sender
+        self.amount = amount
+
+    @property
+    def entrypoint(self):
+        entrypoint, _ = self.parameter.get_entrypoint()
+        return entrypoint
+
+    def __repr__(self):
+        _, value = self.parameter.get_entrypoint()
+        return f"{self.entrypoint}({value!r}) from {self.sender} with {self.amount} mutez"
+
+def sequenceDecoder(contract, addresses=()):
+    """
+        Arguments:
+            contract: pytezos' ContractInterface
+            addresses: addresses the calls are sent from, and the arguments\
+ pick from together with the ones pushed by the contract
+
+        Returns a function turning a FuzzedDataProvider into a list of\
+ up to `maxSteps` Steps. The sequence is decoded as a Michelson\
+ `list (pair parameter address mutez)`, kept in the decoder's `argType`\
+ and `pool`, so the structured mutator inserts, removes and swaps whole\
+ calls as well as their arguments.
+    """
+    from pytezos.michelson.types import ListType, PairType, AddressType, MutezType
+
+    key = (contract.program, tuple(addresses))
+    decoder = sequenceDecoders.get(key)
+    if decoder is not None:
+        return decoder
+
+    parameter = contract.program.parameter
+    stepType = PairType.create_type(args=[parameter.args[0], AddressType, MutezType])
+    argType = ListType.create_type(args=[stepType])
+    generator.itemBounds[argType] = maxSteps
+
+    pool = tuple(generator.contractPool(contract, addresses))
+    decodeSteps = generator.valueDecoder(argType, pool)
+
+    def decode(fdp):
+        steps = []
+        for step in decodeSteps(fdp).items:
+            value, sender, amount = step.iter_comb()
+            steps.append(Step(parameter(value), str(sender), int(amount)))
+        return steps
+
+    decode.argType = argType
+    decode.pool = pool
+    sequenceDecoders[key] = decode
+    return decode
+
+def initialStorage(contract, storage, context):
+    """
+        Returns the typed storage the sequence starts from: the given one\
+ (typed or Python object), the baseline storage of the contract or a\
+ dummy one. It is attached to the context of the sequence.
+    """
+    from pytezos.michelson.sections.storage import StorageSection
+
+    storageType = contract.program.storage
+    if storage is None:
+        storage = contract.context.baseline_storage
+    if storage is None:
+        storage = storageType.from_micheline_value(
+            storageType.dummy(contract.context).to_micheline_value(lazy_diff=True)
+        )
+    elif not isinstance(storage, StorageSection):
+        storage = storageType.from_python_object(storage)
+    # only big_map values are copied, the rest is shared
+    storage = deepcopy(storage)
+    storage.attach_context(context)
+    return storage
+
+def runSequence(contract, steps, storage=None, invariants=(), failOnError=False):
+    """
+        Arguments:
+            contract: pytezos' ContractInterface
+            steps: list of Steps, e.g. decoded by `sequenceDecoder`
+            storage: storage to start from, by default the baseline storage\
+ of the contract (see `ContractInterface.set_baseline_storage`)
+            invariants: functions called with the typed storage and the\
+ step after every successful step, a falsy result raises InvariantError
+            failOnError: raise the Michelson errors (FAILWITH, overflows,\
+ ...) instead of reverting the failed step
+
+        Runs the calls one after the other in a single execution context.\
+ The typed storage left by a step is given as is to the next one, nothing\
+ goes through Micheline between the steps. A failed step is reverted like\
+ a rejected operation: the storage is left as it was and the sequence\
+ goes on, except for running out of gas which ends the sequence. Returns\
+ the final typed storage.
+    """
+    from pytezos.context.impl import ExecutionContext
+    from pytezos.michelson.gas import MichelsonOutOfGas
+    from pytezos.michelson.micheline import trace_error
+
+    program = contract.program
+    context = ExecutionContext(script=contract.context.script, address=contract.context.address)
+    storage = initialStorage(contract, storage, context)
+
+    for index, step in enumerate(steps):
+        context.sender = context.source = step.sender
+        context.amount = step.amount
+        try:
+            _, storage = program.run_typed(deepcopy(step.parameter), storage, context)
+        except Exception as e:
+            error = trace_error(e)
+            if error is None:
+                raise
+            # running out of gas ends the sequence, the fuzzer decides whether it is a finding
+            if failOnError or isinstance(error, MichelsonOutOfGas):
+                error.entrypoint = step.entrypoint
+                raise error
+            continue
+
+        for invariant in invariants:
+            if not invariant(storage, step):
+                name = getattr(invariant, "__name__", repr(invariant))
+                raise InvariantError(f"invariant {name} broken by step {index}: {step}", name, step)
+    return storage
@@ -0,0 +1,369 @@
+import os
+import re
+import sys
+import time
+import ctypes
+import atheris
+import selectors
+from chinfuzz.core.crashes import bucketLineRe, summaryLineRe
+
+# libFuzzer status line: "#1024	NEW    cov: 12 ft: 15 corp: 3/9b lim: 4 exec/s: 512 rss: 41Mb"
+statusLineRe = re.compile(r"^#(\d+)\s+\w+\s+cov: (\d+)")
+frameLineRe = re.compile(r'^\s*File "(.+)", line (\d+), in (.+)$')
+artifactLineRe = re.compile(r"Test unit written to (\S+)")
+errorLineRe = re.compile(r"==\d+== ERROR: libFuzzer: (.+)$")
+
+def splitForkServerArgs(lib_fuzzer_args):
+    """
+        Arguments:
+            lib_fuzzer_args: libFuzzer flags given on the command line
+
+        Returns the flags for the children, the total number of runs\
+ (-1 for infinite runs), the total time budget (0 for no limit) and\
+ the random seed (0 to let every child pick one).
+    """
+    childArgs = []
+    totalRuns = -1
+    maxTotalTime = 0
+    seed = 0
+    for arg in lib_fuzzer_args:
+        if arg.startswith("-seed="):
+            seed = int(arg.split("=", 1)[1])
+        elif arg.startswith("-runs="):
+            totalRuns = int(arg.split("=", 1)[1])
+        elif arg.startswith("-max_total_time="):
+            maxTotalTime = int(arg.split("=", 1)[1])
+        else:
+            childArgs.append(arg)
+    return childArgs, totalRuns, maxTotalTime, seed
+
+def forkWorker(testOneInput, args, hooks=None):
+    """
+        Arguments:
+            testOneInput: entry point of the (instrumented) fuzzer
+            args: libFuzzer command line of the child
+            hooks: custom mutator and crossover given to atheris
+
+        Forks a child running the fuzzer and returns its pid and the read\
+ end of the pipe its stdout and stderr go to.
+    """
+    readFd, writeFd = os.pipe()
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            os.close(readFd)
+            os.dup2(writeFd, 1)
+            os.dup2(writeFd, 2)
+            os.close(writeFd)
+            atheris.Setup(args, testOneInput, **(hooks or {}))
+            atheris.Fuzz()
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except BaseException as e:
+            print(e)
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            # atheris raises SystemExit on an uncaught exception, libFuzzer
+            # writes the crashing input from its exit handler: leave through
+            # the C library's exit, not os._exit, so that the handler runs
+            ctypes.CDLL(None).exit(code & 0xff)
+
+    os.close(writeFd)
+    return pid, readFd
+
+def exitStatus(status):
+    # the signal number is reported as a negative status
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+class CrashTracker:
+    """
+        Follows the output of one child and extracts the crashes it\
+ reports: the uncaught Python exception with its innermost frame, or\
+ the libFuzzer error (timeout, deadly signal, ...), and the artifact.
+    """
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self):
+        self.exception = None
+        self.frame = None
+        self.error = None
+        self.expectException = False
+
+    def feed(self, line):
+        """
+            Arguments:
+                line: a line of the child's output
+
+            Returns (signature, artifact) once a crash is complete.
+        """
+        if self.expectException:
+            self.exception = line.strip()
+            self.expectException = False
+        elif "Uncaught Python exception" in line:
+            self.reset()
+            self.expectException = True
+        elif frameLineRe.match(line):
+            self.frame = frameLineRe.match(line).group(1, 2)
+        elif errorLineRe.search(line):
+            self.error = errorLineRe.search(line).group(1).split(" in ")[0]
+        elif artifactLineRe.search(line):
+            signature = self.signature()
+            self.reset()
+            return signature, artifactLineRe.search(line).group(1)
+        return None
+
+    def signature(self):
+        if self.exception is not None:
+            where = f" at {self.frame[0]}:{self.frame[1]}" if self.frame else ""
+            return f"{self.exception}{where}"
+        return self.error or "unknown crash"
+
+
+class CampaignStats:
+    """
+        Aggregates the status reported by every worker: executions,\
+ coverage and crashes deduplicated by signature across workers.
+    """
+    def __init__(self, corpus) -> None:
+        self.corpus = corpus
+        self.started = time.time()
+        self.finishedExecs = 0
+        self.currentExecs = {}
+        self.coverage = 0
+        self.crashes = {}
+        self.totalCrashes = 0
+
+    def feed(self, slot, line):
+        match = statusLineRe.match(line)
+        if match:
+            self.currentExecs[slot] = int(match.group(1))
+            self.coverage = max(self.coverage, int(match.group(2)))
+
+    def childExited(self, slot):
+        self.finishedExecs += self.currentExecs.pop(slot, 0)
+
+    def addCrash(self, signature, artifact, count=1):
+        """
+            Arguments:
+                signature: exception (or libFuzzer error) and its location,\
+ or the signature of a crash bucket
+                artifact: file holding the crashing input
+                count: crashing inputs reported
+
+            Returns True if no worker reported this crash before.
+        """
+        self.totalCrashes += count
+        if signature in self.crashes:
+            self.crashes[signature][1] += count
+            return False
+        self.crashes[signature] = [artifact, count]
+        return True
+
+    def execs(self):
+        return self.finishedExecs + sum(self.currentExecs.values())
+
+    def statusLine(self, workers):
+        elapsed = max(time.time() - self.started, 1e-6)
+        try:
+            corpusSize = len(os.listdir(self.corpus))
+        except OSError:
+            corpusSize = 0
+        return (
+            f"#{self.execs()}\tworkers: {workers} exec/s: {int(self.execs() / elapsed)}"
+            f" cov: {self.coverage} corp: {corpusSize}"
+            f" crashes: {len(self.crashes)} unique / {self.totalCrashes}"
+        )
+
+    def summary(self):
+        lines = []
+        for signature, (artifact, count) in self.crashes.items():
+            lines.append(f"  {count}x {signature}\n     {artifact}")
+        return "\n".join(lines)
+
+
+class ForkWorkers:
+    """
+        Runs the fuzzer in `jobs` slots of children forked from the warmed\
+ up parent. A slot gets a new child when the previous one finished its\
+ batch or crashed, until the run or time budget is spent.
+
+        The parent reads the output of the children and merges their crash\
+ buckets: the children inherit the signatures known so far (when the\
+ fuzzer buckets its crashes) and only announce new ones, the parent\
+ prints the summary of the whole campaign. With one job the output of\
+ the child is echoed but for its crash buckets. With more than one job it\
+ goes to `fuzz-<slot>.log`, the parent prints the aggregated status\
+ instead and children pick up each other's inputs by reloading the\
+ shared corpus.
+    """
+    statusInterval = 5
+
+    def __init__(self, testOneInput, fuzzer, corpus, lib_fuzzer_args=[], jobs=1, batchRuns=-1, hooks=None, crashes=None) -> None:
+        self.testOneInput = testOneInput
+        self.fuzzer = fuzzer
+        self.corpus = corpus
+        self.childArgs, self.totalRuns, self.maxTotalTime, self.seed = splitForkServerArgs(lib_fuzzer_args)
+        self.jobs = max(jobs, 1)
+        self.batchRuns = batchRuns
+        self.hooks = hooks or {}
+        # CrashBuckets of the fuzzer, None when crashes are left to libFuzzer
+        self.crashes = crashes
+        self.echo = self.jobs == 1
+        self.stats = CampaignStats(corpus)
+        self.reservedRuns = 0
+        self.launched = 0
+        self.workers = {}
+        # signatures of the crash buckets reported by the children
+        self.bucketSignatures = set()
+        self.selector = selectors.DefaultSelector()
+
+    def childArgsFor(self, freeSlots):
+        """
+            Arguments:
+                freeSlots: number of slots waiting for a child
+
+            Returns the libFuzzer command line of the next child or None\
+ when the budget is spent.
+        """
+        runs = self.batchRuns
+        if self.totalRuns >= 0:
+            remaining = self.totalRuns - self.reservedRuns
+            if remaining <= 0:
+                return None
+            share = -(-remaining // freeSlots)
+            runs = share if runs <= 0 else min(runs, share)
+            self.reservedRuns += runs
+
+        args = [self.fuzzer] + self.childArgs
+        if runs > 0:
+            args.append(f"-runs={runs}")
+        if self.seed:
+            # a fixed seed would replay the same mutations in every child
+            args.append(f"-seed={self.seed + self.launched}")
+        if self.maxTotalTime > 0:
+            remaining = int(self.maxTotalTime - (time.time() - self.stats.started))
+            if remaining <= 0:
+                return None
+            args.append(f"-max_total_time={remaining}")
+        if not self.echo and not any(arg.startswith("-reload=") for arg in self.childArgs):
+            args.append("-reload=1")
+        args.append(self.corpus)
+        return args
+
+    def launch(self, slot, freeSlots):
+        args = self.childArgsFor(freeSlots)
+        if args is None:
+            return False
+        if self.crashes is not None:
+            # the child inherits the buckets found by the previous ones
+            for signature in self.bucketSignatures:
+                self.crashes.addKnown(signature)
+        pid, readFd = forkWorker(self.testOneInput, args, hooks=self.hooks)
+        self.launched += 1
+        worker = {"pid": pid, "fd": readFd, "buffer": b"", "crash": CrashTracker(), "log": None, "opened": set()}
+        if not self.echo:
+            worker["log"] = open(f"fuzz-{slot}.log", "ab")
+        self.selector.register(readFd, selectors.EVENT_READ, slot)
+        self.workers[slot] = worker
+        return True
+
+    def readOutput(self, slot, worker):
+        chunk = os.read(worker["fd"], 65536)
+        if worker["log"] is not None:
+            worker["log"].write(chunk)
+        data = worker["buffer"] + chunk
+        lines = data.split(b"\n")
+        # the last line is incomplete, or empty when the output ends with a newline
+        last = lines.pop()
+        worker["buffer"] = last if chunk else b""
+        if last and not chunk:
+            lines.append(last)
+        for line in lines:
+            self.feed(slot, worker, line.decode("utf-8", "replace"))
+        return bool(chunk)
+
+    def feed(self, slot, worker, line):
+        self.stats.feed(slot, line)
+        bucket = bucketLineRe.match(line)
+        if bucket is not None:
+            # a new bucket counts one crash, the summary of the child at exit the others
+            _, seen, signature, artifact = bucket.groups()
+            if seen == "new":
+                worker["opened"].add(signature)
+                count = 1
+            else:
+                count = int(seen[:-1]) - (signature in worker["opened"])
+            self.bucketSignatures.add(signature)
+            if count and self.stats.addCrash(signature, artifact, count):
+                print(f"worker {slot}: new crash {signature}\n  {artifact}", flush=True)
+            return
+        if not summaryLineRe.match(line):
+            self.echoLine(line)
+        crash = worker["crash"].feed(line)
+        if crash is not None and self.stats.addCrash(*crash):
+            print(f"worker {slot}: new crash {crash[0]}\n  {crash[1]}", flush=True)
+
+    def echoLine(self, line):
+        if self.echo:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
+    def reap(self, slot, status):
+        worker = self.workers.pop(slot)
+        self.selector.unregister(worker["fd"])
+        os.close(worker["fd"])
+        if worker["log"] is not None:
+            worker["log"].close()
+        self.stats.childExited(slot)
+        status = exitStatus(status)
+        if status != 0:
+            print(f"worker {slot}: child exited with status {status}", flush=True)
+
+    def run(self):
+        lastStatus = time.time()
+        budgetLeft = True
+        try:
+            while True:
+                freeSlots = [slot for slot in range(self.jobs) if slot not in self.workers]
+                for slot in freeSlots:
+                    if not budgetLeft:
+                        break
+                    budgetLeft = self.launch(slot, len(freeSlots))
+                    freeSlots = freeSlots[1:]
+                if not self.workers:
+                    break
+
+                for key, _ in self.selector.select(timeout=1.0):
+                    slot = key.data
+                    worker = self.workers[slot]
+                    if not self.readOutput(slot, worker):
+                        _, status = os.waitpid(worker["pid"], 0)
+                        self.reap(slot, status)
+
+                if not self.echo and time.time() - lastStatus >= self.statusInterval:
+                    print(self.stats.statusLine(len(self.workers)))
+                    lastStatus = time.time()
+        except KeyboardInterrupt:
+            # the children got the same SIGINT, let them write their artifacts and exit.
+            # Their output is read up to the end first: a child blocked on a full pipe
+            # would never exit otherwise
+            for slot, worker in list(self.workers.items()):
+                while self.readOutput(slot, worker):
+                    pass
+                _, status = os.waitpid(worker["pid"], 0)
+                self.reap(slot, status)
+
+        print(self.stats.statusLine(0))
+        if self.stats.crashes:
+            print(f"unique crashes:\n{self.stats.summary()}")
+        print(f"{self.launched} children, corpus: {self.corpus}")
@@ -1,19 +1,18 @@
 from chinfuzz.core import fuzz
-from chinstrap.tests import getContractInterface
             
 owner = "tz1YtuZ4vhzzn7ssCt93Put8U9UJDdvCXci4"
 alice = "tz1LFuHW4Z9zsCwg1cgGTKU12WZAs27ZD14v"
 
 def ChinfuzzFuzzerTestOneInput(data):
-    # convert data (bytes) to required data type using FuzzedDataProvider
-    fdp = fuzz.FuzzedDataProvider(data)
-    
-    # we generate numbers of size `10000`
-    data = fdp.ConsumeInt(10000)
+    # we get the contract interface as we do in Chinstrap tests. The contract
+    # is parsed once and cached, so this is cheap on every iteration
+    contract = fuzz.getContractInterface("SampleContract")
 
-    # we get the contract interface as we do in Chinstrap tests
-    contract = getContractInterface("SampleContract")
+    # we initialise the storage once, every call then starts from a cheap
+    # copy of the already converted value
+    if contract.baseline_storage is None:
+        contract.set_baseline_storage({"owner": owner, "counter": 0})
 
-    # we initialise the storate and call the entrypoint we would like to fuzz
-    storage = {"owner": owner, "counter": 0}
-    contract.increment(data).interpret(storage=storage, source=owner)
\ No newline at end of file
+    # we call the entrypoint we would like to fuzz, its arguments are decoded
+    # from the fuzzer's bytes according to the parameter type of the contract
+    fuzz.ConsumeCall(data, contract, "increment", [owner, alice]).interpret(source=owner)
\ No newline at end of file
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# vendored packages import themselves by their top-level name (`pytezos.*`),
+# so make sure they win over any copy installed alongside chinstrap
+thirdpartyPath = os.path.dirname(os.path.abspath(__file__))
+if thirdpartyPath not in sys.path:
+    sys.path.insert(0, thirdpartyPath)
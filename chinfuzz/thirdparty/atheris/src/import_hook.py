@@ -17,16 +17,32 @@
 The instrument() function temporarily installs an import hook
 (AtherisMetaPathFinder) in sys.meta_path that employs a custom loader
 (AtherisSourceFileLoader, AtherisSourcelessFileLoader).
+
+The instrumented code of the modules loaded from files is cached on disk,
+keyed by the content and path of the file, the Python version, the
+instrumentation options and the instrumentation code itself, so that the
+following runs (and every job of a parallel run) skip the instrumentation.
+$ATHERIS_CACHE_DIR sets the cache folder (default: $XDG_CACHE_HOME/atheris or
+~/.cache/atheris), an empty $ATHERIS_CACHE_DIR disables the cache.
 """
 # _frozen_importlib is a special Py Interpreter library, disable import-error.
 import _frozen_importlib  # type: ignore[import]
 import _frozen_importlib_external  # type: ignore[import]
+import hashlib
 from importlib import abc
 from importlib import machinery
+from importlib import util
+import marshal
+import os
 import sys
+import tempfile
 import types
-from typing import Set, Optional, Sequence, Type, Union, Any
+from typing import Set, Optional, Sequence, Tuple, Type, Union, Any, Callable
+from . import instrument_bytecode
+from . import version_dependent
+from .instrument_bytecode import link_code
 from .instrument_bytecode import patch_code
+from .instrument_bytecode import patch_code_portable
 
 _warned_experimental = False
 
@@ -180,6 +196,143 @@ class AtherisMetaPathFinder(abc.MetaPathFinder):
     return machinery.PathFinder.invalidate_caches()
 
 
+# Header of the cache files: the magic number of the interpreter's .pyc files,
+# then the format of the cache.
+_CACHE_MAGIC = util.MAGIC_NUMBER + b"ATH1"
+_instrumentation_hash: Optional[bytes] = None
+
+
+def _cache_dir() -> Optional[str]:
+  """Returns the folder of the instrumented code cache, None if disabled."""
+  path = os.environ.get("ATHERIS_CACHE_DIR")
+  if path is None:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache")
+    path = os.path.join(cache_home, "atheris")
+  if not path:
+    return None
+  return os.path.join(path, sys.implementation.cache_tag or "none")
+
+
+def _get_instrumentation_hash() -> bytes:
+  """Returns a hash of the code doing the instrumentation.
+
+  An upgraded (or patched) Atheris instruments differently, so it does not
+  reuse the code instrumented by another one.
+  """
+  global _instrumentation_hash
+  if _instrumentation_hash is None:
+    digest = hashlib.sha256()
+    for module in (instrument_bytecode, version_dependent):
+      with open(module.__file__, "rb") as f:
+        digest.update(f.read())
+    _instrumentation_hash = digest.digest()
+  return _instrumentation_hash
+
+
+def _cache_key(path: str, data: bytes, trace_dataflow: bool) -> bytes:
+  """Returns the key of a module's instrumented code in the cache."""
+  digest = hashlib.sha256()
+  digest.update(_get_instrumentation_hash())
+  digest.update(sys.version.encode())
+  digest.update(b"dataflow" if trace_dataflow else b"branches")
+  # -O and -OO strip asserts and docstrings at compile time.
+  digest.update(b"optimize=%d" % sys.flags.optimize)
+  # The path is part of the key as it is compiled into the code objects.
+  digest.update(os.path.abspath(path).encode("utf-8", "surrogateescape"))
+  digest.update(b"\0")
+  digest.update(data)
+  return digest.digest()
+
+
+def _read_cache(path: str,
+                key: bytes) -> Optional[Tuple[types.CodeType, int]]:
+  """Returns the portable code and its number of counters, if cached."""
+  try:
+    with open(path, "rb") as f:
+      data = f.read()
+  except OSError:
+    return None
+
+  header = len(_CACHE_MAGIC) + len(key) + 4
+  if (len(data) < header or not data.startswith(_CACHE_MAGIC) or
+      data[len(_CACHE_MAGIC):header - 4] != key):
+    return None
+  try:
+    code = marshal.loads(data[header:])
+  except (EOFError, ValueError, TypeError):
+    return None
+  if not isinstance(code, types.CodeType):
+    return None
+  return code, int.from_bytes(data[header - 4:header], "little")
+
+
+def _write_cache(path: str, key: bytes, code: types.CodeType,
+                 num_counters: int) -> None:
+  """Stores the portable code of a module, atomically."""
+  try:
+    data = marshal.dumps(code)
+  except ValueError:
+    return
+
+  folder = os.path.dirname(path)
+  try:
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+      with os.fdopen(fd, "wb") as f:
+        f.write(_CACHE_MAGIC + key + num_counters.to_bytes(4, "little") + data)
+      # Parallel jobs may race to fill the same entry, they write the same.
+      os.replace(tmp_path, path)
+    except BaseException:
+      os.unlink(tmp_path)
+      raise
+  except OSError:
+    pass
+
+
+def get_instrumented_code(
+    loader: Any, fullname: str,
+    get_code: Callable[[str], Optional[types.CodeType]],
+    trace_dataflow: bool) -> Optional[types.CodeType]:
+  """Returns the instrumented code of a module loaded from a file.
+
+  The code is instrumented in a portable form and cached, then linked: the
+  counters are reserved in the same order as if it was instrumented in
+  place, so the counter IDs are the same whether the cache is hit or not.
+
+  Args:
+    loader: The file loader of the module.
+    fullname: Fully qualified name of the module.
+    get_code: The loader's own get_code().
+    trace_dataflow: Whether or not to trace dataflow.
+  """
+  folder = _cache_dir()
+  data = None
+  if folder is not None:
+    try:
+      data = loader.get_data(loader.path)
+    except OSError:
+      pass
+
+  if data is None:
+    code = get_code(fullname)
+    return None if code is None else patch_code(code, trace_dataflow)
+
+  key = _cache_key(loader.path, data, trace_dataflow)
+  path = os.path.join(folder, key.hex() + ".pyc")
+  cached = _read_cache(path, key)
+  if cached is not None:
+    return link_code(*cached)
+
+  code = get_code(fullname)
+  if code is None:
+    return None
+  portable, num_counters = patch_code_portable(code, trace_dataflow)
+  _write_cache(path, key, portable, num_counters)
+  return link_code(portable, num_counters)
+
+
 class AtherisSourceFileLoader(_frozen_importlib_external.SourceFileLoader):
   """Loads a source file, patching its bytecode with Atheris instrumentation."""
 
@@ -188,12 +341,8 @@ class AtherisSourceFileLoader(_frozen_importlib_external.SourceFileLoader):
     self._trace_dataflow = trace_dataflow
 
   def get_code(self, fullname: str) -> Optional[types.CodeType]:
-    code = super().get_code(fullname)
-
-    if code is None:
-      return None
-    else:
-      return patch_code(code, self._trace_dataflow)
+    return get_instrumented_code(self, fullname, super().get_code,
+                                 self._trace_dataflow)
 
 
 class AtherisSourcelessFileLoader(
@@ -205,12 +354,8 @@ class AtherisSourcelessFileLoader(
     self._trace_dataflow = trace_dataflow
 
   def get_code(self, fullname: str) -> Optional[types.CodeType]:
-    code = super().get_code(fullname)
-
-    if code is None:
-      return None
-    else:
-      return patch_code(code, self._trace_dataflow)
+    return get_instrumented_code(self, fullname, super().get_code,
+                                 self._trace_dataflow)
 
 
 def make_dynamic_atheris_loader(loader: Any, trace_dataflow: bool) -> Any:
@@ -0,0 +1,129 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the cache of instrumented code of the import hook."""
+
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+import atheris
+from atheris import import_hook
+
+_MODULE_SOURCE = """
+LIMIT = 5
+
+
+def branches(x, y):
+  if x > LIMIT:
+    return [i for i in range(x) if i == y]
+  is_three = lambda z: z == 3
+  return is_three(x) or x != 1
+"""
+
+
+def _consts(code):
+  """Returns the consts of code and its nested code objects, flattened."""
+  consts = []
+  for const in code.co_consts:
+    if isinstance(const, types.CodeType):
+      consts.extend(_consts(const))
+    elif not isinstance(const, types.ModuleType):
+      consts.append(const)
+  return consts
+
+
+class ImportHookCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self._dir = tempfile.TemporaryDirectory()
+    self._cache = os.path.join(self._dir.name, "cache")
+    with open(os.path.join(self._dir.name, "cached_target.py"), "w") as f:
+      f.write(_MODULE_SOURCE)
+    sys.path.insert(0, self._dir.name)
+
+  def tearDown(self):
+    sys.path.remove(self._dir.name)
+    sys.modules.pop("cached_target", None)
+    self._dir.cleanup()
+    super().tearDown()
+
+  def _import(self, cache):
+    """Imports the instrumented module, returns it and its first counter."""
+    sys.modules.pop("cached_target", None)
+    first = atheris._reserve_counter() + 1
+    with mock.patch.dict(os.environ, {"ATHERIS_CACHE_DIR": cache}):
+      with atheris.instrument_imports(include=["cached_target"]):
+        import cached_target  # pylint: disable=g-import-not-at-top
+    return cached_target, first
+
+  def _cache_files(self):
+    return [
+        name for _, _, names in os.walk(self._cache) for name in names
+    ]
+
+  def testCacheHitLinksSameCode(self):
+    fresh, fresh_first = self._import(self._cache)
+    self.assertEqual(len(self._cache_files()), 1)
+    cached, cached_first = self._import(self._cache)
+    self.assertEqual(len(self._cache_files()), 1)
+
+    self.assertEqual(fresh.branches.__code__.co_code,
+                     cached.branches.__code__.co_code)
+    # The counters are remapped: same layout, shifted to the new counters.
+    shift = cached_first - fresh_first
+    fresh_consts = _consts(fresh.branches.__code__)
+    cached_consts = _consts(cached.branches.__code__)
+    self.assertEqual(len(fresh_consts), len(cached_consts))
+    counters = [
+        (a, b) for a, b in zip(fresh_consts, cached_consts) if a != b
+    ]
+    self.assertTrue(counters)
+    for a, b in counters:
+      self.assertEqual(b - a, shift)
+    self.assertEqual(cached.branches(7, 2), [2])
+    self.assertTrue(cached.branches(3, 0))
+
+  def testSameCountersWithoutCache(self):
+    uncached, uncached_first = self._import("")
+    after_uncached = atheris._reserve_counter()
+    self.assertEqual(self._cache_files(), [])
+    cached, cached_first = self._import(self._cache)
+    after_cached = atheris._reserve_counter()
+    self.assertEqual(after_uncached - uncached_first,
+                     after_cached - cached_first)
+    self.assertEqual(uncached.branches(1, 0), cached.branches(1, 0))
+
+  def testSourceChangeInvalidates(self):
+    self._import(self._cache)
+    with open(os.path.join(self._dir.name, "cached_target.py"), "a") as f:
+      f.write("\nLIMIT = 6\n")
+    module, _ = self._import(self._cache)
+    self.assertEqual(len(self._cache_files()), 2)
+    self.assertEqual(module.LIMIT, 6)
+
+  def testOptimizationLevelInKey(self):
+    key = import_hook._cache_key("cached_target.py", _MODULE_SOURCE.encode(),
+                                 False)
+    with mock.patch.object(sys, "flags", mock.Mock(optimize=2)):
+      optimized = import_hook._cache_key("cached_target.py",
+                                         _MODULE_SOURCE.encode(), False)
+    self.assertNotEqual(key, optimized)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -20,6 +20,7 @@ helper class Instrumentor.
 import collections
 import dis
 import gc
+import itertools
 import sys
 import types
 from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar, Union
@@ -34,6 +35,7 @@ from .version_dependent import get_lnotab
 from .version_dependent import HAVE_ABS_REFERENCE
 from .version_dependent import HAVE_REL_REFERENCE
 from .version_dependent import jump_arg_bytes
+from .version_dependent import replace_consts
 from .version_dependent import REVERSE_CMP_OP
 from .version_dependent import UNCONDITIONAL_JUMPS
 
@@ -41,6 +43,12 @@ _TARGET_MODULE = "atheris"
 _COVERAGE_FUNCTION = "_trace_branch"
 _COMPARE_FUNCTION = "_trace_cmp"
 
+# Portable instrumented code (see patch_code_portable()) holds these
+# placeholders instead of the atheris module and the counter IDs, which only
+# make sense in the running process.
+_MODULE_PLACEHOLDER = ("__ATHERIS_MODULE__",)
+_COUNTER_PLACEHOLDER = "__ATHERIS_COUNTER__"
+
 # TODO(b/207008147): Use NewType to differentiate the many int and str types.
 
 
@@ -271,12 +279,23 @@ class Instrumentor:
   Note that Instrumentor only supports insertions, not deletions.
   """
 
-  def __init__(self, code: types.CodeType):
+  def __init__(self,
+               code: types.CodeType,
+               counter_ids: Optional[Iterator[int]] = None):
+    """Builds the CFG of `code`.
+
+    Args:
+      code: The code object to instrument.
+      counter_ids: If given, the instrumented code is portable: counters are
+        numbered from this iterator and stored as placeholders, as is the
+        atheris module.
+    """
     self._cfg: collections.OrderedDict = collections.OrderedDict()
     self.consts = list(code.co_consts)
     self._names = list(code.co_names)
     self.num_counters = 0
     self._code = code
+    self._counter_ids = counter_ids
 
     self._build_cfg()
     self._check_state()
@@ -380,7 +399,8 @@ class Instrumentor:
       self._names.append(name)
       return len(self._names) - 1
 
-  def _get_const(self, constant: Union[int, types.ModuleType]) -> int:
+  def _get_const(self, constant: Union[int, Tuple[Any, ...],
+                                       types.ModuleType]) -> int:
     """Returns the index of `constant` in self.consts, inserting if needed."""
     for i in range(len(self.consts)):
       if isinstance(self.consts[i],
@@ -391,9 +411,17 @@ class Instrumentor:
     return len(self.consts) - 1
 
   def _get_counter(self) -> int:
+    if self._counter_ids is not None:
+      return self._get_const((_COUNTER_PLACEHOLDER, next(self._counter_ids)))
     counter = _reserve_counter()
     return self._get_const(counter)
 
+  def _get_module(self) -> int:
+    """Returns an offset to the atheris module (or its placeholder)."""
+    if self._counter_ids is not None:
+      return self._get_const(_MODULE_PLACEHOLDER)
+    return self._get_const(sys.modules[_TARGET_MODULE])
+
   def _adjust(self, offset: float, size: int, *keep_refs: str) -> None:
     """Adjust for `size` bytes of instructions inserted at `offset`.
 
@@ -472,7 +500,7 @@ class Instrumentor:
     """Builds the bytecode that calls atheris._trace_branch()."""
     to_insert = []
     start_offset = offset
-    const_atheris = self._get_const(sys.modules[_TARGET_MODULE])
+    const_atheris = self._get_module()
     name_cov = self._get_name(_COVERAGE_FUNCTION)
 
     to_insert.append(
@@ -509,7 +537,7 @@ class Instrumentor:
     """
     to_insert = []
     start_offset = offset
-    const_atheris = self._get_const(sys.modules[_TARGET_MODULE])
+    const_atheris = self._get_module()
     name_cmp = self._get_name(_COMPARE_FUNCTION)
     const_op = self._get_const(op)
     const_counter = self._get_counter()
@@ -556,7 +584,7 @@ class Instrumentor:
     """
     to_insert = []
     start_offset = offset
-    const_atheris = self._get_const(sys.modules[_TARGET_MODULE])
+    const_atheris = self._get_module()
     name_cmp = self._get_name(_COMPARE_FUNCTION)
     const_counter = self._get_counter()
     const_true = self._get_const(True)
@@ -724,7 +752,8 @@ class Instrumentor:
 
 def patch_code(code: types.CodeType,
                trace_dataflow: bool,
-               nested: bool = False) -> types.CodeType:
+               nested: bool = False,
+               counter_ids: Optional[Iterator[int]] = None) -> types.CodeType:
   """Returns code, patched with Atheris instrumentation.
 
   Args:
@@ -732,8 +761,10 @@ def patch_code(code: types.CodeType,
     trace_dataflow: Whether to trace dataflow or not.
     nested: If False, reserve counters, and patch modules. Recursive calls to
       this function are considered nested.
+    counter_ids: If given, produce portable code numbering its counters from
+      this iterator (see patch_code_portable()).
   """
-  inst = Instrumentor(code)
+  inst = Instrumentor(code, counter_ids)
 
   # If this code object has already been instrumented, skip it
   for const in inst.consts:
@@ -753,11 +784,65 @@ def patch_code(code: types.CodeType,
           (not nested and inst.consts[i].co_name == "<module>") or
           inst.consts[i].co_name[0] != "<" or
           inst.consts[i].co_name[-1] != ">"):
-        inst.consts[i] = patch_code(inst.consts[i], trace_dataflow, nested=True)
+        inst.consts[i] = patch_code(
+            inst.consts[i], trace_dataflow, nested=True,
+            counter_ids=counter_ids)
 
   return inst.to_code()
 
 
+def patch_code_portable(code: types.CodeType,
+                        trace_dataflow: bool) -> Tuple[types.CodeType, int]:
+  """Returns code patched with Atheris instrumentation, in a portable form.
+
+  The counters and the atheris module are replaced by placeholders, so the
+  result can be marshalled (e.g. cached on disk) and made runnable in any
+  process with link_code().
+
+  Args:
+    code: The byte code to instrument.
+    trace_dataflow: Whether to trace dataflow or not.
+
+  Returns:
+    The portable code and the number of counters it uses.
+  """
+  counter_ids = itertools.count()
+  patched = patch_code(code, trace_dataflow, counter_ids=counter_ids)
+  return patched, next(counter_ids)
+
+
+def link_code(code: types.CodeType, num_counters: int) -> types.CodeType:
+  """Returns portable instrumented code (see patch_code_portable()) ready to run.
+
+  Counters are reserved now and handed out in the order the instrumentation
+  numbered them, which is the order patch_code() would reserve them in: a
+  module gets the same counter IDs whether it was instrumented or linked.
+
+  Args:
+    code: The portable code.
+    num_counters: The number of counters it uses.
+  """
+  counters = [_reserve_counter() for _ in range(num_counters)]
+  return _link_consts(code, counters, sys.modules[_TARGET_MODULE])
+
+
+def _link_consts(code: types.CodeType, counters: List[int],
+                 module: types.ModuleType) -> types.CodeType:
+  """Replaces the placeholders of code and its nested code objects."""
+  consts = []
+  for const in code.co_consts:
+    if isinstance(const, types.CodeType):
+      const = _link_consts(const, counters, module)
+    elif isinstance(const, tuple) and len(const) in (1, 2) and isinstance(
+        const[0], str):
+      if const == _MODULE_PLACEHOLDER:
+        const = module
+      elif const[0] == _COUNTER_PLACEHOLDER and len(const) == 2:
+        const = counters[const[1]]
+    consts.append(const)
+  return replace_consts(code, tuple(consts))
+
+
 T = TypeVar("T")
 
 
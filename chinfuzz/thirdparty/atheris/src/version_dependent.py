@@ -130,6 +130,14 @@ else:
                           code_obj.co_freevars, code_obj.co_cellvars)
 
 
+def replace_consts(code_obj: types.CodeType, consts: tuple) -> types.CodeType:
+  """Returns a copy of code_obj with different co_consts."""
+  if PYTHON_VERSION >= (3, 8):
+    return code_obj.replace(co_consts=consts)
+  return get_code_object(code_obj, code_obj.co_stacksize, code_obj.co_code,
+                         consts, code_obj.co_names, code_obj.co_lnotab)
+
+
 ### Python 3.10 uses instruction (2 byte) offsets rather than byte offsets ###
 
 if PYTHON_VERSION >= (3, 10):
@@ -10,17 +10,42 @@ Just type:
 And follow the interactive documentation.
 """
 
-from pytezos.client import PyTezosClient
-from pytezos.contract.interface import Contract, ContractInterface
-from pytezos.crypto.key import Key
-from pytezos.logging import logger
-from pytezos.michelson.forge import forge_micheline, unforge_micheline
-from pytezos.michelson.format import micheline_to_michelson
-from pytezos.michelson.micheline import MichelsonRuntimeError
-from pytezos.michelson.parse import michelson_to_micheline
-from pytezos.michelson.types.base import MichelsonType, Undefined
-from pytezos.michelson.types.core import Unit
+from importlib import import_module
+from typing import Any
 
 __version__ = '3.5.1'
 
-pytezos = PyTezosClient()
+# the client pulls in the RPC, the sandbox, the block and operation builders and their dependencies (requests, crypto backends...):
+# the top-level names are only imported on first access, so that e.g. `pytezos.michelson` can be used on its own
+_lazy_attributes = {
+    'PyTezosClient': 'pytezos.client',
+    'Contract': 'pytezos.contract.interface',
+    'ContractInterface': 'pytezos.contract.interface',
+    'Key': 'pytezos.crypto.key',
+    'logger': 'pytezos.logging',
+    'forge_micheline': 'pytezos.michelson.forge',
+    'unforge_micheline': 'pytezos.michelson.forge',
+    'micheline_to_michelson': 'pytezos.michelson.format',
+    'MichelsonRuntimeError': 'pytezos.michelson.micheline',
+    'michelson_to_micheline': 'pytezos.michelson.parse',
+    'MichelsonType': 'pytezos.michelson.types.base',
+    'Undefined': 'pytezos.michelson.types.base',
+    'Unit': 'pytezos.michelson.types.core',
+}
+
+__all__ = [*_lazy_attributes, 'pytezos']
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'pytezos':
+        value = __getattr__('PyTezosClient')()
+    elif name in _lazy_attributes:
+        value = getattr(import_module(_lazy_attributes[name]), name)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,7 +7,7 @@ from pytezos.crypto.encoding import base58_encode
 from pytezos.crypto.key import Key
 from pytezos.logging import logger
 from pytezos.michelson.forge import forge_micheline, forge_script_expr
-from pytezos.michelson.micheline import MichelineT, get_script_section, get_script_sections
+from pytezos.michelson.micheline import Micheline, MichelineT, get_script_section, get_script_sections
 from pytezos.operation import DEFAULT_OPERATIONS_TTL, MAX_OPERATIONS_TTL
 from pytezos.rpc.errors import RpcError
 from pytezos.rpc.shell import ShellQuery
@@ -66,6 +66,7 @@ class ExecutionContext(AbstractContext):
         self._sandboxed: Optional[bool] = None
         self.ipfs_gateway = (ipfs_gateway or DEFAULT_IPFS_GATEWAY).rstrip('/')
         self.storage_value = script.get('storage') if script else None
+        self.baseline_storage = None
 
     def __copy__(self):
         raise ValueError("It's not allowed to copy context")
@@ -201,7 +202,11 @@ class ExecutionContext(AbstractContext):
     def get_storage_value(self, address=None) -> Optional[dict]:
         if self.shell:
             return self.shell.head.context.contracts[address].storage()
-        return None if address else self.resolve_global_constants(self.storage_value)
+        if address:
+            return None
+        if isinstance(self.storage_value, Micheline):  # already typed storage
+            return self.storage_value.to_micheline_value(lazy_diff=True)
+        return self.resolve_global_constants(self.storage_value)
 
     def get_code_expr(self):
         return self.resolve_global_constants(self.code_expr)
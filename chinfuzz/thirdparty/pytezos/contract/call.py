@@ -1,6 +1,6 @@
 from decimal import Decimal
 from pprint import pformat
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Type, Union
 
 from deprecation import deprecated  # type: ignore
 
@@ -9,8 +9,12 @@ from pytezos.context.mixin import ContextMixin  # type: ignore
 from pytezos.contract.result import ContractCallResult
 from pytezos.jupyter import get_class_docstring
 from pytezos.logging import logger
+from pytezos.michelson import profiling
 from pytezos.michelson.format import micheline_to_michelson
+from pytezos.michelson.micheline import MichelsonRuntimeError, try_trace
+from pytezos.michelson.program import MichelsonProgram
 from pytezos.michelson.repl import Interpreter
+from pytezos.michelson.sections.parameter import ParameterSection
 from pytezos.michelson.sections.storage import StorageSection
 from pytezos.operation import DEFAULT_BURN_RESERVE, DEFAULT_GAS_RESERVE
 from pytezos.operation.content import format_mutez, format_tez
@@ -24,10 +28,26 @@ def skip_nones(**kwargs) -> dict:
 class ContractCall(ContextMixin):
     """Proxy class encapsulating a contract call: contract type scheme, contract address, parameters, and amount"""
 
-    def __init__(self, context: ExecutionContext, parameters: dict, amount: Union[int, Decimal] = 0) -> None:
+    def __init__(self,
+                 context: ExecutionContext,
+                 parameters: Optional[dict] = None,
+                 amount: Union[int, Decimal] = 0,
+                 program: Optional[Type[MichelsonProgram]] = None,
+                 parameter_value: Optional[ParameterSection] = None) -> None:
         super().__init__(context=context)
-        self.parameters = parameters
+        assert parameters is not None or parameter_value is not None, 'either parameters or parameter value is required'
+        self._parameters = parameters
+        self.parameter_value = parameter_value
         self.amount = amount
+        self.program = program
+
+    @property
+    def parameters(self) -> dict:
+        """Transaction parameters {entrypoint, value}, encoded on first access if the call was built from a typed value"""
+        if self._parameters is None:
+            assert self.parameter_value is not None
+            self._parameters = self.parameter_value.to_parameters(mode=self.context.mode)
+        return self._parameters
 
     def __repr__(self) -> str:
         res = [
@@ -48,8 +68,10 @@ class ContractCall(ContextMixin):
         """
         return ContractCall(
             context=self.context,
-            parameters=self.parameters,
+            parameters=self._parameters,
             amount=amount,
+            program=self.program,
+            parameter_value=self.parameter_value,
         )
 
     def as_transaction(self, **kwargs) -> OperationGroup:
@@ -132,6 +154,7 @@ class ContractCall(ContextMixin):
         entrypoint = self.parameters['entrypoint']
         return f'transfer {amount} from {source} to {self.address} --entrypoint \'{entrypoint}\' --arg \'{arg}\''
 
+    @try_trace
     def interpret(
         self,
         storage=None,
@@ -144,10 +167,12 @@ class ContractCall(ContextMixin):
         now=None,
         self_address=None,
         view_results: Optional[Dict[str, Any]] = None,
+        trace: Optional[bool] = None,
     ) -> ContractCallResult:
         """Run code in the builtin REPL (WARNING! Not recommended for critical tasks).
 
-        :param storage: initial storage as Python object, leave None if you want to generate a dummy one
+        :param storage: initial storage as Python object or typed `StorageSection`, leave None to start from the \
+            baseline storage (see `ContractInterface.set_baseline_storage`) or to generate a dummy one
         :param source: patch SOURCE
         :param sender: patch SENDER
         :param amount: patch AMOUNT
@@ -157,17 +182,30 @@ class ContractCall(ContextMixin):
         :param now: patch NOW
         :param self_address: patch SELF/SELF_ADDRESS
         :param view_results: patch VIEW calls (keys must be string "address%view", values => Python objects)
+        :param trace: record the execution trace, defaults to `Interpreter.trace`
         :rtype: pytezos.contract.result.ContractCallResult
         """
-        storage_ty = StorageSection.match(self.context.storage_expr)
-        if storage is None:
+        if self.program is not None:
+            storage_ty = self.program.storage
+        else:
+            storage_ty = StorageSection.match(self.context.storage_expr)
+        if isinstance(storage, StorageSection):
+            initial_storage = storage
+        elif storage is None and self.context.baseline_storage is not None:
+            initial_storage = self.context.baseline_storage
+        elif storage is None:
             initial_storage = storage_ty.dummy(self.context).to_micheline_value(lazy_diff=True)
         else:
             initial_storage = storage_ty.from_python_object(storage).to_micheline_value(lazy_diff=True)
         assert self.context.script
+        if self.parameter_value is not None and self.program is not None:
+            entrypoint, _ = self.parameter_value.get_entrypoint()
+            parameter = self.parameter_value
+        else:
+            entrypoint, parameter = self.parameters['entrypoint'], self.parameters['value']
         operations, storage, lazy_diff, stdout, error = Interpreter.run_code(
-            parameter=self.parameters['value'],
-            entrypoint=self.parameters['entrypoint'],
+            parameter=parameter,
+            entrypoint=entrypoint,
             storage=initial_storage,
             script=self.context.script['code'],
             source=source,
@@ -179,20 +217,26 @@ class ContractCall(ContextMixin):
             now=now,
             address=self_address,
             view_results=view_results,
+            program=self.program,
+            trace=trace,
         )
         if error:
             logger.debug('\n'.join(stdout))
+            if isinstance(error, MichelsonRuntimeError):
+                error.entrypoint = entrypoint
             raise error
         res = {
             'operations': operations,
             'storage': storage,
             'lazy_storage_diff': lazy_diff,
         }
-        return ContractCallResult.from_run_code(
-            res,
-            parameters=self.parameters,
-            context=self.context,
-        )
+        with profiling.phase('result'):
+            return ContractCallResult.from_run_code(
+                res,
+                parameters=parameter if isinstance(parameter, ParameterSection) else self.parameters,
+                context=self.context,
+                program=self.program,
+            )
 
     def run_code(
         self,
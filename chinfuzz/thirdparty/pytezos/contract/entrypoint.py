@@ -1,22 +1,27 @@
 from pprint import pformat
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Type, Union
 
 from pytezos.context.mixin import ContextMixin  # type: ignore
 from pytezos.context.mixin import ExecutionContext
 from pytezos.contract.call import ContractCall
 from pytezos.jupyter import get_class_docstring
 from pytezos.logging import logger
-from pytezos.michelson.micheline import MichelsonRuntimeError
+from pytezos.michelson.micheline import trace_error
 from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.program import MichelsonProgram
 from pytezos.michelson.sections.parameter import ParameterSection
 
 
 class ContractEntrypoint(ContextMixin):
     """Proxy class for spawning ContractCall instances."""
 
-    def __init__(self, context: ExecutionContext, entrypoint: str) -> None:
+    def __init__(self, context: ExecutionContext, entrypoint: str, program: Optional[Type[MichelsonProgram]] = None) -> None:
         super().__init__(context=context)
         self.entrypoint = entrypoint
+        self.program = program
+        self._encoder: Optional[Callable[[Any], ParameterSection]] = None
+        if program is not None:
+            self._encoder = program.parameter.get_encoder(entrypoint)
 
     def __repr__(self) -> str:
         res = [
@@ -46,9 +51,15 @@ class ContractEntrypoint(ContextMixin):
         else:
             py_obj = None
 
+        if self.program is None:
+            return ContractCall(
+                context=self.context,
+                parameters=self.encode(py_obj, self.context.mode),
+            )
         return ContractCall(
             context=self.context,
-            parameters=self.encode(py_obj, self.context.mode),
+            parameter_value=self.encode_value(py_obj),
+            program=self.program,
         )
 
     def decode(self, value: Union[str, Dict[str, Any]], entrypoint: Optional[str] = None) -> Dict[str, Any]:
@@ -74,9 +85,22 @@ class ContractEntrypoint(ContextMixin):
         :param mode: whether to use `readable` or `optimized` (or `legacy_optimized`) encoding
         :return: {entrypoint, value}
         """
+        return self.encode_value(py_obj).to_parameters(mode=mode or self.context.mode)
+
+    def encode_value(self, py_obj) -> ParameterSection:
+        """Convert the given Python object into the typed transaction parameters
+
+        :param py_obj: Python object
+        :rtype: ParameterSection
+        """
         try:
-            param_ty = ParameterSection.match(self.context.parameter_expr)
-            return param_ty.from_python_object({self.entrypoint: py_obj}).to_parameters(mode=mode or self.context.mode)
-        except MichelsonRuntimeError as e:
+            if self._encoder is None:
+                param_ty = ParameterSection.match(self.context.parameter_expr)
+                self._encoder = param_ty.get_encoder(self.entrypoint)
+            return self._encoder(py_obj)
+        except Exception as e:
+            error = trace_error(e)
+            if error is None:
+                raise
             logger.info(self.__doc__)
-            raise ValueError(f'Unexpected arguments: {pformat(py_obj)}', *e.args) from e
+            raise ValueError(f'Unexpected arguments: {pformat(py_obj)}', *error.args) from e
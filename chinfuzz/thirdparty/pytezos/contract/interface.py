@@ -6,7 +6,6 @@ from os.path import exists, expanduser
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 from urllib.parse import urlparse
 
-import requests
 from cached_property import cached_property  # type: ignore
 from deprecation import deprecated  # type: ignore
 
@@ -22,10 +21,10 @@ from pytezos.crypto.key import Key
 from pytezos.jupyter import get_class_docstring
 from pytezos.logging import logger
 from pytezos.michelson.format import micheline_to_michelson
-from pytezos.michelson.micheline import MichelsonRuntimeError
+from pytezos.michelson.micheline import MichelsonRuntimeError, is_traced, trace_error
 from pytezos.michelson.parse import michelson_to_micheline
 from pytezos.michelson.program import MichelsonProgram
-from pytezos.michelson.sections import ViewSection
+from pytezos.michelson.sections import StorageSection, ViewSection
 from pytezos.michelson.types import BigMapType, BytesType
 from pytezos.michelson.types.base import generate_pydoc
 from pytezos.operation.group import OperationGroup
@@ -57,7 +56,7 @@ class ContractInterface(ContextMixin):
         for entrypoint, ty in self.entrypoints.items():
             if entrypoint == 'token_metadata':
                 continue
-            attr = ContractEntrypoint(context=context, entrypoint=entrypoint)
+            attr = ContractEntrypoint(context=context, entrypoint=entrypoint, program=self.program)
             attr.__doc__ = generate_pydoc(ty, entrypoint)
             assert not hasattr(self, entrypoint), f'Entrypoint name collision {entrypoint}'
             setattr(self, entrypoint, attr)
@@ -99,6 +98,8 @@ class ContractInterface(ContextMixin):
         :param context: optional execution context
         :rtype: ContractInterface
         """
+        import requests
+
         res = requests.get(url)
         if res.status_code != 200:
             raise ValueError(f'cannot fetch `{url} {res.status_code}`', res.text)
@@ -292,6 +293,26 @@ class ContractInterface(ContextMixin):
         expr = michelson_to_micheline(source)
         self.storage_from_micheline(expr)
 
+    @property
+    def baseline_storage(self) -> Optional[StorageSection]:
+        """Typed storage registered with `set_baseline_storage`, if any"""
+        return self.context.baseline_storage
+
+    def set_baseline_storage(self, storage=None) -> StorageSection:
+        """Convert initial storage once and start every subsequent `interpret` call (without explicit storage) \
+        from a copy of it, skipping the per-call Python -> Micheline -> Michelson conversions.
+
+        :param storage: initial storage as Python object, leave None if you want to generate a dummy one
+        :returns: typed storage, can also be passed to `interpret` directly
+        """
+        storage_ty = self.program.storage
+        if storage is None:
+            expr = storage_ty.dummy(self.context).to_micheline_value(lazy_diff=True)
+        else:
+            expr = storage_ty.from_python_object(storage).to_micheline_value(lazy_diff=True)
+        self.context.baseline_storage = storage_ty.from_micheline_value(expr)
+        return self.context.baseline_storage
+
     @cached_property
     def metadata(self) -> Optional[ContractMetadata]:
         """Get TZIP-016 contract metadata, if exists
@@ -355,7 +376,9 @@ class ContractInterface(ContextMixin):
         try:
             token_metadata_url = self.storage['token_metadata'][token_id]['token_info']['']().decode()
         # FIXME: Dirty
-        except (KeyError, AssertionError):
+        except (KeyError, AssertionError) as e:
+            if is_traced(e):
+                raise trace_error(e) from e
             self._logger.info('Storage doesn\'t contain metadata URL for token %s', token_id)
             return None
 
@@ -393,11 +416,13 @@ class ContractInterface(ContextMixin):
         try:
             token_metadata_json = self.metadata.tokenMetadata(token_id).storage_view()[1]
             return ContractTokenMetadata.from_json(token_metadata_json)
-        except KeyError:
-            self._logger.info('There\'s no off-chain view named `token_metadata`')
-            return None
-        except MichelsonRuntimeError:
-            self._logger.info('Off-chain view has no token metadata for token_id %s', token_id)
+        except Exception as e:
+            if isinstance(e, MichelsonRuntimeError) or is_traced(e):
+                self._logger.info('Off-chain view has no token metadata for token_id %s', token_id)
+            elif isinstance(e, KeyError):
+                self._logger.info('There\'s no off-chain view named `token_metadata`')
+            else:
+                raise
             return None
 
     @cached_property
@@ -413,7 +438,9 @@ class ContractInterface(ContextMixin):
             else:
                 self._logger.info('Metadata big map not found')
         # FIXME: Dirty
-        except (KeyError, AssertionError):
+        except (KeyError, AssertionError) as e:
+            if is_traced(e):
+                raise trace_error(e) from e
             self._logger.info('Failed to get metadata URI')
         return None
 
@@ -4,9 +4,7 @@ from contextlib import suppress
 from os.path import dirname, join
 from typing import Any, Dict, List, Optional, Union
 
-import requests  # type: ignore
 from attr import dataclass
-from jsonschema import validate as jsonschema_validate  # type: ignore
 
 from pytezos.context.impl import ExecutionContext
 from pytezos.context.mixin import ContextMixin
@@ -157,6 +155,8 @@ class ContractMetadata(ContextMixin):
     @staticmethod
     def validate_metadata_json(metadata_json: Dict[str, Any]) -> None:
         """Validate metadata JSON with JSONSchema"""
+        from jsonschema import validate as jsonschema_validate  # type: ignore
+
         jsonschema_validate(instance=metadata_json, schema=metadata_schema)
 
     @classmethod
@@ -172,6 +172,8 @@ class ContractMetadata(ContextMixin):
     @classmethod
     def from_ipfs(cls, multihash: str, context: Optional[ExecutionContext] = None) -> 'ContractMetadata':
         """Fetch metadata from IPFS network by multihash"""
+        import requests
+
         context = context or ExecutionContext()
         metadata_json = requests.get(f'{context.ipfs_gateway}/{multihash}').json()
         return cls.from_json(metadata_json, context)
@@ -179,6 +181,8 @@ class ContractMetadata(ContextMixin):
     @classmethod
     def from_url(cls, url: str, context: Optional[ExecutionContext] = None) -> 'ContractMetadata':
         """Fetch metadata from HTTP(S) URL"""
+        import requests
+
         metadata_json = requests.get(url).json()
         return cls.from_json(metadata_json, context)
 
@@ -1,7 +1,8 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Type, Union
 
 from pytezos.context.impl import ExecutionContext  # type: ignore
 from pytezos.michelson.program import MichelsonProgram
+from pytezos.michelson.sections.parameter import ParameterSection
 from pytezos.operation.result import OperationResult
 
 
@@ -46,16 +47,23 @@ class ContractCallResult(OperationResult):
         return list(map(decode_result, results))
 
     @classmethod
-    def from_run_code(cls, response: Dict[str, Any], parameters, context: ExecutionContext) -> 'ContractCallResult':
+    def from_run_code(cls,
+                      response: Dict[str, Any],
+                      parameters: Union[Dict[str, Any], ParameterSection],
+                      context: ExecutionContext,
+                      program: Optional[Type[MichelsonProgram]] = None) -> 'ContractCallResult':
         """Parse a result of :py:meth:`pytezos.contract.call.ContractCall.run_code` execution.
 
         :param response: RPC response (JSON)
-        :param parameters: {"entrypoint": str, "value": $Micheline}
+        :param parameters: {"entrypoint": str, "value": $Micheline} or already typed parameters
         :param context: execution context
+        :param program: loaded contract program, leave None to load it from the context
         :rtype: ContractCallResult
         """
-        program = MichelsonProgram.load(context)
-        parameters = program.parameter.from_parameters(parameters)
+        if program is None:
+            program = MichelsonProgram.load(context)
+        if not isinstance(parameters, ParameterSection):
+            parameters = program.parameter.from_parameters(parameters)
         storage = program.storage.from_micheline_value(response['storage'])
         extended_storage = storage.merge_lazy_diff(response.get('lazy_storage_diff', []))
         return cls(
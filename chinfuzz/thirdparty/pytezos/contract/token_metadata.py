@@ -3,9 +3,7 @@ from datetime import datetime, time
 from os.path import dirname, join
 from typing import Any, Dict, List, Optional
 
-import requests
 from attr import dataclass
-from jsonschema import validate as jsonschema_validate  # type: ignore
 
 from pytezos.context.impl import ExecutionContext
 from pytezos.context.mixin import ContextMixin
@@ -99,6 +97,8 @@ class ContractTokenMetadata(ContextMixin):
     @staticmethod
     def validate_token_metadata_json(metadata_json: Dict[str, Any]) -> None:
         """Validate token metadata JSON with JSONSchema"""
+        from jsonschema import validate as jsonschema_validate  # type: ignore
+
         jsonschema_validate(instance=metadata_json, schema=token_metadata_schema)
 
     @classmethod
@@ -120,6 +120,8 @@ class ContractTokenMetadata(ContextMixin):
     @classmethod
     def from_ipfs(cls, multihash: str, context: Optional[ExecutionContext] = None) -> 'ContractTokenMetadata':
         """Fetch token metadata from IPFS network by multihash"""
+        import requests
+
         context = context or ExecutionContext()
         token_metadata_json = requests.get(f'{context.ipfs_gateway}/{multihash}').json()
         return cls.from_json(token_metadata_json, context)
@@ -127,6 +129,8 @@ class ContractTokenMetadata(ContextMixin):
     @classmethod
     def from_url(cls, url: str, context: Optional[ExecutionContext] = None) -> 'ContractTokenMetadata':
         """Fetch token metadata from HTTP(S) URL"""
+        import requests
+
         token_metadata_json = requests.get(url).json()
         return cls.from_json(token_metadata_json, context)
 
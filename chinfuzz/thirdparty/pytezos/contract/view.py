@@ -6,7 +6,7 @@ from pytezos.context.mixin import ContextMixin  # type: ignore
 from pytezos.contract.call import ContractCallResult, skip_nones
 from pytezos.jupyter import get_class_docstring
 from pytezos.logging import logger
-from pytezos.michelson.micheline import MichelsonRuntimeError
+from pytezos.michelson.micheline import trace_error
 from pytezos.michelson.repl import Interpreter
 from pytezos.michelson.types.base import MichelsonType, generate_pydoc
 
@@ -115,9 +115,12 @@ class ContractView(ContextMixin):
         try:
             param_ty = MichelsonType.match(self.param_ty_expr)
             param_expr = param_ty.from_python_object(py_obj).to_micheline_value()
-        except MichelsonRuntimeError as e:
+        except Exception as e:
+            error = trace_error(e)
+            if error is None:
+                raise
             logger.info(self.__doc__)
-            raise ValueError(f'Unexpected arguments: {pformat(py_obj)}', *e.args) from e
+            raise ValueError(f'Unexpected arguments: {pformat(py_obj)}', *error.args) from e
 
         return ContractViewCall(
             context=self.context,
@@ -149,9 +152,12 @@ class ContractViewCall(ContextMixin):
                 return storage_ty.dummy(self.context).to_micheline_value(lazy_diff=True)
             else:
                 return storage_ty.from_python_object(storage).to_micheline_value(lazy_diff=True)
-        except MichelsonRuntimeError as e:
+        except Exception as e:
+            error = trace_error(e)
+            if error is None:
+                raise
             logger.info(self.__doc__)
-            raise ValueError(f'Unexpected storage object: {pformat(storage)}', *e.args) from e
+            raise ValueError(f'Unexpected storage object: {pformat(storage)}', *error.args) from e
 
     def _get_storage(self, storage=None):
         if storage is None:
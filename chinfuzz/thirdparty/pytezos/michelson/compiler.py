@@ -0,0 +1,444 @@
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union, cast
+
+from pytezos.context.abstract import AbstractContext  # type: ignore
+from pytezos.michelson.instructions.adt import CarInstruction, CdrInstruction, PairInstruction, UnpairInstruction
+from pytezos.michelson.instructions.compare import CompareInstruction, compare
+from pytezos.michelson.instructions.base import MichelsonInstruction
+from pytezos.michelson.instructions.control import (DipInstruction, DipnInstruction, ExecInstruction, FailwithInstruction,
+                                                    IfConsInstruction, IfInstruction, IfLeftInstruction, IfNoneInstruction,
+                                                    IterInstruction, LambdaInstruction, LoopInstruction, LoopLeftInstruction,
+                                                    MapInstruction)
+from pytezos.michelson.instructions.stack import (DigInstruction, DropInstruction, DropnInstruction, DugInstruction, DupInstruction,
+                                                  DupnInstruction, PushInstruction, SwapInstruction)
+from pytezos.michelson import coverage, profiling
+from pytezos.michelson.gas import block_cost, consume
+from pytezos.michelson.micheline import Micheline, MichelineSequence, traced_code
+from pytezos.michelson.stack import MichelsonStack
+from pytezos.michelson.types import (BoolType, BytesType, IntType, LambdaType, ListType, MapType, MichelsonType, OptionType, OrType,
+                                    PairType, SetType, StringType)
+
+Handler = Callable[[MichelsonStack, AbstractContext], None]
+Block = Tuple[Handler, ...]
+LoopProbe = Optional[Callable[[int], None]]
+CompareProbe = Optional[Callable[[MichelsonType, MichelsonType], None]]
+
+
+def run_block(block: Block, stack: MichelsonStack, context: AbstractContext) -> None:
+    for handler in block:
+        handler(stack, context)
+
+
+def compile_block(code: Type[Micheline], probes: bool = False) -> Block:
+    """Lower instruction (or sequence) type into a flat block of pre-resolved handlers.
+
+    Constant arguments (depths, literals, nested bodies) are extracted once, the result is memoized on the type.
+    Only suitable for execution without stdout trace.
+    Every block starts with the charge of its gas cost, running out of gas raises `MichelsonOutOfGas`.
+    With `probes` the block also reports coverage (see `pytezos.michelson.coverage`), counters are allocated once per type.
+    While profiling every instruction is timed instead (see `pytezos.michelson.profiling`).
+    """
+    profiler = profiling.instruction_profiler()
+    attr = '_profiled_block' if profiler is not None else '_covered_block' if probes else '_block'
+    block = code.__dict__.get(attr)
+    if block is None:
+        if profiler is not None and code not in profiler.locations:
+            profiler.register(code)
+        steps: List[Handler] = [compile_charge(block_cost(code))]
+        for arg in code.args if issubclass(code, MichelineSequence) else [code]:
+            if issubclass(arg, MichelineSequence):
+                steps.extend(compile_block(arg, probes))
+                continue
+            if probes and issubclass(arg, FailwithInstruction):
+                steps.append(compile_probe(arg.prim))
+            handler = compile_instruction(cast(Type[MichelsonInstruction], arg), probes)
+            steps.append(handler if profiler is None else profiler.wrap(handler, arg))
+        block = tuple(steps)
+        setattr(code, attr, block)
+    return block
+
+
+def compile_charge(cost: int) -> Handler:
+    """Charge the static cost of the block every time it runs (see `pytezos.michelson.gas`)"""
+    def charge(stack: MichelsonStack, context: AbstractContext) -> None:
+        consume(cost)
+    return charge
+
+
+def compile_arm(code: Type[Micheline], probes: bool, site: str) -> Block:
+    """Compile a branch body, with probes it starts with the counter of the branch"""
+    if probes:
+        return (compile_probe(site),) + compile_block(code, probes)
+    return compile_block(code)
+
+
+def compile_probe(site: str) -> Handler:
+    idx, trace = coverage.reserve_probe(site), coverage.trace_counter
+    assert trace is not None
+
+    def probe(stack: MichelsonStack, context: AbstractContext) -> None:
+        trace(idx)
+    return probe
+
+
+def compile_loop_probe(prim: str, probes: bool) -> LoopProbe:
+    """Get a callback reporting the number of iterations of a loop, None without probes"""
+    if not probes:
+        return None
+    counters, trace, bucket = coverage.reserve_loop_probes(prim), coverage.trace_counter, coverage.loop_bucket
+    assert trace is not None
+
+    def loop_probe(count: int) -> None:
+        trace(counters[bucket(count)])
+    return loop_probe
+
+
+def compile_compare_probe(prim: str, probes: bool) -> CompareProbe:
+    """Get a callback reporting the operands of a comparison under a counter of its own, None without probes"""
+    if not probes or coverage.trace_compare is None:
+        return None
+    idx, trace = coverage.reserve_probe(prim), coverage.trace_compare
+
+    def compare_probe(a: MichelsonType, b: MichelsonType) -> None:
+        if isinstance(a, (IntType, StringType, BytesType)):
+            trace(a.value, b.value, idx)  # type: ignore
+        elif isinstance(a, PairType):
+            for x, y in zip(a.items, b.items):  # type: ignore
+                compare_probe(x, y)
+        elif isinstance(a, OptionType) and not a.is_none() and not b.is_none():  # type: ignore
+            compare_probe(a.get_some(), b.get_some())  # type: ignore
+    return compare_probe
+
+
+def compile_instruction(instr: Type[MichelsonInstruction], probes: bool = False) -> Handler:
+    compiler = next((compilers[base] for base in instr.__mro__ if base in compilers), None)
+    if compiler is not None:
+        try:
+            handler = compiler(instr, probes)
+        except Exception:
+            pass  # malformed arguments, let `execute` fail at runtime as usual
+        else:
+            # errors raised by the handler are attributed to the instruction like the ones raised by `execute`
+            traced_code[handler.__code__] = instr.prim
+            return handler
+    execute = instr.execute
+
+    def fallback(stack: MichelsonStack, context: AbstractContext) -> None:
+        execute(stack, None, context)
+    return fallback
+
+
+def compile_push(instr, probes: bool) -> Handler:
+    res_type, literal = instr.args
+    assert res_type.is_pushable()
+    res = res_type.from_literal(literal)
+
+    def push(stack: MichelsonStack, context: AbstractContext) -> None:
+        stack.push(res)
+    return push
+
+
+def compile_drop(instr, probes: bool) -> Handler:
+    def drop(stack: MichelsonStack, context: AbstractContext) -> None:
+        stack.pop1()
+    return drop
+
+
+def compile_dropn(instr, probes: bool) -> Handler:
+    count = instr.args[0].get_int()
+
+    def dropn(stack: MichelsonStack, context: AbstractContext) -> None:
+        stack.pop(count=count)
+    return dropn
+
+
+def compile_dup(instr, probes: bool) -> Handler:
+    def dup(stack: MichelsonStack, context: AbstractContext) -> None:
+        stack.push(stack.peek().duplicate())
+    return dup
+
+
+def compile_dupn(instr, probes: bool) -> Handler:
+    depth = instr.args[0].get_int() - 1
+
+    def dupn(stack: MichelsonStack, context: AbstractContext) -> None:
+        stack.protect(count=depth)
+        res = stack.peek().duplicate()
+        stack.restore(count=depth)
+        stack.push(res)
+    return dupn
+
+
+def compile_swap(instr, probes: bool) -> Handler:
+    def swap(stack: MichelsonStack, context: AbstractContext) -> None:
+        a, b = stack.pop2()
+        stack.push(a)
+        stack.push(b)
+    return swap
+
+
+def compile_dig(instr, probes: bool) -> Handler:
+    depth = instr.args[0].get_int()
+
+    def dig(stack: MichelsonStack, context: AbstractContext) -> None:
+        stack.protect(count=depth)
+        res = stack.pop1()
+        stack.restore(count=depth)
+        stack.push(res)
+    return dig
+
+
+def compile_dug(instr, probes: bool) -> Handler:
+    depth = instr.args[0].get_int()
+
+    def dug(stack: MichelsonStack, context: AbstractContext) -> None:
+        res = stack.pop1()
+        stack.protect(count=depth)
+        stack.push(res)
+        stack.restore(count=depth)
+    return dug
+
+
+def compile_compare(instr, probes: bool) -> Handler:
+    compare_probe = compile_compare_probe(instr.prim, probes)
+
+    def compare_(stack: MichelsonStack, context: AbstractContext) -> None:
+        a, b = stack.pop2()
+        a.assert_type_equal(type(b))
+        if compare_probe is not None:
+            compare_probe(a, b)
+        stack.push(IntType.from_value(compare(a, b)))
+    return compare_
+
+
+def compile_car(instr, probes: bool) -> Handler:
+    def car(stack: MichelsonStack, context: AbstractContext) -> None:
+        pair = cast(PairType, stack.pop1())
+        pair.assert_type_in(PairType)
+        stack.push(pair.items[0])
+    return car
+
+
+def compile_cdr(instr, probes: bool) -> Handler:
+    def cdr(stack: MichelsonStack, context: AbstractContext) -> None:
+        pair = cast(PairType, stack.pop1())
+        pair.assert_type_in(PairType)
+        stack.push(pair.items[1])
+    return cdr
+
+
+def compile_pair(instr, probes: bool) -> Handler:
+    def pair(stack: MichelsonStack, context: AbstractContext) -> None:
+        left, right = stack.pop2()
+        stack.push(PairType.from_comb([left, right]))
+    return pair
+
+
+def compile_unpair(instr, probes: bool) -> Handler:
+    def unpair(stack: MichelsonStack, context: AbstractContext) -> None:
+        pair = cast(PairType, stack.pop1())
+        pair.assert_type_in(PairType)
+        left, right = tuple(iter(pair))
+        stack.push(right)
+        stack.push(left)
+    return unpair
+
+
+def compile_dip(instr, probes: bool) -> Handler:
+    if issubclass(instr, DipnInstruction):
+        depth, body = instr.args[0].get_int(), compile_block(instr.args[1], probes)
+    else:
+        depth, body = 1, compile_block(instr.args[0], probes)
+
+    def dip(stack: MichelsonStack, context: AbstractContext) -> None:
+        stack.protect(count=depth)
+        run_block(body, stack, context)
+        stack.restore(count=depth)
+    return dip
+
+
+def compile_if(instr, probes: bool) -> Handler:
+    then_body, else_body = compile_arm(instr.args[0], probes, 'IF:then'), compile_arm(instr.args[1], probes, 'IF:else')
+
+    def if_(stack: MichelsonStack, context: AbstractContext) -> None:
+        cond = cast(BoolType, stack.pop1())
+        cond.assert_type_equal(BoolType)
+        run_block(then_body if bool(cond) else else_body, stack, context)
+    return if_
+
+
+def compile_if_cons(instr, probes: bool) -> Handler:
+    cons_body, nil_body = compile_arm(instr.args[0], probes, 'IF_CONS:cons'), compile_arm(instr.args[1], probes, 'IF_CONS:nil')
+
+    def if_cons(stack: MichelsonStack, context: AbstractContext) -> None:
+        lst = cast(ListType, stack.pop1())
+        lst.assert_type_in(ListType)
+        if len(lst) > 0:
+            head, tail = lst.split_head()
+            stack.push(tail)
+            stack.push(head)
+            run_block(cons_body, stack, context)
+        else:
+            run_block(nil_body, stack, context)
+    return if_cons
+
+
+def compile_if_left(instr, probes: bool) -> Handler:
+    left_body, right_body = compile_arm(instr.args[0], probes, 'IF_LEFT:left'), compile_arm(instr.args[1], probes, 'IF_LEFT:right')
+
+    def if_left(stack: MichelsonStack, context: AbstractContext) -> None:
+        or_ = cast(OrType, stack.pop1())
+        or_.assert_type_in(OrType)
+        body = left_body if or_.is_left() else right_body
+        stack.push(or_.resolve())
+        run_block(body, stack, context)
+    return if_left
+
+
+def compile_if_none(instr, probes: bool) -> Handler:
+    none_body, some_body = compile_arm(instr.args[0], probes, 'IF_NONE:none'), compile_arm(instr.args[1], probes, 'IF_NONE:some')
+
+    def if_none(stack: MichelsonStack, context: AbstractContext) -> None:
+        opt = cast(OptionType, stack.pop1())
+        opt.assert_type_in(OptionType)
+        if opt.is_none():
+            run_block(none_body, stack, context)
+        else:
+            stack.push(opt.get_some())
+            run_block(some_body, stack, context)
+    return if_none
+
+
+def compile_loop(instr, probes: bool) -> Handler:
+    body = compile_block(instr.args[0], probes)
+    loop_probe = compile_loop_probe(instr.prim, probes)
+
+    def loop(stack: MichelsonStack, context: AbstractContext) -> None:
+        count = 0
+        while True:
+            cond = cast(BoolType, stack.pop1())
+            cond.assert_type_equal(BoolType)
+            if not bool(cond):
+                break
+            run_block(body, stack, context)
+            count += 1
+        if loop_probe is not None:
+            loop_probe(count)
+    return loop
+
+
+def compile_loop_left(instr, probes: bool) -> Handler:
+    body = compile_block(instr.args[0], probes)
+    loop_probe = compile_loop_probe(instr.prim, probes)
+
+    def loop_left(stack: MichelsonStack, context: AbstractContext) -> None:
+        count = 0
+        while True:
+            or_ = cast(OrType, stack.pop1())
+            or_.assert_type_in(OrType)
+            stack.push(or_.resolve())
+            if not or_.is_left():
+                break
+            run_block(body, stack, context)
+            count += 1
+        if loop_probe is not None:
+            loop_probe(count)
+    return loop_left
+
+
+def compile_map(instr, probes: bool) -> Handler:
+    body = compile_block(instr.args[0], probes)
+    loop_probe = compile_loop_probe(instr.prim, probes)
+
+    def map_(stack: MichelsonStack, context: AbstractContext) -> None:
+        src = cast(Union[ListType, MapType], stack.pop1())
+        items = []
+        for elt in src:
+            if isinstance(src, MapType):
+                elt = PairType.from_comb(list(elt))  # type: ignore
+            stack.push(elt)  # type: ignore
+            run_block(body, stack, context)
+            new_elt = stack.pop1()
+            if isinstance(src, MapType):
+                items.append((elt[0], new_elt))
+            else:
+                items.append(new_elt)  # type: ignore
+        if items:
+            res = type(src).from_items(items)  # type: ignore
+        else:
+            res = src
+        stack.push(res)
+        if loop_probe is not None:
+            loop_probe(len(items))
+    return map_
+
+
+def compile_iter(instr, probes: bool) -> Handler:
+    body = compile_block(instr.args[0], probes)
+    loop_probe = compile_loop_probe(instr.prim, probes)
+
+    def iter_(stack: MichelsonStack, context: AbstractContext) -> None:
+        src = cast(Union[ListType, MapType, SetType], stack.pop1())
+        count = 0
+        for elt in src:
+            if isinstance(src, MapType):
+                elt = PairType.from_comb(list(elt))  # type: ignore
+            stack.push(elt)  # type: ignore
+            run_block(body, stack, context)
+            count += 1
+        if loop_probe is not None:
+            loop_probe(count)
+    return iter_
+
+
+def compile_lambda(instr, probes: bool) -> Handler:
+    res = LambdaType.create_type(args=instr.args[:2])(instr.args[2])  # type: ignore
+    if probes:
+        compile_block(instr.args[2], probes)  # picked up by EXEC, lambdas built at runtime are run without probes
+
+    def lambda_(stack: MichelsonStack, context: AbstractContext) -> None:
+        stack.push(res)
+    return lambda_
+
+
+def compile_exec(instr, probes: bool) -> Handler:
+    def exec_(stack: MichelsonStack, context: AbstractContext) -> None:
+        param, lambda_ = cast(Tuple[MichelsonType, LambdaType], stack.pop2())
+        assert isinstance(lambda_, LambdaType), f'expected lambda, got {lambda_.prim}'
+        param.assert_type_equal(lambda_.args[0])
+        lambda_stack = MichelsonStack.from_items([param])
+        block = lambda_.value.__dict__.get('_covered_block') or compile_block(lambda_.value)
+        run_block(block, lambda_stack, context)
+        res = lambda_stack.pop1()
+        res.assert_type_equal(lambda_.args[1])
+        assert len(lambda_stack) == 0, f'lambda stack is not empty {lambda_stack}'
+        stack.push(res)
+    return exec_
+
+
+compilers: Dict[Type[MichelsonInstruction], Callable[[Type[MichelsonInstruction]], Handler]] = {
+    PushInstruction: compile_push,
+    DropInstruction: compile_drop,
+    DropnInstruction: compile_dropn,
+    DupInstruction: compile_dup,
+    DupnInstruction: compile_dupn,
+    SwapInstruction: compile_swap,
+    DigInstruction: compile_dig,
+    DugInstruction: compile_dug,
+    CompareInstruction: compile_compare,
+    CarInstruction: compile_car,
+    CdrInstruction: compile_cdr,
+    PairInstruction: compile_pair,
+    UnpairInstruction: compile_unpair,
+    DipInstruction: compile_dip,
+    DipnInstruction: compile_dip,
+    IfInstruction: compile_if,
+    IfConsInstruction: compile_if_cons,
+    IfLeftInstruction: compile_if_left,
+    IfNoneInstruction: compile_if_none,
+    LoopInstruction: compile_loop,
+    LoopLeftInstruction: compile_loop_left,
+    MapInstruction: compile_map,
+    IterInstruction: compile_iter,
+    LambdaInstruction: compile_lambda,
+    ExecInstruction: compile_exec,
+}
@@ -0,0 +1,58 @@
+from typing import Any, Callable, Dict, List, Optional
+
+# iteration counts are reported in power-of-two buckets, like libFuzzer's hit counters: 0, 1, 2, 3, 4-7, 8-15, 16-127, 128+
+LOOP_BUCKETS = ['0', '1', '2', '3', '4-7', '8-15', '16-127', '128+']
+
+reserve_counter: Optional[Callable[[], int]] = None
+trace_counter: Optional[Callable[[int], None]] = None
+trace_compare: Optional[Callable[[Any, Any, int], None]] = None
+probe_sites: Dict[int, str] = {}
+
+
+def enable_coverage(reserve: Callable[[], int],
+                    trace: Callable[[int], None],
+                    trace_cmp: Optional[Callable[[Any, Any, int], None]] = None) -> None:
+    """Report coverage of the contract code compiled from now on (branch arms, loop iteration buckets, FAILWITH sites)
+
+    :param reserve: allocates a new counter and returns its index
+    :param trace: increments the counter with the given index
+    :param trace_cmp: receives the operands of every COMPARE (int, str or bytes) and the counter of its site
+    """
+    global reserve_counter, trace_counter, trace_compare
+    reserve_counter, trace_counter, trace_compare = reserve, trace, trace_cmp
+
+
+def disable_coverage() -> None:
+    global reserve_counter, trace_counter, trace_compare
+    reserve_counter, trace_counter, trace_compare = None, None, None
+
+
+def is_coverage_enabled() -> bool:
+    return reserve_counter is not None
+
+
+def reserve_probe(site: str) -> int:
+    """Allocate a counter for a code location
+
+    :param site: human readable location, e.g. `IF_LEFT:right`
+    """
+    assert reserve_counter is not None, 'coverage is not enabled'
+    idx = reserve_counter()
+    probe_sites[idx] = site
+    return idx
+
+
+def reserve_loop_probes(prim: str) -> List[int]:
+    return [reserve_probe(f'{prim}:{bucket}') for bucket in LOOP_BUCKETS]
+
+
+def loop_bucket(count: int) -> int:
+    if count < 4:
+        return count
+    if count < 8:
+        return 4
+    if count < 16:
+        return 5
+    if count < 128:
+        return 6
+    return 7
@@ -0,0 +1,97 @@
+from typing import Dict, List, Optional, Type
+
+from pytezos.michelson import coverage
+from pytezos.michelson.micheline import Micheline, MichelineSequence, MichelsonRuntimeError
+
+# hard gas limit of an operation on mainnet, in gas units
+HARD_GAS_LIMIT_PER_OPERATION = 1_040_000
+
+# Static cost of the instructions in milligas, close to the protocol's for fixed size operands.
+# Size dependent costs (COMPARE, CONCAT, PACK, map accesses, ...) are not modeled.
+DEFAULT_COST = 10
+INSTRUCTION_COSTS: Dict[str, int] = {
+    'ABS': 35, 'ADD': 35, 'SUB': 35, 'SUB_MUTEZ': 35, 'NEG': 35, 'INT': 10, 'ISNAT': 15,
+    'MUL': 100, 'EDIV': 300, 'LSL': 50, 'LSR': 50, 'AND': 20, 'OR': 20, 'XOR': 20, 'NOT': 20,
+    'COMPARE': 35, 'DIG': 20, 'DUG': 20, 'DIP': 10, 'DROP': 10, 'APPLY': 140, 'EXEC': 20,
+    'CONCAT': 100, 'SLICE': 25, 'SIZE': 15, 'PACK': 300, 'UNPACK': 300,
+    'MEM': 80, 'GET': 80, 'UPDATE': 80, 'GET_AND_UPDATE': 80,
+    'SHA256': 600, 'SHA512': 700, 'BLAKE2B': 450, 'KECCAK': 1500, 'SHA3': 1500, 'HASH_KEY': 650,
+    'CHECK_SIGNATURE': 65_000, 'PAIRING_CHECK': 450_000, 'SAPLING_VERIFY_UPDATE': 400_000, 'OPEN_CHEST': 900_000,
+    'CONTRACT': 30_000, 'VIEW': 1500, 'TRANSFER_TOKENS': 60, 'CREATE_CONTRACT': 60, 'SET_DELEGATE': 30,
+    'SPLIT_TICKET': 40, 'JOIN_TICKETS': 50,
+}
+# cost of running a sequence: a branch, a lambda, every iteration of a loop
+BLOCK_COST = 10
+# consumption is reported to the coverage counters in power-of-two buckets of milligas
+GAS_BUCKETS = 40
+
+gas_limit = HARD_GAS_LIMIT_PER_OPERATION * 1000
+remaining = gas_limit
+# highest cost charged for a single instruction in milligas, None to charge the full costs
+cost_cap: Optional[int] = None
+gas_probes: Optional[List[int]] = None
+
+
+class MichelsonOutOfGas(MichelsonRuntimeError):
+    """Raised when an execution runs out of its gas budget"""
+
+
+def set_gas_limit(limit: Optional[int], instruction_cap: Optional[int] = None) -> None:
+    """Set the budget of every execution, before the code is compiled (the cost of the blocks is computed then)
+
+    :param limit: budget in gas units, None for the hard gas limit of an operation
+    :param instruction_cap: highest cost charged for a single instruction in gas units, None to charge the full costs
+    """
+    global gas_limit, remaining, cost_cap
+    gas_limit = (HARD_GAS_LIMIT_PER_OPERATION if limit is None else limit) * 1000
+    remaining = gas_limit
+    cost_cap = None if instruction_cap is None else instruction_cap * 1000
+
+
+def reset() -> None:
+    """Start a new execution with the whole budget"""
+    global remaining
+    remaining = gas_limit
+
+
+def consume(cost: int) -> None:
+    """Charge the execution, raises MichelsonOutOfGas once the budget is exceeded
+
+    :param cost: cost in milligas
+    """
+    global remaining
+    remaining -= cost
+    if remaining < 0:
+        remaining = 0
+        raise MichelsonOutOfGas(f'out of gas: the budget of {gas_limit // 1000} gas is exhausted')
+
+
+def consumed() -> int:
+    """Milligas consumed by the current (or last) execution"""
+    return gas_limit - remaining
+
+
+def block_cost(code: Type[Micheline]) -> int:
+    """Get the static cost of running a sequence once, nested sequences are charged when they run (memoized on the type)"""
+    cached = code.__dict__.get('_gas_cost')
+    if cached is not None and cached[0] == cost_cap:
+        return cached[1]
+    cost = BLOCK_COST
+    for arg in code.args if issubclass(code, MichelineSequence) else [code]:
+        if not issubclass(arg, MichelineSequence):
+            instr_cost = INSTRUCTION_COSTS.get(arg.prim, DEFAULT_COST)  # type: ignore
+            cost += instr_cost if cost_cap is None else min(instr_cost, cost_cap)
+    setattr(code, '_gas_cost', (cost_cap, cost))
+    return cost
+
+
+def report_consumption() -> None:
+    """Report the gas consumed by the last execution to the coverage counters, so that the fuzzer keeps the costlier inputs"""
+    global gas_probes
+    if not coverage.is_coverage_enabled():
+        return
+    if gas_probes is None:
+        gas_probes = [coverage.reserve_probe(f'GAS:2^{bucket}') for bucket in range(GAS_BUCKETS)]
+    trace = coverage.trace_counter
+    assert trace is not None
+    trace(gas_probes[min(consumed().bit_length(), GAS_BUCKETS - 1)])
@@ -22,12 +22,20 @@ def format_stdout(prim: str, inputs: list, outputs: list, arg=None):
     return f'{prim}{arg} / {pop} => {push}'
 
 
+# signatures of every dispatch table seen so far => position of the matching entry by primitive names
+dispatch_tables: Dict[Tuple[Tuple[Type[Micheline], ...], ...], Dict[Tuple[str, ...], int]] = {}
+
+
 def dispatch_types(*args: Type[Micheline],
                    mapping: Dict[Tuple[Type[Micheline], ...], Tuple[Any, ...]]):
     key = tuple(arg.prim for arg in args)
-    mapping = {tuple(arg.prim for arg in k): v for k, v in mapping.items()}  # type: ignore
-    assert key in mapping, f'unexpected types `{" * ".join(key)}`'  # type: ignore
-    return mapping[key]  # type: ignore
+    signatures = tuple(mapping)
+    table = dispatch_tables.get(signatures)
+    if table is None:
+        table = {tuple(arg.prim for arg in k): i for i, k in enumerate(signatures)}  # type: ignore
+        dispatch_tables[signatures] = table
+    assert key in table, f'unexpected types `{" * ".join(key)}`'  # type: ignore
+    return list(mapping.values())[table[key]]  # type: ignore
 
 
 class MichelsonInstruction(Micheline):
@@ -70,5 +78,5 @@ class MichelsonInstruction(Micheline):
         return {k: v for k, v in expr.items() if v}
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         raise NotImplementedError
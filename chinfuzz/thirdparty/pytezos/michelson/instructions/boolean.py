@@ -1,4 +1,4 @@
-from typing import Callable, List, Tuple, Union, cast
+from typing import Callable, List, Optional, Tuple, Union, cast
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.instructions.base import MichelsonInstruction, dispatch_types, format_stdout
@@ -6,7 +6,7 @@ from pytezos.michelson.stack import MichelsonStack
 from pytezos.michelson.types import BoolType, IntType, NatType
 
 
-def execute_boolean_add(prim: str, stack: MichelsonStack, stdout: List[str], add: Callable):
+def execute_boolean_add(prim: str, stack: MichelsonStack, stdout: Optional[List[str]], add: Callable):
     a, b = cast(Tuple[Union[BoolType, NatType], ...], stack.pop2())
     res_type, convert = dispatch_types(type(a), type(b), mapping={
         (BoolType, BoolType): (BoolType, bool),
@@ -15,13 +15,14 @@ def execute_boolean_add(prim: str, stack: MichelsonStack, stdout: List[str], add
     val = add((convert(a), convert(b)))
     res = res_type.from_value(val)
     stack.push(res)
-    stdout.append(format_stdout(prim, [a, b], [res]))
+    if stdout is not None:
+        stdout.append(format_stdout(prim, [a, b], [res]))
 
 
 class OrInstruction(MichelsonInstruction, prim='OR'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         execute_boolean_add(cls.prim, stack, stdout, lambda x: x[0] | x[1])  # type: ignore
         return cls(stack_items_added=1)
 
@@ -29,7 +30,7 @@ class OrInstruction(MichelsonInstruction, prim='OR'):
 class XorInstruction(MichelsonInstruction, prim='XOR'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         execute_boolean_add(cls.prim, stack, stdout, lambda x: x[0] ^ x[1])  # type: ignore
         return cls(stack_items_added=1)
 
@@ -37,7 +38,7 @@ class XorInstruction(MichelsonInstruction, prim='XOR'):
 class AndInstruction(MichelsonInstruction, prim='AND'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         a, b = cast(Tuple[Union[BoolType, NatType, IntType], ...], stack.pop2())
         res_type, convert = dispatch_types(type(a), type(b), mapping={
             (BoolType, BoolType): (BoolType, bool),
@@ -47,14 +48,15 @@ class AndInstruction(MichelsonInstruction, prim='AND'):
         })
         res = res_type.from_value(convert(a) & convert(b))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
         return cls(stack_items_added=1)
 
 
 class NotInstruction(MichelsonInstruction, prim='NOT'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         a = cast(Union[IntType, NatType, BoolType], stack.pop1())
         res_type, convert = dispatch_types(type(a), mapping={
             (NatType,): (IntType, lambda x: ~int(x)),
@@ -63,5 +65,6 @@ class NotInstruction(MichelsonInstruction, prim='NOT'):
         })
         res = res_type.from_value(convert(a))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a], [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [a], [res]))  # type: ignore
         return cls(stack_items_added=1)
@@ -1,4 +1,4 @@
-from typing import Callable, List, cast
+from typing import Callable, List, Optional, cast
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.instructions.base import MichelsonInstruction, format_stdout
@@ -18,27 +18,29 @@ def compare(a, b) -> int:
 class CompareInstruction(MichelsonInstruction, prim='COMPARE'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         a, b = stack.pop2()
         a.assert_type_equal(type(b))
         res = IntType.from_value(compare(a, b))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
         return cls(stack_items_added=1)
 
 
-def execute_zero_compare(prim: str, stack: MichelsonStack, stdout: List[str], compare: Callable[[int], bool]):
+def execute_zero_compare(prim: str, stack: MichelsonStack, stdout: Optional[List[str]], compare: Callable[[int], bool]):
     a = cast(IntType, stack.pop1())
     a.assert_type_equal(IntType)
     res = BoolType(compare(int(a)))
     stack.push(res)
-    stdout.append(format_stdout(prim, [a], [res]))
+    if stdout is not None:
+        stdout.append(format_stdout(prim, [a], [res]))
 
 
 class EqInstruction(MichelsonInstruction, prim='EQ'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         execute_zero_compare(cls.prim, stack, stdout, lambda x: x == 0)  # type: ignore
         return cls(stack_items_added=1)
 
@@ -46,7 +48,7 @@ class EqInstruction(MichelsonInstruction, prim='EQ'):
 class GeInstruction(MichelsonInstruction, prim='GE'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         execute_zero_compare(cls.prim, stack, stdout, lambda x: x >= 0)  # type: ignore
         return cls(stack_items_added=1)
 
@@ -54,7 +56,7 @@ class GeInstruction(MichelsonInstruction, prim='GE'):
 class GtInstruction(MichelsonInstruction, prim='GT'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         execute_zero_compare(cls.prim, stack, stdout, lambda x: x > 0)  # type: ignore
         return cls(stack_items_added=1)
 
@@ -62,7 +64,7 @@ class GtInstruction(MichelsonInstruction, prim='GT'):
 class LeInstruction(MichelsonInstruction, prim='LE'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         execute_zero_compare(cls.prim, stack, stdout, lambda x: x <= 0)  # type: ignore
         return cls(stack_items_added=1)
 
@@ -70,7 +72,7 @@ class LeInstruction(MichelsonInstruction, prim='LE'):
 class LtInstruction(MichelsonInstruction, prim='LT'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         execute_zero_compare(cls.prim, stack, stdout, lambda x: x < 0)  # type: ignore
         return cls(stack_items_added=1)
 
@@ -78,6 +80,6 @@ class LtInstruction(MichelsonInstruction, prim='LT'):
 class NeqInstruction(MichelsonInstruction, prim='NEQ'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         execute_zero_compare(cls.prim, stack, stdout, lambda x: x != 0)  # type: ignore
         return cls(stack_items_added=1)
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Type, Union, cast
+from typing import List, Optional, Tuple, Type, Union, cast
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.instructions.adt import PairInstruction
@@ -9,13 +9,15 @@ from pytezos.michelson.stack import MichelsonStack
 from pytezos.michelson.types import BoolType, LambdaType, ListType, MapType, MichelsonType, OptionType, OrType, PairType, SetType
 
 
-def execute_dip(prim: str, stack: MichelsonStack, stdout: List[str],
+def execute_dip(prim: str, stack: MichelsonStack, stdout: Optional[List[str]],
                 count: int, body: Type[MichelsonInstruction], context: AbstractContext) -> MichelsonInstruction:
-    stdout.append(format_stdout(prim, [*Wildcard.n(count)], []))
+    if stdout is not None:
+        stdout.append(format_stdout(prim, [*Wildcard.n(count)], []))
     stack.protect(count=count)
     item = body.execute(stack, stdout, context=context)
     stack.restore(count=count)
-    stdout.append(format_stdout(prim, [], [*Wildcard.n(count)], count))
+    if stdout is not None:
+        stdout.append(format_stdout(prim, [], [*Wildcard.n(count)], count))
     return item
 
 
@@ -26,7 +28,7 @@ class DipnInstruction(MichelsonInstruction, prim='DIP', args_len=2):
         self.item = item
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         depth = cls.args[0].get_int()  # type: ignore
         item = execute_dip(cls.prim, stack, stdout, count=depth, body=cls.args[1], context=context)  # type: ignore
         return cls(item)
@@ -39,7 +41,7 @@ class DipInstruction(MichelsonInstruction, prim='DIP', args_len=1):
         self.item = item
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         item = execute_dip(cls.prim, stack, stdout, count=1, body=cls.args[0], context=context)  # type: ignore
         return cls(item)
 
@@ -47,11 +49,12 @@ class DipInstruction(MichelsonInstruction, prim='DIP', args_len=1):
 class LambdaInstruction(MichelsonInstruction, prim='LAMBDA', args_len=3):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         lambda_type = LambdaType.create_type(args=cls.args[:2])
         res = lambda_type(cls.args[2])  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -62,11 +65,12 @@ class ExecInstruction(MichelsonInstruction, prim='EXEC'):
         self.item = item
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         param, lambda_ = cast(Tuple[MichelsonType, LambdaType], stack.pop2())
         assert isinstance(lambda_, LambdaType), f'expected lambda, got {lambda_.prim}'
         param.assert_type_equal(lambda_.args[0])
-        stdout.append(format_stdout(cls.prim, [param, lambda_], []))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [param, lambda_], []))  # type: ignore
         lambda_stack = MichelsonStack.from_items([param])
         lambda_body = cast(MichelsonInstruction, lambda_.value)
         item = lambda_body.execute(lambda_stack, stdout, context=context)
@@ -80,7 +84,7 @@ class ExecInstruction(MichelsonInstruction, prim='EXEC'):
 class ApplyInstruction(MichelsonInstruction, prim='APPLY'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         left, lambda_ = cast(Tuple[MichelsonType, LambdaType], stack.pop2())
         lambda_.assert_type_in(LambdaType)
         lambda_.args[0].assert_type_in(PairType)
@@ -94,14 +98,15 @@ class ApplyInstruction(MichelsonInstruction, prim='APPLY'):
         ])
         res = LambdaType.create_type(args=[right_type, lambda_.args[1]])(new_value)  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [left, lambda_], [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [left, lambda_], [res]))  # type: ignore
         return cls(stack_items_added=1)
 
 
 class FailwithInstruction(MichelsonInstruction, prim='FAILWITH'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         a = stack.pop1()
         assert a.is_packable(), f'expected packable type, got {a.prim}'
         raise MichelsonRuntimeError(repr(a))
@@ -114,10 +119,11 @@ class IfInstruction(MichelsonInstruction, prim='IF', args_len=2):
         self.item = item
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         cond = cast(BoolType, stack.pop1())
         cond.assert_type_equal(BoolType)
-        stdout.append(format_stdout(cls.prim, [cond], []))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [cond], []))  # type: ignore
         branch = cls.args[0] if bool(cond) else cls.args[1]
         item = branch.execute(stack, stdout, context=context)
         return cls(item)
@@ -130,18 +136,20 @@ class IfConsInstruction(MichelsonInstruction, prim='IF_CONS', args_len=2):
         self.item = item
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         lst = cast(ListType, stack.pop1())
         lst.assert_type_in(ListType)
         if len(lst) > 0:
             head, tail = lst.split_head()
             stack.push(tail)
             stack.push(head)
-            stdout.append(format_stdout(cls.prim, [lst], [head, tail]))  # type: ignore
+            if stdout is not None:
+                stdout.append(format_stdout(cls.prim, [lst], [head, tail]))  # type: ignore
             branch = cls.args[0]
             stack_items_added = 2
         else:
-            stdout.append(format_stdout(cls.prim, [lst], []))  # type: ignore
+            if stdout is not None:
+                stdout.append(format_stdout(cls.prim, [lst], []))  # type: ignore
             branch = cls.args[1]
             stack_items_added = 0
         item = branch.execute(stack, stdout, context=context)
@@ -155,13 +163,14 @@ class IfLeftInstruction(MichelsonInstruction, prim='IF_LEFT', args_len=2):
         self.item = item
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         or_ = cast(OrType, stack.pop1())
         or_.assert_type_in(OrType)
         branch = cls.args[0] if or_.is_left() else cls.args[1]
         res = or_.resolve()
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [or_], [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [or_], [res]))  # type: ignore
         item = branch.execute(stack, stdout, context=context)
         return cls(item)
 
@@ -173,17 +182,19 @@ class IfNoneInstruction(MichelsonInstruction, prim='IF_NONE', args_len=2):
         self.item = item
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         opt = cast(OptionType, stack.pop1())
         opt.assert_type_in(OptionType)
         if opt.is_none():
             branch = cls.args[0]
-            stdout.append(format_stdout(cls.prim, [opt], []))  # type: ignore
+            if stdout is not None:
+                stdout.append(format_stdout(cls.prim, [opt], []))  # type: ignore
             stack_items_added = 0
         else:
             some = opt.get_some()
             stack.push(some)
-            stdout.append(format_stdout(cls.prim, [opt], [some]))  # type: ignore
+            if stdout is not None:
+                stdout.append(format_stdout(cls.prim, [opt], [some]))  # type: ignore
             branch = cls.args[1]
             stack_items_added = 1
         item = branch.execute(stack, stdout, context=context)
@@ -197,12 +208,13 @@ class LoopInstruction(MichelsonInstruction, prim='LOOP', args_len=1):
         self.items = items
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         items = []
         while True:
             cond = cast(BoolType, stack.pop1())
             cond.assert_type_equal(BoolType)
-            stdout.append(format_stdout(cls.prim, [cond], []))  # type: ignore
+            if stdout is not None:
+                stdout.append(format_stdout(cls.prim, [cond], []))  # type: ignore
             if bool(cond):
                 item = cls.args[0].execute(stack, stdout, context=context)
                 items.append(item)
@@ -218,7 +230,7 @@ class LoopLeftInstruction(MichelsonInstruction, prim='LOOP_LEFT', args_len=1):
         self.items = items
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         stack_items_added = 0
         items = []
         while True:
@@ -227,7 +239,8 @@ class LoopLeftInstruction(MichelsonInstruction, prim='LOOP_LEFT', args_len=1):
             var = or_.resolve()
             stack.push(var)
             stack_items_added += 1
-            stdout.append(format_stdout(cls.prim, [or_], [var]))  # type: ignore
+            if stdout is not None:
+                stdout.append(format_stdout(cls.prim, [or_], [var]))  # type: ignore
             if or_.is_left():
                 item = cls.args[0].execute(stack, stdout, context=context)
                 items.append(item)
@@ -243,7 +256,7 @@ class MapInstruction(MichelsonInstruction, prim='MAP', args_len=1):
         self.items = items
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         stack_items_added = 0
         src = cast(Union[ListType, MapType], stack.pop1())
         executions = []
@@ -254,7 +267,8 @@ class MapInstruction(MichelsonInstruction, prim='MAP', args_len=1):
                 elt = PairType.from_comb(list(elt))  # type: ignore
             stack.push(elt)  # type: ignore
             stack_items_added += 1
-            stdout.append(format_stdout(cls.prim, popped, [elt]))  # type: ignore
+            if stdout is not None:
+                stdout.append(format_stdout(cls.prim, popped, [elt]))  # type: ignore
             execution = cls.args[0].execute(stack, stdout, context=context)
             executions.append(execution)
             new_elt = stack.pop1()
@@ -270,7 +284,8 @@ class MapInstruction(MichelsonInstruction, prim='MAP', args_len=1):
             res = src  # TODO: need to deduce argument types
         stack.push(res)
         stack_items_added += 1
-        stdout.append(format_stdout(cls.prim, popped, [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, popped, [res]))  # type: ignore
         return cls(stack_items_added, executions)
 
 
@@ -281,7 +296,7 @@ class IterInstruction(MichelsonInstruction, prim='ITER', args_len=1):
         self.items = items
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         stack_items_added = 0
         src = cast(Union[ListType, MapType, SetType], stack.pop1())
         executions = []
@@ -291,7 +306,8 @@ class IterInstruction(MichelsonInstruction, prim='ITER', args_len=1):
                 elt = PairType.from_comb(list(elt))  # type: ignore
             stack_items_added += 1
             stack.push(elt)  # type: ignore
-            stdout.append(format_stdout(cls.prim, popped, [elt]))  # type: ignore
+            if stdout is not None:
+                stdout.append(format_stdout(cls.prim, popped, [elt]))  # type: ignore
             execution = cls.args[0].execute(stack, stdout, context=context)
             executions.append(execution)
             popped = []
@@ -1,13 +1,13 @@
 import re
 from contextlib import suppress
-from typing import Dict, List, Type, cast
+from typing import Dict, List, Optional, Type, cast
 
 import strict_rfc3339  # type: ignore
 
 from pytezos.context.abstract import AbstractContext
 from pytezos.context.mixin import nodes
 from pytezos.michelson.instructions.base import MichelsonInstruction, format_stdout
-from pytezos.michelson.micheline import MichelineLiteral, MichelsonRuntimeError
+from pytezos.michelson.micheline import MichelineLiteral, MichelsonRuntimeError, is_traced
 from pytezos.michelson.sections import ParameterSection, StorageSection
 from pytezos.michelson.stack import MichelsonStack
 from pytezos.michelson.types import ListType, OperationType, PairType
@@ -23,9 +23,10 @@ class DumpAllInstruction(MichelsonInstruction, prim='DUMP'):
         self.items = items
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
-        items = stack.items[:]
-        stdout.append(f'DUMP => {items}')
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
+        items = stack.items
+        if stdout is not None:
+            stdout.append(f'DUMP => {items}')
         return cls(items)
 
 
@@ -35,18 +36,18 @@ class DumpInstruction(MichelsonInstruction, prim='DUMP', args_len=1):
         self.items = items
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         literal: Type[MichelineLiteral] = cls.args[0]  # type: ignore
         count = cast(int, literal.literal)
-        count = min(count, len(stack))
-        items = stack.items[:count]
-        stdout.append(f'DUMP => {items}')
+        items = stack.dump(count) or []
+        if stdout is not None:
+            stdout.append(f'DUMP => {items}')
         return cls(items)
 
 
 class PrintInstruction(MichelsonInstruction, prim='PRINT', args_len=1):
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         literal: Type[MichelineLiteral] = cls.args[0]  # type: ignore
 
         template = literal.get_string()
@@ -54,16 +55,17 @@ class PrintInstruction(MichelsonInstruction, prim='PRINT', args_len=1):
         def format_stack_item(match):
             i = int(match.groups()[0])
             assert i < len(stack), f'requested {i}th element, got only {len(stack)} items'
-            return repr(stack.items[i])
+            return repr(stack.item(i))
 
         message = re.sub(r'{(\d+)}', format_stack_item, template)
-        stdout.append(message)
+        if stdout is not None:
+            stdout.append(message)
         return cls()
 
 
 class DebugInstruction(MichelsonInstruction, prim='DEBUG', args_len=1):
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         literal = cls.args[0]
         if issubclass(literal, (TrueLiteral, FalseLiteral)):
             debug = literal.literal
@@ -76,15 +78,15 @@ class DebugInstruction(MichelsonInstruction, prim='DEBUG', args_len=1):
 
 class DropAllInstruction(MichelsonInstruction, prim='DROP_ALL'):
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
-        stack.items = []
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
+        stack.clear()
         return cls()
 
 
 class BeginInstruction(MichelsonInstruction, prim='BEGIN', args_len=2):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         # FIXME: MichelsonProgram copypaste
         parameter_literal, storage_literal = cls.args  # type: ignore
 
@@ -103,9 +105,10 @@ class BeginInstruction(MichelsonInstruction, prim='BEGIN', args_len=2):
         parameter.attach_context(context)
         storage.attach_context(context)
         res = PairType.from_comb([parameter.item, storage.item])
-        stack.items = []
+        stack.clear()
         stack.push(res)
-        stdout.append(format_stdout(f'BEGIN %default', [], [res]))
+        if stdout is not None:
+            stdout.append(format_stdout(f'BEGIN %default', [], [res]))
         return cls(stack_items_added=1)
 
 
@@ -117,7 +120,7 @@ class CommitInstruction(MichelsonInstruction, prim='COMMIT'):
         self.result = result
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         # FIXME: MichelsonProgram copypaste
         debug, context.debug = context.debug, False  # type: ignore
 
@@ -136,7 +139,8 @@ class CommitInstruction(MichelsonInstruction, prim='COMMIT'):
         operations = ListType(items=[op for op in res.items[0]])  # type: ignore
         lazy_diff = []  # type: ignore
         storage = res.items[1].aggregate_lazy_diff(lazy_diff)
-        stdout.append(format_stdout(f'END %default', [res], []))
+        if stdout is not None:
+            stdout.append(format_stdout(f'END %default', [res], []))
 
         result = PairType.from_comb([operations, storage])
         context.debug = debug  # type: ignore
@@ -151,7 +155,7 @@ class RunInstruction(MichelsonInstruction, prim='RUN', args_len=3):
         self.result = result
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         from pytezos.michelson.program import MichelsonProgram
 
         stack.clear()
@@ -174,7 +178,7 @@ class PatchInstruction(MichelsonInstruction, prim='PATCH', args_len=1):
     allowed_primitives = ['AMOUNT', 'BALANCE', 'CHAIN_ID', 'SENDER', 'SOURCE', 'NOW']
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
 
         res_type: MichelsonType
         res_type = cls.args[0]  # type: ignore
@@ -201,7 +205,7 @@ class PatchValueInstruction(MichelsonInstruction, prim='PATCH', args_len=2):
     allowed_primitives = ['AMOUNT', 'BALANCE', 'CHAIN_ID', 'SENDER', 'SOURCE', 'NOW']
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         res_type: MichelsonType
         literal: Type[MichelineLiteral]
         res_type, literal = cls.args  # type: ignore
@@ -220,7 +224,9 @@ class PatchValueInstruction(MichelsonInstruction, prim='PATCH', args_len=2):
             try:
                 context.now = literal.get_int()  # type: ignore
             # FIXME: Why does TypeError appear to be wrapped?
-            except (TypeError, MichelsonRuntimeError):
+            except Exception as e:
+                if not isinstance(e, (TypeError, MichelsonRuntimeError)) and not is_traced(e):
+                    raise
                 context.now = int(strict_rfc3339.rfc3339_to_timestamp(literal.get_string()))  # type: ignore
         else:
             raise ValueError(f'Expected one of {cls.allowed_primitives}, got {res_type.prim}')
@@ -229,18 +235,18 @@ class PatchValueInstruction(MichelsonInstruction, prim='PATCH', args_len=2):
 
 class ResetInstruction(MichelsonInstruction, prim='RESET'):
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         context.shell = None  # type: ignore
         context.network = None  # type: ignore
         context.chain_id = None  # type: ignore
         context.big_maps = {}  # type: ignore
-        stack.items = []
+        stack.clear()
         return cls()
 
 
 class ResetValueInstruction(MichelsonInstruction, prim='RESET', args_len=1):
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         literal: Type[MichelineLiteral]
         literal = cls.args[0]  # type: ignore
 
@@ -260,7 +266,7 @@ class ResetValueInstruction(MichelsonInstruction, prim='RESET', args_len=1):
         context.network = shell  # type: ignore
         context.chain_id = context.shell.chains.main.chain_id()  # type: ignore
         context.big_maps = {}  # type: ignore
-        stack.items = []
+        stack.clear()
         return cls()
 
 
@@ -270,10 +276,11 @@ class BigMapDiffInstruction(MichelsonInstruction, prim='BIG_MAP_DIFF'):
         self.lazy_diff = lazy_diff
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         lazy_diff = []  # type: ignore
         # FIXME: AssertionError instead of informational exception
         with suppress(AssertionError):
             stack.peek().aggregate_lazy_diff(lazy_diff)
-        stdout.append(f'BIG_MAP_DIFF')
+        if stdout is not None:
+            stdout.append(f'BIG_MAP_DIFF')
         return cls(lazy_diff=lazy_diff, stack_items_added=1)
@@ -1,4 +1,4 @@
-from typing import List, Tuple, cast
+from typing import List, Optional, Tuple, cast
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.instructions.base import MichelsonInstruction, format_stdout
@@ -9,7 +9,7 @@ from pytezos.michelson.types import MichelsonType, NatType, OptionType, PairType
 class JoinTicketsInstruction(MichelsonInstruction, prim='JOIN_TICKETS'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         pair = cast(PairType, stack.pop1())
         pair.assert_type_in(PairType)
         left, right = tuple(pair)
@@ -21,27 +21,29 @@ class JoinTicketsInstruction(MichelsonInstruction, prim='JOIN_TICKETS'):
         else:
             res = OptionType.from_some(res)  # type: ignore
         stack.push(res)  # type: ignore
-        stdout.append(format_stdout(cls.prim, [pair], [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [pair], [res]))  # type: ignore
         return cls(stack_items_added=1)
 
 
 class ReadTicketInstruction(MichelsonInstruction, prim='READ_TICKET'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         ticket = cast(TicketType, stack.pop1())
         ticket.assert_type_in(TicketType)
         res = ticket.to_comb()
         stack.push(ticket)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [ticket], [res, ticket]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [ticket], [res, ticket]))  # type: ignore
         return cls(stack_items_added=2)
 
 
 class SplitTicketInstruction(MichelsonInstruction, prim='SPLIT_TICKET'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         ticket, amounts = cast(Tuple[TicketType, PairType], stack.pop2())
         ticket.assert_type_in(TicketType)
         amounts.assert_type_in(PairType)
@@ -54,18 +56,20 @@ class SplitTicketInstruction(MichelsonInstruction, prim='SPLIT_TICKET'):
         else:
             res = OptionType.from_some(PairType.from_comb(list(res)))  # type: ignore
         stack.push(res)  # type: ignore
-        stdout.append(format_stdout(cls.prim, [ticket, amounts], [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [ticket, amounts], [res]))  # type: ignore
         return cls(stack_items_added=1)
 
 
 class TicketInstruction(MichelsonInstruction, prim='TICKET'):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         item, amount = cast(Tuple[MichelsonType, NatType], stack.pop2())
         amount.assert_type_equal(NatType)
         address = context.get_self_address()
         res = TicketType.create(address, item, int(amount))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [item, amount], [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [item, amount], [res]))  # type: ignore
         return cls(stack_items_added=1)
@@ -1,5 +1,5 @@
 
-from typing import List, Type, cast
+from typing import List, Optional, Type, cast
 
 from pytezos.context.abstract import AbstractContext
 from pytezos.logging import logger
@@ -13,11 +13,11 @@ from pytezos.michelson.types.big_map import BigMapType
 class StackEltInstruction(MichelsonInstruction, prim='Stack_elt', args_len=2):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         raise RuntimeError('`Stack_elt` primitive is used only in TZT tests and cannot be executed directly')
 
     @classmethod
-    def push(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def push(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         res_type: MichelsonType
         literal: Type[MichelineLiteral]
         res_type, literal = cls.args  # type: ignore
@@ -33,10 +33,11 @@ class StackEltInstruction(MichelsonInstruction, prim='Stack_elt', args_len=2):
             raise Exception(f'`{res_type.prim}` is neither pushable nor big_map')
 
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
 
     @classmethod
-    def pull(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def pull(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         res_type: MichelsonType
         literal: Type[MichelineLiteral]
         res_type, literal = cls.args  # type: ignore
@@ -58,17 +59,18 @@ class StackEltInstruction(MichelsonInstruction, prim='Stack_elt', args_len=2):
             logger.debug('actual: %s(%s)', res.__class__.__name__, res.__dict__)
             raise Exception('Stack content is not equal to expected')
 
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
 
 
 class BigMapInstruction(MichelsonInstruction, prim='Big_map', args_len=4):
 
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         raise RuntimeError('`Big_map` primitive is used only in TZT tests and cannot be executed directly')
 
     @classmethod
-    def add(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def add(cls, stack: MichelsonStack, stdout: Optional[List[str]], context: AbstractContext):
         res_type: MichelsonType
         key_type: Type[MichelsonType]
         value_type: Type[MichelsonType]
@@ -85,4 +87,5 @@ class BigMapInstruction(MichelsonInstruction, prim='Big_map', args_len=4):
             )
         context.tzt_big_maps[big_map.ptr] = big_map  # type: ignore
 
-        stdout.append(format_stdout(cls.prim, [], [literal]))  # type: ignore
+        if stdout is not None:
+            stdout.append(format_stdout(cls.prim, [], [literal]))  # type: ignore
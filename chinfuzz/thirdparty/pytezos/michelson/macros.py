@@ -1,7 +1,7 @@
 import functools
 import re
 from collections import namedtuple
-from typing import Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 from pytezos.michelson.tags import prim_tags
 
@@ -18,6 +18,8 @@ DROP = dict(prim='DROP')
 FAIL = [[UNIT, FAILWITH]]
 
 macros = []
+# macro name => (handler, matched group): the regexps run once per macro name
+macro_handlers: Dict[str, Tuple[Callable, str]] = {}
 
 PxrNode = namedtuple('PxrNode', ['depth', 'annots', 'args', 'is_root'])
 
@@ -25,6 +27,7 @@ PxrNode = namedtuple('PxrNode', ['depth', 'annots', 'args', 'is_root'])
 def macro(regexp):
     def register_macro(func):
         macros.append((re.compile(regexp), func))
+        macro_handlers.clear()
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -56,14 +59,23 @@ def expand_macro(prim, annots, args, internal=False):
     if prim in prim_tags:
         return expr(prim=prim, annots=annots, args=args)
 
+    match = macro_handlers.get(prim)
+    if match is None:
+        match = find_macro(prim)
+        assert match is not None, f'unknown primitive `{prim}`'
+        macro_handlers[prim] = match
+    handler, group = match
+    res = handler(group, annots, args)
+    return res if internal else seq(res)
+
+
+def find_macro(prim) -> Optional[Tuple[Callable, str]]:
     for regexp, handler in macros:
         groups = regexp.findall(prim)
         if groups:
             assert len(groups) == 1
-            res = handler(groups[0], annots, args)
-            return res if internal else seq(res)
-
-    assert False, f'unknown primitive `{prim}`'
+            return handler, groups[0]
+    return None
 
 
 def get_field_annots(annots):
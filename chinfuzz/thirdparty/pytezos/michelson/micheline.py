@@ -1,5 +1,6 @@
 from functools import wraps
 from pprint import pformat
+from types import CodeType
 from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union, cast, overload
 
 from typing_extensions import Literal
@@ -9,6 +10,8 @@ from pytezos.michelson.format import micheline_to_michelson
 
 
 class MichelsonRuntimeError(Exception):
+    # entrypoint of the failed call, set by the caller once known
+    entrypoint: Optional[str] = None
 
     def format_stdout(self):
         offset, instruction = next((
@@ -20,17 +23,53 @@ class MichelsonRuntimeError(Exception):
         return f'{instruction}: {message}'
 
 
-def catch(prim, func):
+# code objects of the public Micheline methods => primitive of the class they are defined in
+traced_code: Dict[CodeType, Optional[str]] = {}
+
+
+def is_traced(e: Exception) -> bool:
+    """Check if exception handled in the current frame went through a Micheline method"""
+    tb = e.__traceback__.tb_next if e.__traceback__ else None
+    while tb is not None:
+        if tb.tb_frame.f_code in traced_code:
+            return True
+        tb = tb.tb_next
+    return False
+
+
+def trace_error(e: Exception) -> Optional[MichelsonRuntimeError]:
+    """Attribute exception handled in the current frame to the primitives it went through (outermost first).
+    Returns None for a foreign exception that never went through a Micheline method.
+    """
+    prims = []
+    traced = False
+    tb = e.__traceback__.tb_next if e.__traceback__ else None
+    while tb is not None:
+        code = tb.tb_frame.f_code
+        if code in traced_code:
+            traced = True
+            if traced_code[code]:
+                prims.append(traced_code[code])
+        tb = tb.tb_next
+    if not traced:
+        return e if isinstance(e, MichelsonRuntimeError) else None
+    error_type = type(e) if isinstance(e, MichelsonRuntimeError) else MichelsonRuntimeError  # keep MichelsonOutOfGas apart
+    error = error_type(*prims, *(e.args or (type(e).__name__,)))
+    error.__cause__, error.__suppress_context__ = e, True
+    return error
+
+
+def try_trace(func):
+    """Report errors coming out of Micheline methods as MichelsonRuntimeError"""
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            if not e.args:
-                e.args = (type(e).__name__,)
-            if prim:
-                e.args = (prim, *e.args)
-            raise MichelsonRuntimeError(*e.args) from e
+            error = trace_error(e)
+            if error is None or error is e:
+                raise
+            raise error from e
     return wrapper
 
 
@@ -41,23 +80,24 @@ def try_catch(prim):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                raise MichelsonRuntimeError(prim, *e.args) from e
+                error = trace_error(e) or e
+                error_type = type(error) if isinstance(error, MichelsonRuntimeError) else MichelsonRuntimeError
+                raise error_type(prim, *error.args) from e
         return wrapper
     return _catch
 
 
 class ErrorTrace(type):
+    """Registers public methods so that errors can be attributed to primitives without wrapping them"""
 
     def __new__(mcs, name, bases, attrs, **kwargs):
-        wrapped_attrs = {}
+        prim = kwargs.get('prim')
         for attr_name, attr in attrs.items():
-            prim = kwargs.get('prim')
-            if type(attr) in [classmethod, staticmethod] and not attr_name.startswith('_'):
-                attr = type(attr)(catch(prim, attr.__func__))
-            elif callable(attr) and not attr_name.startswith('_'):
-                attr = catch(prim, attr)
-            wrapped_attrs[attr_name] = attr
-        return type.__new__(mcs, name, bases, wrapped_attrs, **kwargs)
+            if type(attr) in [classmethod, staticmethod]:
+                attr = attr.__func__
+            if not attr_name.startswith('_') and hasattr(attr, '__code__'):
+                traced_code[attr.__code__] = prim
+        return type.__new__(mcs, name, bases, attrs, **kwargs)
 
 
 def parse_micheline_prim(prim_expr) -> Tuple[str, list, list]:
@@ -190,7 +230,8 @@ class Micheline(metaclass=ErrorTrace):
                 try:
                     return cls.create_type(args=list(map(Micheline.match, args)), annots=annots)
                 except Exception as e:
-                    raise MichelsonRuntimeError(cls.prim, *e.args) from e
+                    error = trace_error(e) or e
+                    raise MichelsonRuntimeError(cls.prim, *error.args) from e
             else:
                 literal = parse_micheline_literal(expr, {
                     'int': int,
@@ -252,16 +293,12 @@ class MichelineSequence(Micheline):
 
     @classmethod
     def execute(cls, stack, stdout, context) -> Micheline:
+        from pytezos.michelson import gas  # circular import
+
+        gas.consume(gas.block_cost(cls))
         op = []
         for arg in cls.args:
             op.append(arg.execute(stack, stdout, context))
-
-            if arg.prim=="FAILWITH":
-                print("*"*100)
-                print("Executed FAILWITH")
-                print(stdout)
-                print("*"*100)
-            
         return op
 
 
@@ -1,7 +1,8 @@
 # Inspired by https://github.com/jansorg/tezos-intellij/blob/master/grammar/michelson.bnf
 import json
+import os
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 from ply.lex import Lexer  # type: ignore
 from ply.lex import LexToken, lex
@@ -12,9 +13,25 @@ from pytezos.michelson.macros import expr as make_expr
 from pytezos.michelson.tags import prim_tags
 
 
+class Token:
+    """ Token of the hand-written tokenizer, reported like ply's LexToken in the parsing errors
+    """
+    __slots__ = ('type', 'value', 'lineno', 'lexpos')
+
+    def __init__(self, type: str, value: str, lexpos: int) -> None:
+        self.type = type
+        self.value = value
+        # like SimpleMichelsonLexer, which does not count the lines: the position is the offset in the source
+        self.lineno = 1
+        self.lexpos = lexpos
+
+    def __str__(self) -> str:
+        return f'LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})'
+
+
 class MichelsonParserError(ValueError):
 
-    def __init__(self, token: LexToken, message=None):
+    def __init__(self, token: Union[LexToken, Token], message=None):
         message = message or f'failed to parse expression {token}'
         super(MichelsonParserError, self).__init__(message)
         self.message = message
@@ -59,11 +76,31 @@ class SimpleMichelsonLexer(Lexer):
         return t
 
 
+#: parser instantiated by `MichelsonParser()`: `ply` or `fast` (the hand-written one, opt-in)
+default_parser_backend = os.environ.get('PYTEZOS_MICHELSON_PARSER', 'ply')
+
+
 class MichelsonParser(object):
-    """ Customizable Michelson parser
+    """ Customizable Michelson parser (ply LALR grammar).
+
+    `MichelsonParser(...)` itself instantiates the backend selected with `backend` (`default_parser_backend`
+    otherwise), both produce the same Micheline expressions and errors. `fast` gives a `FastMichelsonParser`, which
+    has no ply lexer and tables. Subclasses always get the ply grammar below, with their own `p_*` rules and lexer.
     """
     tokens = SimpleMichelsonLexer.tokens
 
+    def __new__(cls, *args, backend: Optional[str] = None, **kwargs):
+        if cls is MichelsonParser:
+            backend = backend or default_parser_backend
+            if backend not in parser_backends:
+                raise ValueError(f'unknown Michelson parser backend `{backend}`, expected one of {", ".join(parser_backends)}')
+            backend_cls = parser_backends[backend]
+            if not issubclass(backend_cls, MichelsonParser):
+                # __init__ is only called on instances of MichelsonParser
+                return backend_cls(*args, **kwargs)
+            cls = backend_cls
+        return super(MichelsonParser, cls).__new__(cls)
+
     def p_instr(self, p):
         '''instr : expr
                  | empty
@@ -189,12 +226,13 @@ class MichelsonParser(object):
     def p_error(self, p):
         raise MichelsonParserError(p)
 
-    def __init__(self, debug=False, write_tables=False, extra_primitives: Optional[List[str]] = None):
+    def __init__(self, debug=False, write_tables=False, extra_primitives: Optional[List[str]] = None, backend: Optional[str] = None):
         """ Initialize Michelson parser
 
-        :param debug: Verbose output
-        :param write_tables: Store PLY output
+        :param debug: Verbose output (ply only)
+        :param write_tables: Store PLY output (ply only)
         :param extra_primitives: List of words to be ignored
+        :param backend: `fast` or `ply`, `default_parser_backend` by default (`MichelsonParser(...)` only)
         """
         self.lexer = SimpleMichelsonLexer()
         self.parser = yacc(
@@ -212,9 +250,222 @@ class MichelsonParser(object):
         """
         if len(code) > 0 and code[0] == '(' and code[-1] == ')':
             code = code[1:-1]
+        return self.parse_source(code)
+
+    def parse_source(self, code):
         return self.parser.parse(code)
 
 
+class PlyMichelsonParser(MichelsonParser):
+    """ Michelson parser generated by ply (LALR), the `ply` backend of `MichelsonParser(...)`
+    """
+
+
+# The rules of SimpleMichelsonLexer in the order ply tries them (longest regular expression first), spaces and
+# comments are skipped and any other character is a token of its own, which the parser rejects
+tokenizer_re = re.compile('|'.join(f'(?P<{name}>{regexp})' for name, regexp in [
+    ('SPACE', f'[{SimpleMichelsonLexer.t_ignore}]+'),
+    ('ANNOT', SimpleMichelsonLexer.t_ANNOT),
+    ('PRIM', SimpleMichelsonLexer.t_PRIM),
+    ('STR', SimpleMichelsonLexer.t_STR),
+    ('BYTE', SimpleMichelsonLexer.t_BYTE),
+    ('MULTI_COMMENT', SimpleMichelsonLexer.t_ignore_MULTI_COMMENT),
+    ('INT', SimpleMichelsonLexer.t_INT),
+    ('COMMENT', SimpleMichelsonLexer.t_ignore_COMMENT),
+    ('LEFT_CURLY', SimpleMichelsonLexer.t_LEFT_CURLY),
+    ('LEFT_PAREN', SimpleMichelsonLexer.t_LEFT_PAREN),
+    ('RIGHT_CURLY', SimpleMichelsonLexer.t_RIGHT_CURLY),
+    ('RIGHT_PAREN', SimpleMichelsonLexer.t_RIGHT_PAREN),
+    ('SEMI', SimpleMichelsonLexer.t_SEMI),
+    ('ERROR', r'[\s\S]'),
+]), re.MULTILINE)
+skipped_tokens = {'SPACE', 'MULTI_COMMENT', 'COMMENT'}
+# Tokens allowed after an instruction, an expression and an argument. The LALR parser checks the next token before
+# reducing a rule: a string is decoded and a macro expanded only when followed by one of them
+instr_followers = {'SEMI', 'RIGHT_CURLY', '$end'}
+expr_followers = instr_followers | {'RIGHT_PAREN'}
+arg_followers = expr_followers | {'PRIM', 'INT', 'BYTE', 'STR', 'LEFT_CURLY', 'LEFT_PAREN'}
+
+
+def tokenize(code: str) -> List[Tuple[str, str, int]]:
+    """ Split Michelson source into (type, value, position) tokens, the last one is `$end`.
+
+    :param code: Michelson source
+    """
+    tokens = []
+    for match in tokenizer_re.finditer(code):
+        kind = match.lastgroup
+        if kind in skipped_tokens:
+            continue
+        value = match.group()
+        tokens.append((value if kind == 'ERROR' else kind, value, match.start()))
+    tokens.append(('$end', '', len(code)))
+    return tokens
+
+
+class FastMichelsonParser(object):
+    """ Hand-written Michelson parser: single-pass tokenizer and recursive descent over the grammar of
+    MichelsonParser, with the same results, macro expansion order and error positions.
+    Unlike ply, an unexpected end of the source raises MichelsonParserError too.
+    """
+
+    def __init__(self, debug=False, write_tables=False, extra_primitives: Optional[List[str]] = None, backend: Optional[str] = None):
+        """ Initialize Michelson parser
+
+        :param debug: ignored, for compatibility with MichelsonParser
+        :param write_tables: ignored, for compatibility with MichelsonParser
+        :param extra_primitives: List of words to be ignored
+        :param backend: ignored, for compatibility with MichelsonParser
+        """
+        self.extra_primitives = extra_primitives or []
+        self.tokens: List[Tuple[str, str, int]] = []
+        self.index = 0
+
+    def parse(self, code):
+        """ Parse Michelson source.
+
+        :param code: Michelson source
+        :returns: Micheline expression
+        """
+        if len(code) > 0 and code[0] == '(' and code[-1] == ')':
+            code = code[1:-1]
+        return self.parse_source(code)
+
+    def parse_source(self, code):
+        self.tokens = tokenize(code)
+        self.index = 0
+        try:
+            return self.parse_instr('$end')
+        except RecursionError:
+            # nested deeper than the Python stack allows, the LALR parser keeps its own stack
+            return PlyMichelsonParser(extra_primitives=self.extra_primitives).parse_source(code)
+        finally:
+            self.tokens = []
+
+    def error(self) -> MichelsonParserError:
+        kind, value, pos = self.tokens[self.index]
+        if kind == '$end':
+            return MichelsonParserError(Token(kind, value, pos), 'unexpected end of expression')
+        return MichelsonParserError(Token(kind, value, pos))
+
+    def parse_instr(self, closing: str):
+        """ instr : instr SEMI instr | expr | INT | BYTE | STR | LEFT_CURLY instr RIGHT_CURLY | empty
+        """
+        tokens = self.tokens
+        items = None  # a single instruction is not wrapped, unless followed by a semicolon
+        while True:
+            item = self.parse_item()
+            kind = tokens[self.index][0]
+            if kind == 'SEMI':
+                if items is None:
+                    items = []
+                if item is not None:
+                    items.append(item)
+                self.index += 1
+            elif kind == closing:
+                if items is None:
+                    return item
+                if item is not None:
+                    items.append(item)
+                return items
+            else:
+                raise self.error()
+
+    def parse_item(self):
+        kind, value, _ = self.tokens[self.index]
+        if kind == 'PRIM':
+            return self.parse_expr()
+        elif kind == 'INT':
+            self.index += 1
+            return {'int': value}
+        elif kind == 'BYTE':
+            self.index += 1
+            return {'bytes': value[2:]}  # strip 0x prefix
+        elif kind == 'STR':
+            self.index += 1
+            return {'string': self.parse_string(value, instr_followers)}
+        elif kind == 'LEFT_CURLY':
+            return Sequence(self.parse_block())
+        return None
+
+    def parse_string(self, value: str, followers: set) -> str:
+        if self.tokens[self.index][0] not in followers:
+            raise self.error()
+        return json.loads(value)
+
+    def parse_block(self) -> list:
+        """ LEFT_CURLY instr RIGHT_CURLY, as a list of instructions
+        """
+        self.index += 1
+        instr = self.parse_instr('RIGHT_CURLY')
+        self.index += 1
+        if type(instr) is list:
+            return instr
+        elif instr is not None:
+            return [instr]
+        return []
+
+    def parse_expr(self):
+        """ expr : PRIM annots args
+        """
+        tokens = self.tokens
+        prim_index = self.index
+        prim = tokens[prim_index][1]
+        self.index += 1
+
+        annots = []
+        while tokens[self.index][0] == 'ANNOT':
+            annots.append(tokens[self.index][1])
+            self.index += 1
+
+        args = []
+        while True:
+            kind, value, _ = tokens[self.index]
+            if kind == 'PRIM':
+                self.index += 1
+                args.append({'prim': value})
+            elif kind == 'INT':
+                self.index += 1
+                args.append({'int': value})
+            elif kind == 'BYTE':
+                self.index += 1
+                args.append({'bytes': value[2:]})
+            elif kind == 'STR':
+                self.index += 1
+                args.append({'string': self.parse_string(value, arg_followers)})
+            elif kind == 'LEFT_CURLY':
+                args.append(self.parse_block())
+            elif kind == 'LEFT_PAREN':
+                self.index += 1
+                if tokens[self.index][0] != 'PRIM':
+                    raise self.error()
+                args.append(self.parse_expr())
+                if tokens[self.index][0] != 'RIGHT_PAREN':
+                    raise self.error()
+                self.index += 1
+            else:
+                break
+
+        if kind not in expr_followers:
+            raise self.error()
+
+        if prim in prim_tags or prim in self.extra_primitives:
+            expr = make_expr(prim=prim, annots=annots, args=args)
+        else:
+            try:
+                expr = expand_macro(prim=prim, annots=annots, args=args)
+            except AssertionError as e:
+                prim_kind, prim_value, prim_pos = tokens[prim_index]
+                raise MichelsonParserError(Token(prim_kind, prim_value, prim_pos), str(e)) from e
+        return Sequence(expr) if isinstance(expr, list) else expr
+
+
+parser_backends: Dict[str, type] = {
+    'fast': FastMichelsonParser,
+    'ply': PlyMichelsonParser,
+}
+
+
 def michelson_to_micheline(data, parser=None):
     """ Converts Michelson source text into a Micheline expression.
 
@@ -0,0 +1,132 @@
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from pytezos.context.abstract import AbstractContext  # type: ignore
+from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.stack import MichelsonStack
+
+Handler = Callable[[MichelsonStack, AbstractContext], None]
+
+
+class Profiler:
+    """Per-instruction and per-phase profile of the executions: calls, inclusive and self time, self net memory.
+    The net memory is the change of the memory traced by tracemalloc over the frame, what it allocated minus what it
+    freed: it is negative for the frames releasing more than they keep (e.g. UNPAIR dropping the pair it splits).
+    Instructions are keyed by primitive and location in the code tree (`IF_LEFT@3/0/1`), phases by name (`begin`, `end`, ...).
+    """
+
+    def __init__(self, allocations: bool = True, instructions: bool = True) -> None:
+        self.allocations = allocations
+        self.instructions = instructions
+        # instruction type => location in the code tree, e.g. `3/0/1` for the 2nd instruction of the 1st branch of the 4th one
+        self.locations: Dict[Type[Micheline], str] = {}
+        # frame name => class name of the instruction (or `phase`)
+        self.kinds: Dict[str, str] = {}
+        # frame name => [calls, inclusive ns, self ns, self net bytes]
+        self.stats: Dict[str, List[int]] = {}
+        # stack of frame names => self ns, the collapsed stacks of a flamegraph
+        self.stacks: Dict[Tuple[str, ...], int] = {}
+        # running frames: [name, started ns, traced bytes at start, ns spent in children, net bytes of the children]
+        self.frames: List[list] = []
+
+    def clear(self) -> None:
+        """Forget the frames recorded so far, the compiled code keeps reporting to this profiler"""
+        self.stats.clear()
+        self.stacks.clear()
+
+    def register(self, code: Type[Micheline], location: str = '') -> None:
+        """Record the location of every instruction of a code tree"""
+        for i, arg in enumerate(code.args):
+            if isinstance(arg, type) and issubclass(arg, Micheline):
+                path = f'{location}/{i}' if location else str(i)
+                self.locations.setdefault(arg, path)
+                self.register(arg, path)
+
+    def traced(self) -> int:
+        """Memory currently traced by tracemalloc, net of what was freed"""
+        return tracemalloc.get_traced_memory()[0] if self.allocations else 0
+
+    def enter(self, name: str) -> None:
+        self.frames.append([name, time.perf_counter_ns(), self.traced(), 0, 0])
+
+    def leave(self) -> None:
+        name, started, traced, children_ns, children_bytes = self.frames.pop()
+        elapsed = time.perf_counter_ns() - started
+        size = self.traced() - traced
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = [0, 0, 0, 0]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += elapsed - children_ns
+        stats[3] += size - children_bytes
+        stack = tuple(frame[0] for frame in self.frames) + (name,)
+        self.stacks[stack] = self.stacks.get(stack, 0) + elapsed - children_ns
+        if self.frames:
+            self.frames[-1][3] += elapsed
+            self.frames[-1][4] += size
+
+    @contextmanager
+    def frame(self, name: str, kind: str = 'phase') -> Iterator[None]:
+        self.kinds.setdefault(name, kind)
+        self.enter(name)
+        try:
+            yield
+        finally:
+            self.leave()
+
+    def wrap(self, handler: Handler, instr: Type[Micheline]) -> Handler:
+        """Profile a compiled instruction under its location"""
+        name = f'{instr.prim}@{self.locations.get(instr, "?")}'
+        self.kinds.setdefault(name, instr.__name__)
+        enter, leave = self.enter, self.leave
+
+        def profiled(stack: MichelsonStack, context: AbstractContext) -> None:
+            enter(name)
+            try:
+                handler(stack, context)
+            finally:
+                leave()
+        return profiled
+
+
+profiler: Optional[Profiler] = None
+no_phase = nullcontext()
+
+
+def enable_profiling(allocations: bool = True, instructions: bool = True) -> Profiler:
+    """Profile the code compiled from now on and the phases of `Interpreter.run_code`
+
+    :param allocations: trace the net memory of every frame with tracemalloc (slows the execution down)
+    :param instructions: time every instruction, otherwise only the phases are timed and the code runs as usual
+    """
+    global profiler
+    profiler = Profiler(allocations, instructions)
+    if allocations:
+        tracemalloc.start()
+    return profiler
+
+
+def disable_profiling() -> None:
+    global profiler
+    if profiler is not None and profiler.allocations:
+        tracemalloc.stop()
+    profiler = None
+
+
+def is_profiling_enabled() -> bool:
+    return profiler is not None
+
+
+def instruction_profiler() -> Optional[Profiler]:
+    """Get the profiler the compiled instructions report to, if any"""
+    return profiler if profiler is not None and profiler.instructions else None
+
+
+def phase(name: str):
+    """Get a context manager timing a phase of the execution (a no-op unless profiling)"""
+    if profiler is None:
+        return no_phase
+    return profiler.frame(name)
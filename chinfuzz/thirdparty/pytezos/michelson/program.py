@@ -1,10 +1,15 @@
+from copy import deepcopy
 from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
 from pytezos.context.impl import ExecutionContext
 from pytezos.crypto.encoding import base58_encode
+from pytezos.michelson.compiler import compile_block, run_block
+from pytezos.michelson import gas, profiling
+from pytezos.michelson.coverage import is_coverage_enabled
 from pytezos.michelson.instructions.base import MichelsonInstruction, format_stdout
 from pytezos.michelson.instructions.tzt import BigMapInstruction, StackEltInstruction
-from pytezos.michelson.micheline import MichelineSequence, get_script_section, get_script_sections, try_catch, validate_sections
+from pytezos.michelson.micheline import (MichelineSequence, get_script_section, get_script_sections, try_catch, try_trace,
+                                        validate_sections)
 from pytezos.michelson.sections.code import CodeSection
 from pytezos.michelson.sections.parameter import ParameterSection
 from pytezos.michelson.sections.storage import StorageSection
@@ -39,6 +44,7 @@ class MichelsonProgram:
         self.storage_value = storage
 
     @staticmethod
+    @try_trace
     def load(context: ExecutionContext, with_code=False) -> Type['MichelsonProgram']:
         """Create MichelsonProgram type from filled context"""
         cls = type(
@@ -54,6 +60,7 @@ class MichelsonProgram:
         return cast(Type['MichelsonProgram'], cls)
 
     @staticmethod
+    @try_trace
     def create(sequence: Type[MichelineSequence]) -> Type['MichelsonProgram']:
         """Create MichelsonProgram type from micheline"""
         validate_sections(
@@ -77,6 +84,7 @@ class MichelsonProgram:
         return cast(Type['MichelsonProgram'], cls)
 
     @staticmethod
+    @try_trace
     def match(expr) -> Type['MichelsonProgram']:
         seq = cast(Type[MichelineSequence], MichelineSequence.match(expr))
         if not issubclass(seq, MichelineSequence):
@@ -98,8 +106,16 @@ class MichelsonProgram:
 
     @classmethod
     def instantiate(cls, entrypoint: str, parameter, storage) -> 'MichelsonProgram':
-        parameter_value = cls.parameter.from_parameters(dict(entrypoint=entrypoint, value=parameter))
-        storage_value = cls.storage.from_micheline_value(storage)
+        with profiling.phase('parameter'):
+            if isinstance(parameter, ParameterSection):
+                parameter_value = deepcopy(parameter)  # attaching context mutates big_map values
+            else:
+                parameter_value = cls.parameter.from_parameters(dict(entrypoint=entrypoint, value=parameter))
+        with profiling.phase('storage'):
+            if isinstance(storage, StorageSection):
+                storage_value = deepcopy(storage)  # only big_map/sapling_state values are copied, the rest is shared
+            else:
+                storage_value = cls.storage.from_micheline_value(storage)
         return cls(entrypoint, parameter_value, storage_value)
 
     @classmethod
@@ -111,25 +127,58 @@ class MichelsonProgram:
         return cls(name, parameter_value, storage_value)
 
     @try_catch('BEGIN')
-    def begin(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext) -> None:
+    def begin(self, stack: MichelsonStack, stdout: Optional[List[str]], context: ExecutionContext) -> None:
         """Prepare stack for contract execution"""
+        gas.reset()
         self.parameter_value.attach_context(context)
         self.storage_value.attach_context(context)
         res = PairType.from_comb([self.parameter_value.item, self.storage_value.item])
         stack.push(res)
-        stdout.append(format_stdout(f'BEGIN %{self.name}', [], [res]))
-
-    def execute(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext) -> MichelsonInstruction:
-        """Execute contract in interpreter"""
+        if stdout is not None:
+            stdout.append(format_stdout(f'BEGIN %{self.name}', [], [res]))
+
+    def execute(self, stack: MichelsonStack, stdout: Optional[List[str]], context: ExecutionContext) -> Optional[MichelsonInstruction]:
+        """Execute contract in interpreter (without trace the compiled code is run and nothing is returned)"""
+        if stdout is None:
+            try:
+                return run_block(compile_block(self.code.args[0], is_coverage_enabled()), stack, context)
+            finally:
+                gas.report_consumption()
         return cast(MichelsonInstruction, self.code.args[0].execute(stack, stdout, context))
 
-    def execute_view(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext):
+    def execute_view(self, stack: MichelsonStack, stdout: Optional[List[str]], context: ExecutionContext):
         """Execute view in interpreter"""
         view = self.get_view(self.name)
+        if stdout is None:
+            return run_block(compile_block(view.args[3], is_coverage_enabled()), stack, context)
         return cast(MichelsonInstruction, view.args[3].execute(stack, stdout, context))
 
+    @classmethod
+    def run_typed(cls, parameter: ParameterSection, storage: StorageSection, context: ExecutionContext) -> Tuple[ListType, StorageSection]:
+        """Run the contract code on typed values (without trace) and return the typed result, nothing is converted.
+        Meant for chaining calls: the storage has to be attached to the context already and the resulting storage stays attached
+        to it, so it can be passed to the next call as is.
+
+        :param parameter: typed parameter, gets attached to the context
+        :param storage: typed storage attached to the context
+        :returns: list of emitted operations and the resulting storage
+        """
+        gas.reset()
+        parameter.attach_context(context)
+        stack = MichelsonStack()
+        stack.push(PairType.from_comb([parameter.item, storage.item]))
+        try:
+            with profiling.phase('execute'):
+                run_block(compile_block(cls.code.args[0], is_coverage_enabled()), stack, context)
+        finally:
+            gas.report_consumption()
+        res = cast(PairType, stack.pop1())
+        if len(stack):
+            raise Exception(f'Stack is not empty: {repr(stack)}')
+        return res.items[0], cls.storage(res.items[1])  # type: ignore
+
     @try_catch('END')
-    def end(self, stack: MichelsonStack, stdout: List[str], output_mode='readable') -> Tuple[List[dict], Any, List[dict], PairType]:
+    def end(self, stack: MichelsonStack, stdout: Optional[List[str]], output_mode='readable') -> Tuple[List[dict], Any, List[dict], PairType]:
         """Finish contract execution"""
         res = cast(PairType, stack.pop1())
         if len(stack):
@@ -143,17 +192,19 @@ class MichelsonProgram:
         operations = [op.content for op in res.items[0]]  # type: ignore
         lazy_diff = []  # type: ignore
         storage = res.items[1].aggregate_lazy_diff(lazy_diff).to_micheline_value(mode=output_mode)
-        stdout.append(format_stdout(f'END %{self.name}', [res], []))
+        if stdout is not None:
+            stdout.append(format_stdout(f'END %{self.name}', [res], []))
         return operations, storage, lazy_diff, res
 
     @try_catch('RET')
-    def ret(self, stack: MichelsonStack, stdout: List[str], output_mode='readable') -> MichelsonType:
+    def ret(self, stack: MichelsonStack, stdout: Optional[List[str]], output_mode='readable') -> MichelsonType:
         view = self.get_view(self.name)
         res = stack.pop1()
         if len(stack):
             raise Exception(f'Stack is not empty: {repr(stack)}')
         res.assert_type_equal(view.args[2], message='view return type')
-        stdout.append(format_stdout(f'RET %{self.name}', [res], []))
+        if stdout is not None:
+            stdout.append(format_stdout(f'RET %{self.name}', [res], []))
         return view.args[2].from_micheline_value(res.to_micheline_value(mode=output_mode))
 
 
@@ -243,27 +294,27 @@ class TztMichelsonProgram:
                 prefix=b'Net',
             ).decode()
 
-    def register_bigmaps(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext) -> None:
+    def register_bigmaps(self, stack: MichelsonStack, stdout: Optional[List[str]], context: ExecutionContext) -> None:
         if self.big_maps:
             for item in self.big_maps.args[0].args[::-1]:
                 if not issubclass(item, BigMapInstruction):
                     raise Exception('Only `Big_map` instructions can be used in `big_maps` section')
                 item.add(stack, stdout, context)
 
-    def begin(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext) -> None:  # pylint: disable=no-self-use
+    def begin(self, stack: MichelsonStack, stdout: Optional[List[str]], context: ExecutionContext) -> None:  # pylint: disable=no-self-use
         """Prepare stack for contract execution"""
-
+        gas.reset()
         for item in self.input.args[0].args[::-1]:
             if issubclass(item, StackEltInstruction):
                 item.push(stack, stdout, context)
             else:
                 raise Exception('Only `Stack_elt` instructions can be used in `input` section', item)
 
-    def execute(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext) -> MichelsonInstruction:
+    def execute(self, stack: MichelsonStack, stdout: Optional[List[str]], context: ExecutionContext) -> MichelsonInstruction:
         """Execute contract in interpreter"""
         return cast(MichelsonInstruction, self.code.args[0].execute(stack, stdout, context))
 
-    def end(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext) -> None:
+    def end(self, stack: MichelsonStack, stdout: Optional[List[str]], context: ExecutionContext) -> None:
         """Finish contract execution"""
         for item in self.output.args[0].args:
             if not issubclass(item, StackEltInstruction):
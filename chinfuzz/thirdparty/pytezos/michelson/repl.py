@@ -1,10 +1,11 @@
 from copy import deepcopy
-from typing import Any, List, Optional, Tuple, cast
+from typing import Any, List, Optional, Tuple, Type, cast
 
 from attr import dataclass
 
 from pytezos.context.impl import ExecutionContext
-from pytezos.michelson.micheline import MichelineSequence, MichelsonRuntimeError
+from pytezos.michelson import gas, profiling
+from pytezos.michelson.micheline import MichelineSequence, trace_error, try_trace
 from pytezos.michelson.parse import MichelsonParser, MichelsonParserError, michelson_to_micheline
 from pytezos.michelson.program import MichelsonProgram, TztMichelsonProgram
 from pytezos.michelson.sections import CodeSection
@@ -30,6 +31,9 @@ class Interpreter:
     Based on the following reference: https://tezos.gitlab.io/michelson-reference/
     """
 
+    #: default for `run_code`: record the human-readable execution trace (stdout)
+    trace = True
+
     def __init__(
         self,
         extra_primitives: Optional[List[str]] = None,
@@ -50,18 +54,22 @@ class Interpreter:
         context_backup = deepcopy(self.context)
 
         try:
+            gas.reset()
             code_section = CodeSection.match(michelson_to_micheline(code))
             instructions = code_section.args[0].execute(self.stack, result.stdout, self.context)
             result.instructions = MichelineSequence([instructions])
             result.stack = self.stack
-        except (MichelsonParserError, MichelsonRuntimeError) as e:
-            if self.context.debug:
+        except Exception as e:
+            error = e if isinstance(e, MichelsonParserError) else trace_error(e)
+            if error is None:
                 raise
+            if self.context.debug:
+                raise error
 
             self.stack = stack_backup
             self.context = context_backup
-            result.stdout.append(e.format_stdout())
-            result.error = e
+            result.stdout.append(error.format_stdout())
+            result.error = error
 
         return result
 
@@ -83,12 +91,14 @@ class Interpreter:
         sender=None,
         balance=None,
         block_id=None,
+        program: Optional[Type[MichelsonProgram]] = None,
+        trace: Optional[bool] = None,
         **kwargs,
     ) -> Tuple[List[dict], Any, List[dict], List[str], Optional[Exception]]:
         """Execute contract in interpreter
 
-        :param parameter: parameter expression
-        :param storage: storage expression
+        :param parameter: parameter expression or already typed parameter (`ParameterSection` instance)
+        :param storage: storage expression or already typed storage (`StorageSection` instance)
         :param script: contract's Michelson code
         :param entrypoint: contract entrypoint
         :param output_mode: one of readable/optimized/legacy_optimized
@@ -98,6 +108,8 @@ class Interpreter:
         :param sender: patch SENDER
         :param balance: patch BALANCE
         :param block_id: set block ID
+        :param program: already loaded program type for this script, skips parsing the code again
+        :param trace: record the execution trace (defaults to `Interpreter.trace`), otherwise stdout only holds the error
         """
         context = ExecutionContext(
             amount=amount,
@@ -109,22 +121,33 @@ class Interpreter:
             script=dict(code=script, storage=storage),
             **kwargs,
         )
+        if trace is None:
+            trace = Interpreter.trace
         stack = MichelsonStack()
-        stdout = []  # type: ignore
+        stdout: Optional[List[str]] = [] if trace else None
         try:
-            program = MichelsonProgram.load(context, with_code=True)
+            if program is None:
+                with profiling.phase('load'):
+                    program = MichelsonProgram.load(context, with_code=True)
             res = program.instantiate(
                 entrypoint=entrypoint,
                 parameter=parameter,
                 storage=storage,
             )
-            res.begin(stack, stdout, context)
-            res.execute(stack, stdout, context)
-            operations, storage, lazy_diff, _ = res.end(stack, stdout, output_mode=output_mode)
-            return operations, storage, lazy_diff, stdout, None
-        except MichelsonRuntimeError as e:
-            stdout.append(e.format_stdout())
-            return [], None, [], stdout, e
+            with profiling.phase('begin'):
+                res.begin(stack, stdout, context)
+            with profiling.phase('execute'):
+                res.execute(stack, stdout, context)
+            with profiling.phase('end'):
+                operations, storage, lazy_diff, _ = res.end(stack, stdout, output_mode=output_mode)
+            return operations, storage, lazy_diff, stdout or [], None
+        except Exception as e:
+            error = trace_error(e)
+            if error is None:
+                raise
+            stdout = stdout or []
+            stdout.append(error.format_stdout())
+            return [], None, [], stdout, error
 
     @staticmethod
     def run_callback(
@@ -166,9 +189,12 @@ class Interpreter:
             # Re-parsing using the contract's storage section here to recover the annotations.
             storage = program.storage.from_micheline_value(storage.to_micheline_value())
             return [op.to_python_object() for op in operations], storage.to_python_object(), stdout, None
-        except MichelsonRuntimeError as e:
-            stdout.append(e.format_stdout())
-            return None, None, stdout, e
+        except Exception as e:
+            error = trace_error(e)
+            if error is None:
+                raise
+            stdout.append(error.format_stdout())
+            return None, None, stdout, error
 
     @staticmethod
     def run_view(name: str, parameter, storage, context: ExecutionContext) -> Tuple[Any, Any, Optional[Exception]]:
@@ -189,11 +215,15 @@ class Interpreter:
             res.execute_view(stack, stdout, context)
             ret_value = res.ret(stack, stdout)
             return ret_value.to_python_object(), stdout, None
-        except MichelsonRuntimeError as e:
-            stdout.append(e.format_stdout())
-            return None, stdout, e
+        except Exception as e:
+            error = trace_error(e)
+            if error is None:
+                raise
+            stdout.append(error.format_stdout())
+            return None, stdout, error
 
     @staticmethod
+    @try_trace
     def run_tzt(
         script: str,
         amount=None,
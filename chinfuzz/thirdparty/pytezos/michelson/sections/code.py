@@ -1,4 +1,4 @@
-from typing import List, Type
+from typing import List, Optional, Type
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.micheline import Micheline
@@ -14,6 +14,7 @@ class CodeSection(Micheline, prim='code', args_len=1):
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_code_expr(cls.as_micheline_expr())
-        stdout.append(f'code: updated')
+        if stdout is not None:
+            stdout.append(f'code: updated')
@@ -1,7 +1,7 @@
-from typing import Any, Dict, List, Optional, Type, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, cast
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
-from pytezos.michelson.micheline import Micheline, MichelsonRuntimeError
+from pytezos.michelson.micheline import Micheline, MichelsonRuntimeError, trace_error, traced_code
 from pytezos.michelson.types import OrType
 from pytezos.michelson.types.adt import wrap_or, wrap_parameters
 from pytezos.michelson.types.base import MichelsonType, parse_name
@@ -26,7 +26,8 @@ class ParameterSection(Micheline, prim='parameter', args_len=1):
             if not issubclass(cls, ParameterSection):
                 cls = ParameterSection.create_type(args=[cls])
         except Exception as e:
-            raise MichelsonRuntimeError('parameter', *e.args) from e
+            error = trace_error(e) or e
+            raise MichelsonRuntimeError('parameter', *error.args) from e
         return cls
 
     @classmethod
@@ -50,9 +51,10 @@ class ParameterSection(Micheline, prim='parameter', args_len=1):
         return cast(Type['ParameterSection'], res)
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_parameter_expr(cls.as_micheline_expr())
-        stdout.append(f'parameter: updated')
+        if stdout is not None:
+            stdout.append(f'parameter: updated')
 
     @classmethod
     def list_entrypoints(cls) -> Dict[str, Type[MichelsonType]]:
@@ -85,12 +87,16 @@ class ParameterSection(Micheline, prim='parameter', args_len=1):
             item = root_type.from_micheline_value(val_expr)
             return cls(item)
 
-    def to_parameters(self, mode='readable') -> Dict[str, Any]:
+    def get_entrypoint(self) -> Tuple[str, MichelsonType]:
         entrypoint, item = self.root_name, self.item
         if isinstance(self.item, OrType):
             flat_values = self.item.get_flat_values(entrypoints=True)
             assert isinstance(flat_values, dict) and len(flat_values) == 1, f'expected named type'
             entrypoint, item = next(iter(flat_values.items()))
+        return entrypoint, item
+
+    def to_parameters(self, mode='readable') -> Dict[str, Any]:
+        entrypoint, item = self.get_entrypoint()
         return {'entrypoint': entrypoint,
                 'value': item.to_micheline_value(mode=mode, lazy_diff=None)}
 
@@ -129,6 +135,28 @@ class ParameterSection(Micheline, prim='parameter', args_len=1):
 
         return cls(item)
 
+    @classmethod
+    def get_encoder(cls, entrypoint: str) -> Callable[[Any], 'ParameterSection']:
+        """Get a converter of the entrypoint arguments (Python object) into the typed parameter value,
+        the entrypoint path is resolved once so that it can be reused across calls.
+
+        :param entrypoint: entrypoint name
+        """
+        root_type = cls.args[0]
+        path: Optional[str] = ''
+        if entrypoint != cls.root_name:
+            path = None
+            if issubclass(root_type, OrType):
+                _, key_to_path, _ = root_type.get_type_layout(infer_names=True, entrypoints=True)
+                path = key_to_path.get(entrypoint) if key_to_path else None
+        if path is None:
+            return lambda py_obj: cls.from_python_object({entrypoint: py_obj})
+
+        def encode(py_obj) -> 'ParameterSection':
+            return cls(root_type.from_python_object(wrap_or(py_obj, path)))
+        traced_code[encode.__code__] = cls.prim
+        return encode
+
     def to_micheline_value(self, mode='readable', lazy_diff=None):
         return self.item.to_micheline_value(mode=mode, lazy_diff=None)
 
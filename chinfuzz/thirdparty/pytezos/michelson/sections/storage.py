@@ -1,7 +1,7 @@
-from typing import List, Type
+from typing import List, Optional, Type
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
-from pytezos.michelson.micheline import Micheline, MichelsonRuntimeError
+from pytezos.michelson.micheline import Micheline, MichelsonRuntimeError, trace_error
 from pytezos.michelson.types import *
 
 
@@ -23,13 +23,15 @@ class StorageSection(Micheline, prim='storage', args_len=1):
                 cls = StorageSection.create_type(args=[cls])
             assert cls.args[0].field_name is None, f'argument type cannot be annotated: %{cls.args[0].field_name}'  # type: ignore
         except Exception as e:
-            raise MichelsonRuntimeError('storage', *e.args) from e
+            error = trace_error(e) or e
+            raise MichelsonRuntimeError('storage', *error.args) from e
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_storage_expr(cls.as_micheline_expr())
-        stdout.append('storage: updated')
+        if stdout is not None:
+            stdout.append('storage: updated')
 
     @classmethod
     def generate_pydoc(cls) -> str:
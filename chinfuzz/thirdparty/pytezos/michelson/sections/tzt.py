@@ -1,4 +1,4 @@
-from typing import List, Type
+from typing import List, Optional, Type
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.micheline import Micheline
@@ -15,9 +15,10 @@ class InputSection(Micheline, prim='input', args_len=1):
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_input_expr(cls.as_micheline_expr())
-        stdout.append('input: updated')
+        if stdout is not None:
+            stdout.append('input: updated')
 
 
 # FIXME: CodeSection copypaste
@@ -31,9 +32,10 @@ class OutputSection(Micheline, prim='output', args_len=1):
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_output_expr(cls.as_micheline_expr())
-        stdout.append('output: updated')
+        if stdout is not None:
+            stdout.append('output: updated')
 
 
 # FIXME: CodeSection copypaste
@@ -47,9 +49,10 @@ class SenderSection(Micheline, prim='sender', args_len=1):
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_sender_expr(cls.as_micheline_expr())
-        stdout.append('sender: updated')
+        if stdout is not None:
+            stdout.append('sender: updated')
 
 # FIXME: CodeSection copypaste
 class BalanceSection(Micheline, prim='balance', args_len=1):
@@ -62,9 +65,10 @@ class BalanceSection(Micheline, prim='balance', args_len=1):
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_balance_expr(cls.as_micheline_expr())
-        stdout.append('balance: updated')
+        if stdout is not None:
+            stdout.append('balance: updated')
 
 # FIXME: CodeSection copypaste
 class AmountSection(Micheline, prim='amount', args_len=1):
@@ -77,9 +81,10 @@ class AmountSection(Micheline, prim='amount', args_len=1):
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_amount_expr(cls.as_micheline_expr())
-        stdout.append('amount: updated')
+        if stdout is not None:
+            stdout.append('amount: updated')
 
 
 # FIXME: CodeSection copypaste
@@ -93,9 +98,10 @@ class SelfSection(Micheline, prim='self', args_len=1):
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_self_expr(cls.as_micheline_expr())
-        stdout.append('self: updated')
+        if stdout is not None:
+            stdout.append('self: updated')
 
 
 # FIXME: CodeSection copypaste
@@ -109,9 +115,10 @@ class NowSection(Micheline, prim='now', args_len=1):
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_now_expr(cls.as_micheline_expr())
-        stdout.append('now: updated')
+        if stdout is not None:
+            stdout.append('now: updated')
 
 
 # FIXME: CodeSection copypaste
@@ -125,9 +132,10 @@ class SourceSection(Micheline, prim='source', args_len=1):
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_source_expr(cls.as_micheline_expr())
-        stdout.append('source: updated')
+        if stdout is not None:
+            stdout.append('source: updated')
 
 
 # FIXME: CodeSection copypaste
@@ -141,9 +149,10 @@ class ChainIdSection(Micheline, prim='chain_id', args_len=1):
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_chain_id_expr(cls.as_micheline_expr())
-        stdout.append('chain_id: updated')
+        if stdout is not None:
+            stdout.append('chain_id: updated')
 
 
 # FIXME: CodeSection copypaste
@@ -157,6 +166,7 @@ class BigMapsSection(Micheline, prim='big_maps', args_len=1):
         return cls  # type: ignore
 
     @classmethod
-    def execute(cls, stack, stdout: List[str], context: AbstractContext):
+    def execute(cls, stack, stdout: Optional[List[str]], context: AbstractContext):
         context.set_big_maps_expr(cls.as_micheline_expr())
-        stdout.append('big_maps: updated')
\ No newline at end of file
+        if stdout is not None:
+            stdout.append('big_maps: updated')
\ No newline at end of file
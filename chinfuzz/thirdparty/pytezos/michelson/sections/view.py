@@ -1,7 +1,7 @@
 from typing import Any, List, Optional, Type, Union, cast
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
-from pytezos.michelson.micheline import Micheline, MichelineLiteral, MichelsonRuntimeError
+from pytezos.michelson.micheline import Micheline, MichelineLiteral, MichelsonRuntimeError, trace_error
 from pytezos.michelson.types.base import MichelsonType
 
 
@@ -26,7 +26,8 @@ class ViewSection(Micheline, prim='view', args_len=4):
             if not issubclass(cls, ViewSection):
                 cls = ViewSection.create_type(args=[cls])
         except Exception as e:
-            raise MichelsonRuntimeError('view', *e.args) from e
+            error = trace_error(e) or e
+            raise MichelsonRuntimeError('view', *error.args) from e
         return cls
 
     @classmethod
@@ -5,17 +5,31 @@ from pytezos.michelson.types.base import MichelsonType
 
 
 class MichelsonStack:
+    """Michelson stack, the top is the last element of the backing list
+    and the protected items (hidden by DIP and friends) are counted from the top."""
+
     def __init__(self, items: Optional[List[MichelsonType]] = None) -> None:
-        self.items = items or []
+        self._items = items[::-1] if items else []
         self.protected = 0
 
     @classmethod
     def from_items(cls, items: List[MichelsonType]) -> 'MichelsonStack':
         return cls(items)
 
+    @property
+    def items(self) -> List[MichelsonType]:
+        """Copy of the stack items, top first"""
+        return self._items[::-1]
+
+    def item(self, index: int) -> MichelsonType:
+        """Item at the given depth, 0 being the top (protected items included), without copying the stack"""
+        if not 0 <= index < len(self._items):
+            raise IndexError('list index out of range')
+        return self._items[-1 - index]
+
     def protect(self, count: int) -> None:
-        if len(self.items) < count:
-            raise Exception(f'got {len(self.items)} items on the stack, want to protect {count}')
+        if len(self._items) < count:
+            raise Exception(f'got {len(self._items)} items on the stack, want to protect {count}')
         self.protected += count
 
     def restore(self, count: int) -> None:
@@ -24,42 +38,63 @@ class MichelsonStack:
         self.protected -= count
 
     def push(self, item: MichelsonType):
-        self.items.insert(self.protected, item)
+        if self.protected:
+            self._items.insert(max(len(self._items) - self.protected, 0), item)
+        else:
+            self._items.append(item)
 
     def peek(self) -> MichelsonType:
-        if not self.items:
+        if not self._items:
             raise Exception('stack is empty')
-        return self.items[self.protected]
+        index = len(self._items) - self.protected - 1
+        if index < 0:
+            raise IndexError('list index out of range')
+        return self._items[index]
 
     def pop(self, count: int) -> List[MichelsonType]:
-        if len(self.items) - self.protected < count:
-            raise Exception(f'got {len(self.items) - self.protected} items on the stack, want to pop {count}')
-        return [self.items.pop(self.protected) for _ in range(count)]
+        end = len(self._items) - self.protected
+        if end < count:
+            raise Exception(f'got {end} items on the stack, want to pop {count}')
+        res = self._items[end - count:end]
+        del self._items[end - count:end]
+        res.reverse()
+        return res
 
     def pop1(self) -> MichelsonType:
-        (a,) = self.pop(count=1)
-        return a
+        end = len(self._items) - self.protected
+        if end < 1:
+            raise Exception(f'got {end} items on the stack, want to pop 1')
+        return self._items.pop(end - 1)
 
     def pop2(self) -> Tuple[MichelsonType, MichelsonType]:
-        a, b = self.pop(count=2)
+        end = len(self._items) - self.protected
+        if end < 2:
+            raise Exception(f'got {end} items on the stack, want to pop 2')
+        a = self._items.pop(end - 1)
+        b = self._items.pop(end - 2)
         return a, b
 
     def pop3(self) -> Tuple[MichelsonType, MichelsonType, MichelsonType]:
-        a, b, c = self.pop(count=3)
+        end = len(self._items) - self.protected
+        if end < 3:
+            raise Exception(f'got {end} items on the stack, want to pop 3')
+        a = self._items.pop(end - 1)
+        b = self._items.pop(end - 2)
+        c = self._items.pop(end - 3)
         return a, b, c
 
     def clear(self) -> None:
-        self.items.clear()
+        self._items.clear()
         self.protected = 0
 
     def dump(self, count: int) -> Optional[List[MichelsonType]]:
-        if not self.items:
+        if not self._items:
             return None
-        count = min(count, len(self.items))
-        return self.items[:count]
+        count = min(count, len(self._items))
+        return self._items[len(self._items) - count:][::-1]
 
     def __len__(self) -> int:
-        return len(self.items)
+        return len(self._items)
 
     def __repr__(self) -> str:
         return pformat(self.items)
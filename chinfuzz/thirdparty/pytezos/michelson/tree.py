@@ -0,0 +1,144 @@
+from typing import Any, Generator, Iterable, List, Optional, Tuple
+
+# node layout: (key, value, left, right, height), empty subtree is None
+Node = Optional[tuple]
+
+missing = object()
+
+
+def height(node: Node) -> int:
+    return node[4] if node else 0
+
+
+def make_node(key, val, left: Node, right: Node) -> tuple:
+    return key, val, left, right, max(height(left), height(right)) + 1
+
+
+def balance(key, val, left: Node, right: Node) -> tuple:
+    hl, hr = height(left), height(right)
+    if hl > hr + 1:
+        lk, lv, ll, lr, _ = left  # type: ignore
+        if height(ll) >= height(lr):
+            return make_node(lk, lv, ll, make_node(key, val, lr, right))
+        lrk, lrv, lrl, lrr, _ = lr  # type: ignore
+        return make_node(lrk, lrv, make_node(lk, lv, ll, lrl), make_node(key, val, lrr, right))
+    if hr > hl + 1:
+        rk, rv, rl, rr, _ = right  # type: ignore
+        if height(rr) >= height(rl):
+            return make_node(rk, rv, make_node(key, val, left, rl), rr)
+        rlk, rlv, rll, rlr, _ = rl  # type: ignore
+        return make_node(rlk, rlv, make_node(key, val, left, rll), make_node(rk, rv, rlr, rr))
+    return key, val, left, right, max(hl, hr) + 1
+
+
+def build(items: List[Tuple[Any, Any]], lo: int, hi: int) -> Node:
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    left, right = build(items, lo, mid), build(items, mid + 1, hi)
+    key, val = items[mid]
+    return make_node(key, val, left, right)
+
+
+def insert(node: Node, key, val) -> Tuple[tuple, bool]:
+    if node is None:
+        return (key, val, None, None, 1), True
+    k, v, left, right, h = node
+    if key < k:
+        left, added = insert(left, key, val)
+        return balance(k, v, left, right), added
+    if k < key:
+        right, added = insert(right, key, val)
+        return balance(k, v, left, right), added
+    return (k, val, left, right, h), False
+
+
+def pop_min(node: tuple) -> Tuple[Node, Tuple[Any, Any]]:
+    k, v, left, right, _ = node
+    if left is None:
+        return right, (k, v)
+    left, item = pop_min(left)
+    return balance(k, v, left, right), item
+
+
+def delete(node: Node, key) -> Tuple[Node, bool]:
+    if node is None:
+        return None, False
+    k, v, left, right, _ = node
+    if key < k:
+        left, removed = delete(left, key)
+        return (balance(k, v, left, right), True) if removed else (node, False)
+    if k < key:
+        right, removed = delete(right, key)
+        return (balance(k, v, left, right), True) if removed else (node, False)
+    if left is None:
+        return right, True
+    if right is None:
+        return left, True
+    right, (mk, mv) = pop_min(right)
+    return balance(mk, mv, left, right), True
+
+
+class SortedTree:
+    """Immutable mapping ordered by key (AVL tree), updates return a new tree sharing the untouched nodes.
+    Keys are only compared with `<`, lookups and updates are O(log n).
+    """
+    __slots__ = ('root', 'size')
+
+    def __init__(self, root: Node = None, size: int = 0):
+        self.root = root
+        self.size = size
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[Any, Any]]) -> 'SortedTree':
+        items = list(items)
+        if all(a[0] < b[0] for a, b in zip(items, items[1:])):
+            return cls(build(items, 0, len(items)), len(items))
+        tree = cls()
+        for key, val in items:
+            tree = tree.set(key, val)
+        return tree
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[Any]) -> 'SortedTree':
+        return cls.from_items((key, None) for key in keys)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Generator[Tuple[Any, Any], None, None]:
+        stack: List[tuple] = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node[2]
+            node = stack.pop()
+            yield node[0], node[1]
+            node = node[3]
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, missing) is not missing
+
+    def keys(self) -> Generator[Any, None, None]:
+        for key, _ in self:
+            yield key
+
+    def get(self, key, default=None):
+        node = self.root
+        while node is not None:
+            if key < node[0]:
+                node = node[2]
+            elif node[0] < key:
+                node = node[3]
+            else:
+                return node[1]
+        return default
+
+    def set(self, key, val) -> 'SortedTree':
+        root, added = insert(self.root, key, val)
+        return SortedTree(root, self.size + 1 if added else self.size)
+
+    def remove(self, key) -> 'SortedTree':
+        root, removed = delete(self.root, key)
+        return SortedTree(root, self.size - 1) if removed else self
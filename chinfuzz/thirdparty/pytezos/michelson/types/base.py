@@ -68,6 +68,16 @@ class MichelsonType(Micheline):
     def __getitem__(self, key):
         assert False, f'forbidden'
 
+    def __deepcopy__(self, memodict=None):
+        if self.is_immutable():
+            return self
+        if memodict is None:
+            memodict = {}
+        res = type(self).__new__(type(self))
+        memodict[id(self)] = res
+        res.__dict__.update(deepcopy(self.__dict__, memodict))
+        return res
+
     @staticmethod
     def match(expr) -> Type['MichelsonType']:
         return cast(Type['MichelsonType'], Micheline.match(expr))
@@ -163,6 +173,22 @@ class MichelsonType(Micheline):
             return True
         return all(map(lambda x: x.is_duplicable(), cls.args))
 
+    @classmethod
+    def is_immutable(cls):
+        """Values of this type are never changed in place once created, so they can be shared instead of copied.
+        The only in-place mutation is `attach_context` on big_map and sapling_state values.
+        """
+        res = cls.__dict__.get('_immutable')
+        if res is None:
+            if cls.prim in ['big_map', 'sapling_state']:
+                res = False
+            elif cls.prim in ['lambda', 'sapling_transaction']:
+                res = True
+            else:
+                res = all(map(lambda x: x.is_immutable(), cls.args))
+            setattr(cls, '_immutable', res)
+        return res
+
     @classmethod
     def is_big_map_friendly(cls):
         if cls.prim in ['big_map', 'operation', 'sapling_state']:
@@ -236,8 +262,9 @@ class MichelsonType(Micheline):
         return b'\x05' + data
 
     def duplicate(self):
+        """Share immutable values, copy the ones that can be attached to a context (copy-on-write)"""
         assert self.is_duplicable(), f'{self.prim} is not duplicable'
-        return deepcopy(self)
+        return self if self.is_immutable() else deepcopy(self)
 
 
 def generate_pydoc(ty: Type[MichelsonType], title=None):
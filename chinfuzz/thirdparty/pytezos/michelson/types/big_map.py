@@ -1,9 +1,10 @@
-from copy import copy, deepcopy
+from copy import copy
 from typing import Callable, Generator, List, Optional, Tuple, Type, Union
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.forge import forge_script_expr
 from pytezos.michelson.micheline import Micheline, MichelineLiteral, MichelineSequence, parse_micheline_literal
+from pytezos.michelson.tree import SortedTree
 from pytezos.michelson.types.base import MichelsonType, Undefined
 from pytezos.michelson.types.map import EltLiteral, MapType
 
@@ -37,20 +38,27 @@ def big_map_diff_to_lazy_diff(big_map_diff: List[dict]):
 class BigMapType(MapType, prim='big_map', args_len=2):
 
     def __init__(self,
-                 items: List[Tuple[MichelsonType, MichelsonType]],
+                 items: Union[List[Tuple[MichelsonType, MichelsonType]], SortedTree],
                  ptr: Optional[int] = None,
-                 removed_keys: Optional[List[MichelsonType]] = None):
+                 removed_keys: Union[List[MichelsonType], SortedTree, None] = None):
         super(BigMapType, self).__init__(items=items)
         self.ptr = ptr
-        self.removed_keys = removed_keys or []
+        if isinstance(removed_keys, SortedTree):
+            self.removed_tree = removed_keys
+        else:
+            self.removed_tree = SortedTree.from_keys(removed_keys or [])
         self.context: Optional[AbstractContext] = None
 
+    @property
+    def removed_keys(self) -> List[MichelsonType]:
+        return list(self.removed_tree.keys())
+
     def __len__(self):
-        return len(self.items) + len(self.removed_keys)
+        return len(self.tree) + len(self.removed_tree)
 
     def __iter__(self) -> Generator[Tuple[MichelsonType, Optional[MichelsonType]], None, None]:  # type: ignore
-        yield from iter(self.items)
-        for key in self.removed_keys:
+        yield from iter(self.tree)
+        for key in self.removed_tree.keys():
             yield key, None
 
     def __repr__(self):
@@ -209,7 +217,7 @@ class BigMapType(MapType, prim='big_map', args_len=2):
 
     def get(self, key: MichelsonType, dup=True) -> Optional[MichelsonType]:
         self.args[0].assert_type_equal(type(key))
-        val = next((v for k, v in self if k == key), Undefined)  # search in diff
+        val = None if key in self.removed_tree else self.tree.get(key, Undefined)  # search in diff
         if val is Undefined:
             assert self.context, f'context is not attached'
             key_hash = forge_script_expr(key.pack(legacy=True))
@@ -222,22 +230,14 @@ class BigMapType(MapType, prim='big_map', args_len=2):
             return val  # type: ignore
 
     def update(self, key: MichelsonType, val: Optional[MichelsonType]) -> Tuple[Optional[MichelsonType], MichelsonType]:
-        removed_keys = set(self.removed_keys)
         prev_val = self.get(key, dup=False)
-        if prev_val is not None:
-            if val is not None:
-                items = [(k, v if k != key else val) for k, v in self]
-            else:  # remove
-                items = [(k, v) for k, v in self if k != key]
-                removed_keys.add(key)
-        else:
-            if val is not None:
-                items = list(sorted(self.items + [(key, val)], key=lambda x: x[0]))
-                if key in removed_keys:
-                    removed_keys.remove(key)
-            else:  # do nothing
-                items = self.items  # type: ignore
-        res = type(self)(items=items, ptr=self.ptr, removed_keys=list(removed_keys))  # type: ignore
+        if val is not None:
+            items, removed_keys = self.tree.set(key, val), self.removed_tree.remove(key)
+        elif prev_val is not None:  # remove
+            items, removed_keys = self.tree.remove(key), self.removed_tree.set(key, None)
+        else:  # do nothing
+            items, removed_keys = self.tree, self.removed_tree
+        res = type(self)(items=items, ptr=self.ptr, removed_keys=removed_keys)
         res.context = self.context
         return prev_val, res
 
@@ -246,9 +246,9 @@ class BigMapType(MapType, prim='big_map', args_len=2):
         return forge_script_expr(key.pack(legacy=True))
 
     def duplicate(self):
-        res = type(self)(items=deepcopy(self.items),
+        res = type(self)(items=self.tree,  # big_map values are immutable, share them
                          ptr=self.ptr,
-                         removed_keys=deepcopy(self.removed_keys))
+                         removed_keys=self.removed_tree)
         res.context = self.context
         return res
 
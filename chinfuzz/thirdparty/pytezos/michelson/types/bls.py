@@ -1,14 +1,15 @@
-from typing import cast
-
-from py_ecc import optimized_bls12_381 as bls12_381
-from py_ecc.bls.constants import POW_2_382
-from py_ecc.bls.typing import G1Uncompressed, G2Uncompressed
-from py_ecc.fields import optimized_bls12_381_FQ as FQ
-from py_ecc.fields import optimized_bls12_381_FQ2 as FQ2
+from typing import TYPE_CHECKING, cast
 
 from pytezos.michelson.micheline import parse_micheline_literal
 from pytezos.michelson.types.core import BytesType, IntType
 
+if TYPE_CHECKING:
+    from py_ecc.bls.typing import G1Uncompressed, G2Uncompressed
+
+# py_ecc takes a third of a second to import (it precomputes the pairing constants),
+# it is only loaded when a BLS12-381 point is actually computed
+POW_2_382 = 2 ** 382
+
 
 class BLS12_381_FrType(IntType, prim='bls12_381_fr'):
     modulus = 0x73EDA753299D7D483339D80809A1D80553BDA402FFFE5BFEFFFFFFFF00000001
@@ -67,7 +68,9 @@ class BLS12_381_G1Type(BytesType, prim='bls12_381_g1'):
         return cls(value)
 
     @classmethod
-    def from_point(cls, point: G1Uncompressed) -> 'BLS12_381_G1Type':
+    def from_point(cls, point: 'G1Uncompressed') -> 'BLS12_381_G1Type':
+        from py_ecc import optimized_bls12_381 as bls12_381
+
         if bls12_381.is_inf(point):
             x, y = POW_2_382, 0
         else:
@@ -76,11 +79,13 @@ class BLS12_381_G1Type(BytesType, prim='bls12_381_g1'):
         value = x.to_bytes(48, 'big') + y.to_bytes(48, 'big')
         return cls.from_value(value)
 
-    def to_point(self) -> G1Uncompressed:
+    def to_point(self) -> 'G1Uncompressed':
+        from py_ecc.fields import optimized_bls12_381_FQ as FQ
+
         x = int.from_bytes(self.value[:48], 'big')
         y = int.from_bytes(self.value[48:], 'big')
         point = FQ(x), FQ(y), FQ(1)
-        return cast(G1Uncompressed, point)
+        return cast('G1Uncompressed', point)
 
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         assert not comparable, f'{self.prim} is not comparable'
@@ -95,7 +100,9 @@ class BLS12_381_G2Type(BytesType, prim='bls12_381_g2'):
         return cls(value)
 
     @classmethod
-    def from_point(cls, point: G2Uncompressed) -> 'BLS12_381_G2Type':
+    def from_point(cls, point: 'G2Uncompressed') -> 'BLS12_381_G2Type':
+        from py_ecc import optimized_bls12_381 as bls12_381
+
         if bls12_381.is_inf(point):
             x_re, x_im, y_re, y_im = 0, POW_2_382, 0, 0
         else:
@@ -106,13 +113,15 @@ class BLS12_381_G2Type(BytesType, prim='bls12_381_g2'):
             + y_im.to_bytes(48, 'big') + y_re.to_bytes(48, 'big')
         return cls(value)
 
-    def to_point(self) -> G2Uncompressed:
+    def to_point(self) -> 'G2Uncompressed':
+        from py_ecc.fields import optimized_bls12_381_FQ2 as FQ2
+
         x_im = int.from_bytes(self.value[:48], 'big')
         x_re = int.from_bytes(self.value[48:96], 'big')
         y_im = int.from_bytes(self.value[96:144], 'big')
         y_re = int.from_bytes(self.value[144:192], 'big')
         point = FQ2([x_re, x_im]), FQ2([y_re, y_im]), FQ2([1, 0])
-        return cast(G2Uncompressed, point)
+        return cast('G2Uncompressed', point)
 
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         assert not comparable, f'{self.prim} is not comparable'
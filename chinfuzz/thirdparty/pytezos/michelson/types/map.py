@@ -1,7 +1,8 @@
-from typing import Callable, Generator, List, Optional, Tuple, Type
+from typing import Callable, Generator, List, Optional, Tuple, Type, Union
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.micheline import Micheline, MichelineSequence, parse_micheline_value
+from pytezos.michelson.tree import SortedTree
 from pytezos.michelson.types.base import MichelsonType
 
 
@@ -11,19 +12,23 @@ class EltLiteral(Micheline, prim='Elt', args_len=2):
 
 class MapType(MichelsonType, prim='map', args_len=2):
 
-    def __init__(self, items: List[Tuple[MichelsonType, MichelsonType]]):
+    def __init__(self, items: Union[List[Tuple[MichelsonType, MichelsonType]], SortedTree]):
         super(MapType, self).__init__()
-        self.items = items
+        self.tree = items if isinstance(items, SortedTree) else SortedTree.from_items(items)
+
+    @property
+    def items(self) -> List[Tuple[MichelsonType, MichelsonType]]:
+        return list(self.tree)
 
     def __repr__(self):
         elements = [f'{repr(k)}: {repr(v)}' for k, v in self.items]
         return f'{{{", ".join(elements)}}}'
 
     def __len__(self):
-        return len(self.items)
+        return len(self.tree)
 
     def __iter__(self) -> Generator[Tuple[MichelsonType, MichelsonType], None, None]:
-        yield from iter(self.items)
+        yield from iter(self.tree)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, MapType):
@@ -49,6 +54,8 @@ class MapType(MichelsonType, prim='map', args_len=2):
     @classmethod
     def check_constraints(cls, items: List[Tuple[MichelsonType, MichelsonType]]):
         keys = list(map(lambda x: x[0], items))
+        if all(a < b for a, b in zip(keys, keys[1:])):
+            return
         assert len(set(keys)) == len(keys), f'duplicate keys found'
         assert keys == list(sorted(keys)), f'keys are unsorted'
 
@@ -141,24 +148,20 @@ class MapType(MichelsonType, prim='map', args_len=2):
         self.args[0].assert_type_equal(type(key))
         if dup:
             assert self.args[1].is_duplicable(), f'use GET_AND_UPDATE instead'
-        return next((v for k, v in self.items if k == key), None)
+        return self.tree.get(key)
 
     def contains(self, key: MichelsonType):
         return self.get(key, dup=False) is not None
 
     def update(self, key: MichelsonType, val: Optional[MichelsonType]) -> Tuple[Optional[MichelsonType], MichelsonType]:
         prev_val = self.get(key, dup=False)
-        if prev_val is not None:
-            if val is not None:
-                items = [(k, v if k != key else val) for k, v in self.items]
-            else:  # remove
-                items = [(k, v) for k, v in self.items if k != key]
-        else:
-            if val is not None:
-                items = list(sorted(self.items + [(key, val)], key=lambda x: x[0]))
-            else:  # do nothing
-                items = self.items
-        return prev_val, type(self)(items)
+        if val is not None:
+            tree = self.tree.set(key, val)
+        elif prev_val is not None:  # remove
+            tree = self.tree.remove(key)
+        else:  # do nothing
+            tree = self.tree
+        return prev_val, type(self)(tree)
 
     def __contains__(self, key_obj):
         key = self.args[0].from_python_object(key_obj)
@@ -1,7 +1,7 @@
 from typing import Generator, List, Optional, Tuple, Type, Union, cast
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
-from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.micheline import Micheline, is_traced
 from pytezos.michelson.types.adt import ADTMixin, Nested, wrap_pair
 from pytezos.michelson.types.base import MichelsonType
 
@@ -26,9 +26,11 @@ class PairType(MichelsonType, ADTMixin, prim='pair', args_len=None):
 
     def __lt__(self, other: 'PairType'):  # type: ignore
         for i, item in enumerate(self.items):
-            if item > other.items[i]:
+            if item < other.items[i]:
+                return True
+            if other.items[i] < item:
                 return False
-        return True
+        return False
 
     def __hash__(self):
         return hash(self.items)
@@ -132,6 +134,8 @@ class PairType(MichelsonType, ADTMixin, prim='pair', args_len=None):
             try:
                 return cls.from_python_object(wrap_pair(py_obj))
             except KeyError as e:
+                if is_traced(e):
+                    raise
                 if not isinstance(path_to_key, dict):
                     path_to_key = {v: f'{k}th' for k, v in idx_to_path.items()}
                 field = path_to_key.get(e.args[0], 'some')
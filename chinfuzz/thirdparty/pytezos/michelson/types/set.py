@@ -1,25 +1,30 @@
 from copy import copy
-from typing import Generator, List, Type
+from typing import Generator, List, Type, Union
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.micheline import Micheline, MichelineSequence
+from pytezos.michelson.tree import SortedTree
 from pytezos.michelson.types.base import MichelsonType
 
 
 class SetType(MichelsonType, prim='set', args_len=1):
 
-    def __init__(self, items: List[MichelsonType]):
+    def __init__(self, items: Union[List[MichelsonType], SortedTree]):
         super(SetType, self).__init__()
-        self.items = items
+        self.tree = items if isinstance(items, SortedTree) else SortedTree.from_keys(items)
+
+    @property
+    def items(self) -> List[MichelsonType]:
+        return list(self.tree.keys())
 
     def __repr__(self):
         return f'{{{", ".join(map(repr, self.items))}}}'
 
     def __len__(self):
-        return len(self.items)
+        return len(self.tree)
 
     def __iter__(self) -> Generator[MichelsonType, None, None]:
-        yield from iter(self.items)
+        yield from self.tree.keys()
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, SetType):
@@ -43,6 +48,8 @@ class SetType(MichelsonType, prim='set', args_len=1):
 
     @classmethod
     def check_constraints(cls, items: List[MichelsonType]):
+        if all(a < b for a, b in zip(items, items[1:])):
+            return
         assert len(set(items)) == len(items), f'duplicate elements found'
         assert items == list(sorted(items)), f'set elements are not sorted'
 
@@ -91,19 +98,17 @@ class SetType(MichelsonType, prim='set', args_len=1):
 
     def contains(self, item: MichelsonType) -> bool:
         self.args[0].assert_type_equal(type(item))
-        return item in self.items
+        return item in self.tree
 
     def add(self, item: MichelsonType) -> 'SetType':
         if self.contains(item):
             return copy(self)
         else:
-            items = [item] + self.items
-            return type(self)(list(sorted(items)))
+            return type(self)(self.tree.set(item, None))
 
     def remove(self, item: MichelsonType) -> 'SetType':
         if self.contains(item):
-            items = list(filter(lambda x: x != item, self.items))
-            return type(self)(items)
+            return type(self)(self.tree.remove(item))
         else:
             return copy(self)
 
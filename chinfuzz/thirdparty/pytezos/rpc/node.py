@@ -1,13 +1,14 @@
 import json
 from pprint import pformat
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-import requests
-import requests.exceptions
 from simplejson import JSONDecodeError
 
 from pytezos.logging import logger
 
+if TYPE_CHECKING:
+    import requests
+
 
 def _urljoin(*args: str) -> str:
     return "/".join(map(lambda x: str(x).strip('/'), args))
@@ -50,7 +51,7 @@ class RpcError(Exception):
         return RpcError(error)
 
     @classmethod
-    def from_response(cls, res: requests.Response) -> 'RpcError':
+    def from_response(cls, res: 'requests.Response') -> 'RpcError':
         """Create RpcError from requests Response."""
         if res.headers.get('content-type') == 'application/json':
             try:
@@ -85,7 +86,7 @@ class RpcNode:
         ]
         return '\n'.join(res)
 
-    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+    def request(self, method: str, path: str, **kwargs) -> 'requests.Response':
         """Perform HTTP request to node.
 
         :param method: one of GET/POST/PUT/DELETE
@@ -94,6 +95,8 @@ class RpcNode:
         :raises RpcError: node has returned an error
         :returns: node response
         """
+        import requests  # slow to import, a local interpreter never reaches a node
+
         logger.debug('>>>>> %s %s\n%s', method, path, json.dumps(kwargs, indent=4))
         res = requests.request(
             method=method,
@@ -117,20 +120,20 @@ class RpcNode:
         logger.debug('<<<<< %s\n%s', res.status_code, json.dumps(res.json(), indent=4))
         return res
 
-    def get(self, path: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> requests.Response:
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> 'requests.Response':
         return self.request('GET', path, params=params, timeout=timeout).json()
 
-    def post(self, path: str, params: Optional[Dict[str, Any]] = None, json=None) -> Union[requests.Response, str]:
+    def post(self, path: str, params: Optional[Dict[str, Any]] = None, json=None) -> Union['requests.Response', str]:
         response = self.request('POST', path, params=params, json=json)
         try:
             return response.json()
         except JSONDecodeError:
             return response.text
 
-    def delete(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def delete(self, path: str, params: Optional[Dict[str, Any]] = None) -> 'requests.Response':
         return self.request('DELETE', path, params=params).json()
 
-    def put(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def put(self, path: str, params: Optional[Dict[str, Any]] = None) -> 'requests.Response':
         return self.request('PUT', path, params=params).json()
 
 
@@ -150,7 +153,7 @@ class RpcMultiNode(RpcNode):
         ]
         return '\n'.join(res)
 
-    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+    def request(self, method: str, path: str, **kwargs) -> 'requests.Response':
         assert self._next_i < len(self.nodes)
         res = self.nodes[self._next_i].request(method, path, **kwargs)
         self._next_i = (self._next_i + 1) % len(self.nodes)
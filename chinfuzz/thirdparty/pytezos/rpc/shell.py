@@ -2,9 +2,8 @@ from binascii import hexlify
 from datetime import datetime
 from functools import lru_cache
 from time import sleep
-from typing import Any, Dict, Generator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional
 
-import requests
 import simplejson as json
 from deprecation import deprecated  # type: ignore
 
@@ -17,6 +16,9 @@ from pytezos.rpc.protocol import BlockQuery, BlocksQuery
 from pytezos.rpc.query import RpcQuery
 from pytezos.rpc.search import CyclesQuery, VotingPeriodsQuery
 
+if TYPE_CHECKING:
+    import requests
+
 MAX_BLOCK_TIMEOUT = 86400
 
 
@@ -449,7 +451,7 @@ class ProtocolInjectionQuery(RpcQuery, path='/injection/protocol'):
 
 
 class ResponseGenerator:
-    def __init__(self, res: requests.Response):
+    def __init__(self, res: 'requests.Response'):
         self._lines = res.iter_lines()
 
     def __iter__(self):
@@ -47,10 +47,12 @@ setup(
     # },
     packages=setuptools.find_packages(),
     package_dir={
-        "chinfuzz.resources.fuzz": "chinfuzz.resources.fuzz"
+        "chinfuzz.resources.fuzz": "chinfuzz.resources.fuzz",
+        "chinfuzz.resources.benchmark": "chinfuzz.resources.benchmark",
     },
     package_data={
         "chinfuzz.resources.fuzz": ["*"],
+        "chinfuzz.resources.benchmark": ["*"],
     },
     include_package_data=True,
     long_description=long_description,
@@ -0,0 +1,133 @@
+import glob
+import os
+import random
+import unittest
+
+from chinfuzz import thirdparty  # noqa: F401, puts the vendored pytezos first on sys.path
+
+from pytezos.michelson.format import micheline_to_michelson
+from pytezos.michelson.parse import (
+    FastMichelsonParser,
+    MichelsonParser,
+    MichelsonParserError,
+    PlyMichelsonParser,
+)
+
+benchmarkPath = os.path.join(os.path.dirname(__file__), "..", "chinfuzz", "resources", "benchmark")
+
+primitives = ["UNIT", "DROP", "DUP", "SWAP", "PAIR", "CAR", "CDR", "ADD", "NIL", "CONS", "SOME", "NONE",
+              "PUSH", "IF", "IF_LEFT", "LOOP", "ITER", "MAP", "DIP", "nat", "int", "string", "bytes",
+              "pair", "or", "list", "map", "option", "Pair", "Left", "Some", "None", "Elt",
+              "UNPAIR", "DUUP", "CADR", "SET_CAR", "IF_SOME", "ASSERT_EQ", "CMPLT", "DIIP", "PAPAIR"]
+annotations = ["%a", ":t", "@v", "%", "%x.y"]
+atoms = ["0", "-7", "0x", "0xAB01", '""', '"a\\"b"', '"\\u00e9"']
+noise = [" ", "\n", "\t", " # comment\n", " /* block */ "]
+
+
+def tagged(expr):
+    """ Micheline expression with the container types, Sequence and list differ """
+    if isinstance(expr, list):
+        return [type(expr).__name__] + [tagged(item) for item in expr]
+    if isinstance(expr, dict):
+        return {key: tagged(value) for key, value in expr.items()}
+    return expr
+
+
+def generateExpression(rnd, depth):
+    if depth <= 0 or rnd.random() < 0.3:
+        return rnd.choice(atoms + primitives)
+    choice = rnd.random()
+    if choice < 0.3:
+        items = [generateExpression(rnd, depth - 1) for _ in range(rnd.randrange(4))]
+        return "{ " + " ; ".join(items) + " }"
+    prim = rnd.choice(primitives)
+    annots = " ".join(rnd.choice(annotations) for _ in range(rnd.randrange(3)))
+    args = []
+    for _ in range(rnd.randrange(3)):
+        arg = generateExpression(rnd, depth - 1)
+        args.append(f"({arg})" if rnd.random() < 0.3 and arg[0].isalpha() else arg)
+    return " ".join(filter(None, [prim, annots] + args))
+
+
+def generateSource(rnd):
+    source = " ; ".join(generateExpression(rnd, 4) for _ in range(rnd.randrange(1, 5)))
+    return "".join(token + (rnd.choice(noise) if rnd.random() < 0.1 else "") for token in source.split(" "))
+
+
+def mutate(rnd, source):
+    position = rnd.randrange(len(source) + 1)
+    action = rnd.randrange(3)
+    if action == 0:
+        return source[:position] + source[position + 1:]
+    if action == 1:
+        return source[:position] + rnd.choice("{}();\"#:%@0xAZ ") + source[position:]
+    return source[:position] + source[position:][::-1]
+
+
+class MichelsonParserBackendsTest(unittest.TestCase):
+    """ The fast parser is opt-in: its results and errors must stay those of the ply parser """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fast = FastMichelsonParser()
+        cls.ply = PlyMichelsonParser()
+
+    def parse(self, parser, source):
+        try:
+            return "ok", tagged(parser.parse(source))
+        except MichelsonParserError as e:
+            return "error", (e.message, e.line, e.pos)
+        except Exception as e:
+            return "exception", type(e).__name__
+
+    def assertSameResult(self, source):
+        fast = self.parse(self.fast, source)
+        ply = self.parse(self.ply, source)
+        if ply[0] == "exception" and ply[1] == "AttributeError":
+            # ply calls p_error(None) at the end of the source, the fast parser reports it
+            self.assertEqual(fast[0], "error", source)
+            self.assertEqual(fast[1][0], "unexpected end of expression", source)
+        else:
+            self.assertEqual(fast, ply, source)
+
+    def test_backends(self):
+        default = MichelsonParser()
+        self.assertIsInstance(default, PlyMichelsonParser)
+        self.assertTrue(hasattr(default, "lexer") and hasattr(default, "parser"))
+        fast = MichelsonParser(backend="fast", extra_primitives=["FOO"])
+        self.assertIs(type(fast), FastMichelsonParser)
+        self.assertEqual(fast.parse("FOO"), {'prim': 'FOO'})
+        with self.assertRaises(ValueError):
+            MichelsonParser(backend="unknown")
+
+    def test_subclasses_keep_the_ply_grammar(self):
+        class IntAsStringParser(MichelsonParser):
+            def p_arg_int(self, p):
+                '''arg : INT'''
+                p[0] = {'string': p[1]}
+
+        parser = IntAsStringParser()
+        self.assertIs(type(parser), IntAsStringParser)
+        self.assertEqual(parser.parse("PUSH nat 1"), {'prim': 'PUSH', 'args': [{'prim': 'nat'}, {'string': '1'}]})
+
+    def test_benchmark_contracts(self):
+        paths = sorted(glob.glob(os.path.join(benchmarkPath, "*.tz")))
+        self.assertTrue(paths)
+        for path in paths:
+            with open(path) as f:
+                source = f.read()
+            self.assertSameResult(source)
+            self.assertSameResult(micheline_to_michelson(self.ply.parse(source)))
+
+    def test_generated_and_mutated_sources(self):
+        rnd = random.Random(0)
+        for _ in range(1000):
+            source = generateSource(rnd)
+            self.assertSameResult(source)
+            for _ in range(3):
+                source = mutate(rnd, source)
+                self.assertSameResult(source)
+
+
+if __name__ == "__main__":
+    unittest.main()